@@ -4,10 +4,315 @@ AI 深度评分模块 - 基于大模型的智能评分
 支持 OpenRouter API，可访问多种模型
 """
 
+import hashlib
 import json
+import os
 import requests
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, Optional, Tuple
+import threading
 import time
+import unicodedata
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class RateLimiter:
+    """
+    请求速率限制器（线程安全）
+    保证相邻两次请求的发出时间至少间隔 1 / rate 秒
+    """
+    
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: 每秒最多发出的请求数，<= 0 表示不限速
+        """
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._base_interval = self.interval
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """阻塞到允许发出下一次请求"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+    
+    def throttle(self, delay: float):
+        """
+        服务端限流（429）：delay 秒内不再发出请求，并把请求间隔放慢 25%
+        （最多放慢到初始间隔的 4 倍）
+        
+        Args:
+            delay: 服务端要求的等待秒数
+        """
+        with self._lock:
+            self._next_time = max(self._next_time, time.monotonic() + delay)
+            if self.interval > 0:
+                self.interval = min(self.interval * 1.25, self._base_interval * 4)
+
+
+class ScoreCache:
+    """
+    AI 评分持久化缓存
+    
+    存储为追加写入的 JSONL 文件，启动时载入内存索引：
+    - 键：规范化标题 + 评分 Prompt 与模型的哈希，Prompt 或模型变化后旧结果自动失效
+    - 过期：超过 ttl_days 的记录视为未命中
+    - 容量：超过 max_entries 时淘汰最久未使用的记录（LRU）
+    - 文件中失效的行在 close() 时压缩重写
+    """
+    
+    def __init__(self, cache_file: str, ttl_days: float = 7, max_entries: int = 50000):
+        """
+        Args:
+            cache_file: 缓存文件路径（JSONL）
+            ttl_days: 记录有效期（天），<= 0 表示永不过期
+            max_entries: 内存索引最多保留的记录数
+        """
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl_days * 86400 if ttl_days and ttl_days > 0 else 0
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._file_lines = 0
+        self._lock = threading.Lock()
+        self._load()
+    
+    @staticmethod
+    def make_key(title: str, namespace: str) -> str:
+        """生成缓存键：全半角、大小写和空白差异不影响命中"""
+        normalized = ' '.join(unicodedata.normalize('NFKC', str(title)).lower().split())
+        return f"{namespace}:{normalized}"
+    
+    def _expired(self, timestamp: float, now: float) -> bool:
+        return bool(self.ttl) and now - timestamp > self.ttl
+    
+    def _load(self):
+        """读取缓存文件，后写入的记录覆盖先写入的"""
+        if not self.cache_file.exists():
+            return
+        now = time.time()
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._file_lines += 1
+                    try:
+                        record = json.loads(line)
+                        key, timestamp, value = record['k'], record['t'], record['v']
+                    except (ValueError, KeyError, TypeError):
+                        # 跳过写入中断等原因产生的残缺行
+                        continue
+                    if self._expired(timestamp, now):
+                        continue
+                    self._entries.pop(key, None)
+                    self._entries[key] = (timestamp, value)
+        except OSError as e:
+            print(f"⚠️  读取评分缓存失败 {self.cache_file}: {e}")
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def get(self, title: str, namespace: str) -> Optional[Dict]:
+        """查询缓存，命中时返回评分数据的副本"""
+        key = self.make_key(title, namespace)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0], time.time()):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[1])
+    
+    def put(self, title: str, namespace: str, score_data: Dict):
+        """写入缓存并追加到文件"""
+        key = self.make_key(title, namespace)
+        timestamp = time.time()
+        line = json.dumps({'k': key, 't': timestamp, 'v': score_data},
+                          ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (timestamp, dict(score_data))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.cache_file, 'a', encoding='utf-8') as f:
+                    f.write(line + '\n')
+                self._file_lines += 1
+            except OSError as e:
+                print(f"⚠️  写入评分缓存失败 {self.cache_file}: {e}")
+    
+    def close(self):
+        """文件中失效行（被覆盖、过期、被淘汰）超过一半时重写文件"""
+        with self._lock:
+            if self._file_lines <= 2 * len(self._entries) + 100:
+                return
+            temp_file = self.cache_file.with_suffix('.tmp')
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    for key, (timestamp, value) in self._entries.items():
+                        f.write(json.dumps({'k': key, 't': timestamp, 'v': value},
+                                           ensure_ascii=False, separators=(',', ':')) + '\n')
+                os.replace(temp_file, self.cache_file)
+                self._file_lines = len(self._entries)
+            except OSError as e:
+                print(f"⚠️  压缩评分缓存失败 {self.cache_file}: {e}")
+    
+    def stats_text(self) -> str:
+        """命中统计"""
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0
+        return f"缓存命中 {self.hits}/{total}（{rate:.0f}%），缓存记录 {len(self._entries)} 条"
+
+
+class UsageTracker:
+    """
+    Token 用量统计与预算控制（线程安全）
+    
+    - 每次 API 调用记录响应中 usage 字段的 tokens 数和请求耗时
+    - 单次运行预算与每日预算（每日用量记录在 usage_file，跨运行累计）
+    - 预算用完后 exhausted() 返回 True，评分器不再发出新请求；
+      并发时已发出的请求仍会完成，实际用量可能略超预算
+    """
+    
+    def __init__(self, max_tokens_per_run: int = 0, max_tokens_per_day: int = 0,
+                 usage_file: Optional[str] = None, prompt_price: float = 0.0,
+                 completion_price: float = 0.0):
+        """
+        Args:
+            max_tokens_per_run: 单次运行 tokens 上限，<= 0 表示不限
+            max_tokens_per_day: 每日 tokens 上限，<= 0 表示不限
+            usage_file: 每日用量记录文件（JSON），None 时每日预算只统计本次运行
+            prompt_price: 输入单价（美元 / 1M tokens），用于估算成本
+            completion_price: 输出单价（美元 / 1M tokens）
+        """
+        self.max_tokens_per_run = max_tokens_per_run or 0
+        self.max_tokens_per_day = max_tokens_per_day or 0
+        self.usage_file = Path(usage_file) if usage_file else None
+        self.prompt_price = prompt_price or 0.0
+        self.completion_price = completion_price or 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.calls = 0
+        self.titles = 0
+        self.latencies = []
+        self.today = time.strftime('%Y-%m-%d')
+        self._history = {}
+        self._day_base = 0
+        self._warned = False
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """读取每日用量记录，今天之前的用量计入每日预算"""
+        if self.usage_file is None or not self.usage_file.exists():
+            return
+        try:
+            with open(self.usage_file, 'r', encoding='utf-8') as f:
+                self._history = json.load(f)
+            today = self._history.get(self.today, {})
+            self._day_base = today.get('prompt_tokens', 0) + today.get('completion_tokens', 0)
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"⚠️  读取用量记录失败 {self.usage_file}: {e}")
+            self._history = {}
+    
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+    
+    def record(self, usage: Optional[Dict], latency: float):
+        """记录一次 API 调用的 tokens 用量和耗时"""
+        usage = usage or {}
+        with self._lock:
+            self.calls += 1
+            self.prompt_tokens += int(usage.get('prompt_tokens') or 0)
+            self.completion_tokens += int(usage.get('completion_tokens') or 0)
+            self.latencies.append(latency)
+    
+    def add_titles(self, count: int):
+        """记录通过 API 成功评分的标题数"""
+        with self._lock:
+            self.titles += count
+    
+    def exhausted(self) -> bool:
+        """预算是否已用完，首次用完时打印提示"""
+        with self._lock:
+            reason = None
+            if self.max_tokens_per_run > 0 and self.total_tokens >= self.max_tokens_per_run:
+                reason = f"单次运行预算 {self.max_tokens_per_run} tokens"
+            elif self.max_tokens_per_day > 0 and self._day_base + self.total_tokens >= self.max_tokens_per_day:
+                reason = f"每日预算 {self.max_tokens_per_day} tokens"
+            if reason and not self._warned:
+                self._warned = True
+                print(f"  ⚠️  已用完{reason}，剩余标题不再调用 AI")
+            return reason is not None
+    
+    def cost(self, prompt_tokens: float, completion_tokens: float) -> float:
+        """按单价估算成本（美元）"""
+        return (prompt_tokens * self.prompt_price + completion_tokens * self.completion_price) / 1e6
+    
+    def percentile(self, p: float) -> float:
+        """请求耗时的 p 分位数（秒，最近秩法）"""
+        with self._lock:
+            latencies = sorted(self.latencies)
+        if not latencies:
+            return 0.0
+        rank = max(1, min(len(latencies), int(-(-p * len(latencies) // 100))))
+        return latencies[rank - 1]
+    
+    def summary_lines(self, cache_hits: int = 0) -> list:
+        """
+        用量汇总：tokens、每条标题平均 tokens、成本、缓存节省和请求耗时分位数
+        
+        Args:
+            cache_hits: 命中缓存的标题数，按每条平均 tokens 估算节省
+        """
+        lines = [
+            f"API 调用 {self.calls} 次，tokens {self.total_tokens}"
+            f"（输入 {self.prompt_tokens} / 输出 {self.completion_tokens}），"
+            f"估算成本 ${self.cost(self.prompt_tokens, self.completion_tokens):.4f}"
+        ]
+        if self.titles:
+            per_title = self.total_tokens / self.titles
+            lines.append(f"AI 评分 {self.titles} 条，平均每条 {per_title:.0f} tokens")
+            if cache_hits:
+                saved_prompt = self.prompt_tokens / self.titles * cache_hits
+                saved_completion = self.completion_tokens / self.titles * cache_hits
+                lines.append(f"缓存命中 {cache_hits} 条，约节省 {saved_prompt + saved_completion:.0f} tokens"
+                             f"（${self.cost(saved_prompt, saved_completion):.4f}）")
+        if self.latencies:
+            lines.append(f"请求耗时 p50 {self.percentile(50):.2f}s / p90 {self.percentile(90):.2f}s"
+                         f" / p99 {self.percentile(99):.2f}s")
+        if self.max_tokens_per_day > 0:
+            lines.append(f"今日已用 {self._day_base + self.total_tokens}/{self.max_tokens_per_day} tokens")
+        return lines
+    
+    def save(self):
+        """把今天的累计用量（之前的记录 + 本次运行）写入用量记录，只保留最近 30 天"""
+        if self.usage_file is None or not self.calls:
+            return
+        with self._lock:
+            today = dict(self._history.get(self.today, {}))
+            today['prompt_tokens'] = today.get('prompt_tokens', 0) + self.prompt_tokens
+            today['completion_tokens'] = today.get('completion_tokens', 0) + self.completion_tokens
+            today['calls'] = today.get('calls', 0) + self.calls
+            history = dict(self._history, **{self.today: today})
+            history = {day: history[day] for day in sorted(history)[-30:]}
+        try:
+            self.usage_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.usage_file, 'w', encoding='utf-8') as f:
+                json.dump(history, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"⚠️  写入用量记录失败 {self.usage_file}: {e}")
 
 
 class AINewsScorer:
@@ -16,7 +321,8 @@ class AINewsScorer:
     基于大模型的语义理解进行智能评分
     """
     
-    def __init__(self, api_key: str, model: str = "openai/gpt-4o-mini", base_url: str = "https://openrouter.ai/api/v1"):
+    def __init__(self, api_key: str, model: str = "openai/gpt-4o-mini", base_url: str = "https://openrouter.ai/api/v1",
+                 cache: Optional[ScoreCache] = None, usage: Optional[UsageTracker] = None):
         """
         初始化 AI 评分器
         
@@ -27,11 +333,21 @@ class AINewsScorer:
                    - anthropic/claude-3.5-sonnet (最准确)
                    - meta-llama/llama-3.1-8b-instruct:free (免费)
             base_url: API 地址
+            cache: 评分缓存，批量评分时命中缓存的标题不再调用 API
+            usage: Token 用量统计与预算，预算用完后不再调用 API
         """
         self.api_key = api_key
         self.model = model
         self.base_url = base_url
         self.timeout = 30
+        # 429 / 5xx 的重试次数与退避基数（秒）：优先按 Retry-After 等待，
+        # 否则第 n 次重试前等待 retry_backoff * 2^(n-1) 秒
+        self.max_retries = 3
+        self.retry_backoff = 1.0
+        self.cache = cache
+        self.usage = usage if usage is not None else UsageTracker()
+        self.failed_titles = []
+        self.skipped_titles = []
         
         # 评分 Prompt 模板
         self.scoring_prompt = """你是小额贷款广告专家，需要评估新闻是否适合用于抖音口播号的贷款广告脚本。
@@ -83,96 +399,62 @@ class AINewsScorer:
     "target_audience": "<目标受众描述，20字以内>",
     "emotion": "<positive或negative或neutral>"
 }}"""
+        
+        # 批量评分：评分标准只出现一次，后接编号的标题列表，要求输出 JSON 数组
+        self.batch_item_tokens = 400
+        self.batch_prompt = self.scoring_prompt.split('【新闻标题】')[0] + """【新闻标题列表】
+共 {count} 条，每行一条，行首为编号：
+{titles}
+
+【输出格式】
+请对每条新闻分别评分，严格按照以下JSON数组格式输出，数组中每个元素对应一条新闻，
+"index" 为该新闻的编号，不要遗漏任何一条，不要有任何其他文字：
+[
+    {{
+        "index": <新闻编号>,
+        "audience_score": <0-10的整数>,
+        "interest_score": <0-10的整数>,
+        "simplicity_score": <0-10的整数>,
+        "total_score": <0-30的整数>,
+        "reason": "<100字以内的评分理由，说明为什么这样打分>",
+        "ad_direction": "<30字以内的广告引子建议>",
+        "target_audience": "<目标受众描述，20字以内>",
+        "emotion": "<positive或negative或neutral>"
+    }}
+]"""
+    
+    @property
+    def cache_namespace(self) -> str:
+        """评分缓存的命名空间：评分 Prompt 或模型变化后缓存自动失效"""
+        digest = hashlib.sha1(f"{self.model}\n{self.scoring_prompt}".encode('utf-8'))
+        return digest.hexdigest()[:16]
     
-    def score_news(self, title: str, verbose: bool = False) -> Optional[Dict]:
+    def score_news(self, title: str, verbose: bool = False,
+                   limiter: Optional[RateLimiter] = None) -> Optional[Dict]:
         """
         对单条新闻进行 AI 评分
         
         Args:
             title: 新闻标题
             verbose: 是否显示详细信息
+            limiter: 批量评分时的限速器，遇到 429 时用于放慢后续请求
             
         Returns:
             评分结果字典，失败返回 None
         """
+        content = None
         try:
             # 构建请求
             prompt = self.scoring_prompt.format(title=title)
             
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.3,  # 降低温度以获得更稳定的输出
-                "max_tokens": 500
-            }
-            
-            if verbose:
-                print(f"  🤖 调用 AI 模型: {self.model}")
-            
-            # 发送请求
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=self.timeout
-            )
-            
-            if response.status_code != 200:
-                print(f"  ❌ API 请求失败: {response.status_code}")
-                if verbose:
-                    print(f"  错误信息: {response.text}")
+            content = self._request_completion(prompt, 500, verbose, limiter)
+            if content is None:
                 return None
             
-            # 解析响应
-            result = response.json()
-            content = result['choices'][0]['message']['content'].strip()
-            
-            # 尝试提取 JSON（有些模型可能在 JSON 前后加文字）
-            if '```json' in content:
-                # 提取 JSON 代码块
-                json_str = content.split('```json')[1].split('```')[0].strip()
-            elif '```' in content:
-                json_str = content.split('```')[1].split('```')[0].strip()
-            else:
-                json_str = content
-            
             # 解析 JSON
-            score_data = json.loads(json_str)
-            
-            # 验证数据完整性
-            required_fields = ['audience_score', 'interest_score', 'simplicity_score', 
-                             'total_score', 'reason', 'ad_direction']
-            for field in required_fields:
-                if field not in score_data:
-                    print(f"  ⚠️  缺少字段: {field}")
-                    return None
-            
-            # 验证分数范围
-            if not (0 <= score_data['audience_score'] <= 10):
-                score_data['audience_score'] = max(0, min(10, score_data['audience_score']))
-            if not (0 <= score_data['interest_score'] <= 10):
-                score_data['interest_score'] = max(0, min(10, score_data['interest_score']))
-            if not (0 <= score_data['simplicity_score'] <= 10):
-                score_data['simplicity_score'] = max(0, min(10, score_data['simplicity_score']))
-            
-            # 重新计算总分（防止模型计算错误）
-            score_data['total_score'] = (
-                score_data['audience_score'] + 
-                score_data['interest_score'] + 
-                score_data['simplicity_score']
-            )
+            score_data = json.loads(self._extract_json(content))
             
-            return score_data
+            return self._normalize_score(score_data, report=True)
             
         except json.JSONDecodeError as e:
             print(f"  ❌ JSON 解析失败: {e}")
@@ -192,7 +474,212 @@ class AINewsScorer:
                 traceback.print_exc()
             return None
     
-    def batch_score_news(self, titles: list, verbose: bool = False, delay: float = 0.5) -> list:
+    def score_news_batch(self, titles: list, verbose: bool = False,
+                         limiter: Optional[RateLimiter] = None) -> list:
+        """
+        一次请求对多条新闻进行 AI 评分
+        
+        评分标准只在请求中出现一次，模型按编号输出 JSON 数组。
+        每个元素单独校验（编号、字段、分数类型），不合格或缺失的
+        条目在结果中为 None，由调用方决定是否逐条重试。
+        
+        Args:
+            titles: 新闻标题列表
+            verbose: 是否显示详细信息
+            limiter: 批量评分时的限速器，遇到 429 时用于放慢后续请求
+            
+        Returns:
+            与 titles 一一对应的评分结果列表，失败的条目为 None
+        """
+        scores = [None] * len(titles)
+        if not titles:
+            return scores
+        
+        content = None
+        try:
+            title_lines = '\n'.join(
+                f"{i}. {' '.join(str(title).split())}"
+                for i, title in enumerate(titles, 1)
+            )
+            prompt = self.batch_prompt.format(count=len(titles), titles=title_lines)
+            
+            max_tokens = self.batch_item_tokens * len(titles) + 100
+            content = self._request_completion(prompt, max_tokens, verbose, limiter)
+            if content is None:
+                return scores
+            
+            items = json.loads(self._extract_json(content))
+        except json.JSONDecodeError as e:
+            print(f"  ❌ 批量结果 JSON 解析失败: {e}")
+            if verbose:
+                print(f"  原始内容: {content}")
+            return scores
+        except requests.exceptions.Timeout:
+            print(f"  ❌ 请求超时（>{self.timeout}秒）")
+            return scores
+        except requests.exceptions.RequestException as e:
+            print(f"  ❌ 网络请求失败: {e}")
+            return scores
+        except Exception as e:
+            print(f"  ❌ 未知错误: {e}")
+            return scores
+        
+        if isinstance(items, dict):
+            # 兼容模型把数组包在对象里的情况，如 {"results": [...]}
+            items = next((v for v in items.values() if isinstance(v, list)), [])
+        if not isinstance(items, list):
+            print(f"  ⚠️  批量结果不是 JSON 数组")
+            return scores
+        
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index = item.get('index')
+            # 编号从 1 开始，重复或越界的编号整条丢弃
+            if not isinstance(index, int) or isinstance(index, bool):
+                continue
+            if not (1 <= index <= len(titles)) or scores[index - 1] is not None:
+                continue
+            scores[index - 1] = self._normalize_score(item)
+        
+        return scores
+    
+    def _request_completion(self, prompt: str, max_tokens: int, verbose: bool,
+                            limiter: Optional[RateLimiter] = None) -> Optional[str]:
+        """
+        调用 chat completions 接口，返回模型输出的文本
+        
+        429 与 5xx 最多重试 max_retries 次，等待时间优先取 Retry-After，
+        否则指数退避；传入 limiter（批量评分）时 429 同时反馈给限速器，放慢后续请求。
+        限速器随调用传递而不是保存在实例上，同一评分器上并发的多次批量评分互不影响。
+        重试用尽、其他非 200 状态码或 Token 预算已用完时返回 None，网络异常向上抛出
+        """
+        if self.usage.exhausted():
+            return None
+        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        data = {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "temperature": 0.3,  # 降低温度以获得更稳定的输出
+            "max_tokens": max_tokens
+        }
+        
+        if verbose:
+            print(f"  🤖 调用 AI 模型: {self.model}")
+        
+        for attempt in range(self.max_retries + 1):
+            # 发送请求
+            start = time.monotonic()
+            response = requests.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=data,
+                timeout=self.timeout
+            )
+            latency = time.monotonic() - start
+            
+            retryable = response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt >= self.max_retries:
+                break
+            
+            self.usage.record(None, latency)
+            if self.usage.exhausted():
+                return None
+            delay = self._retry_delay(response, attempt)
+            if verbose:
+                print(f"  ⏳ API 返回 {response.status_code}，{delay:.1f} 秒后重试"
+                      f"（{attempt + 1}/{self.max_retries}）")
+            if response.status_code == 429 and limiter is not None:
+                limiter.throttle(delay)
+                limiter.acquire()
+            else:
+                time.sleep(delay)
+        
+        if response.status_code != 200:
+            self.usage.record(None, latency)
+            print(f"  ❌ API 请求失败: {response.status_code}")
+            if verbose:
+                print(f"  错误信息: {response.text}")
+            return None
+        
+        # 解析响应，记录 usage 字段中的 tokens 用量
+        result = response.json()
+        self.usage.record(result.get('usage'), latency)
+        return result['choices'][0]['message']['content'].strip()
+    
+    def _retry_delay(self, response, attempt: int) -> float:
+        """重试前的等待秒数：优先取 Retry-After（秒数格式，最多 60 秒），否则指数退避"""
+        try:
+            retry_after = float(response.headers.get('Retry-After'))
+        except (TypeError, ValueError):
+            retry_after = None
+        if retry_after is not None and retry_after >= 0:
+            return min(retry_after, 60.0)
+        return self.retry_backoff * 2 ** attempt
+    
+    @staticmethod
+    def _extract_json(content: str) -> str:
+        """尝试提取 JSON（有些模型可能在 JSON 前后加文字）"""
+        if '```json' in content:
+            # 提取 JSON 代码块
+            return content.split('```json')[1].split('```')[0].strip()
+        elif '```' in content:
+            return content.split('```')[1].split('```')[0].strip()
+        return content
+    
+    @staticmethod
+    def _normalize_score(score_data: Dict, report: bool = False) -> Optional[Dict]:
+        """
+        校验评分数据并修正分数范围，重新计算总分
+        
+        Args:
+            score_data: 模型返回的评分字典
+            report: 是否打印缺失字段
+            
+        Returns:
+            修正后的评分字典，字段缺失或分数不是数字时返回 None
+        """
+        # 验证数据完整性
+        required_fields = ['audience_score', 'interest_score', 'simplicity_score', 
+                         'total_score', 'reason', 'ad_direction']
+        for field in required_fields:
+            if field not in score_data:
+                if report:
+                    print(f"  ⚠️  缺少字段: {field}")
+                return None
+        
+        # 验证分数范围
+        for field in ('audience_score', 'interest_score', 'simplicity_score'):
+            value = score_data[field]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                if report:
+                    print(f"  ⚠️  分数不是数字: {field}={value!r}")
+                return None
+            if not (0 <= value <= 10):
+                score_data[field] = max(0, min(10, value))
+        
+        # 重新计算总分（防止模型计算错误）
+        score_data['total_score'] = (
+            score_data['audience_score'] + 
+            score_data['interest_score'] + 
+            score_data['simplicity_score']
+        )
+        
+        return score_data
+    
+    def batch_score_news(self, titles: list, verbose: bool = False, delay: float = 0.5,
+                         concurrency: int = 1, rate_limit: Optional[float] = None,
+                         batch_size: int = 1) -> list:
         """
         批量评分新闻
         
@@ -200,44 +687,271 @@ class AINewsScorer:
             titles: 新闻标题列表
             verbose: 是否显示详细信息
             delay: 每次请求间隔（秒），避免请求过快
+            concurrency: 同时进行中的请求数上限，1 为逐条顺序评分
+            rate_limit: 并发模式下每秒最多发出的请求数，
+                        None 时按 delay 换算（1 / delay）
+            batch_size: 每次请求打包的标题数，大于 1 时使用 score_news_batch，
+                        解析失败的条目再逐条评分
             
         Returns:
-            评分结果列表
+            评分结果列表，顺序与 titles 一致；评分失败的标题不在结果中，
+            记录在 self.failed_titles，其中因 Token 预算用完而未评分的
+            同时记录在 self.skipped_titles
         """
+        self.skipped_titles = []
+        
+        # 配置了缓存时先查缓存，只对未命中的标题（去重后）调用 API
+        cached = {}
+        pending = titles
+        if self.cache is not None:
+            namespace = self.cache_namespace
+            pending = []
+            for title in titles:
+                if title in cached:
+                    continue
+                cached[title] = self.cache.get(title, namespace)
+                if cached[title] is None:
+                    pending.append(title)
+            hits = len(cached) - len(pending)
+            print(f"  💾 {hits} 条命中评分缓存，{len(pending)} 条需要调用 API")
+        
+        batch_size = max(1, batch_size)
+        chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        
+        if concurrency > 1 and len(chunks) > 1:
+            scores = self._batch_score_concurrent(chunks, len(pending), verbose, delay,
+                                                  concurrency, rate_limit)
+        else:
+            scores = self._batch_score_sequential(chunks, len(pending), verbose, delay)
+        
+        if self.cache is not None:
+            for title, score_data in zip(pending, scores):
+                if score_data:
+                    self.cache.put(title, namespace, score_data)
+                    cached[title] = score_data
+            scores = [cached[title] for title in titles]
+        
         results = []
-        total = len(titles)
+        self.failed_titles = []
+        for title, score_data in zip(titles, scores):
+            if score_data:
+                results.append(self._build_result(title, score_data))
+            else:
+                self.failed_titles.append(title)
+        return results
+    
+    def iter_score_news(self, titles, verbose: bool = False, delay: float = 0.5,
+                        concurrency: int = 1, rate_limit: Optional[float] = None,
+                        batch_size: int = 1):
+        """
+        流式评分：边读取标题边评分，每条评分完成立即产出
+        
+        titles 可以是生成器（如关键词粗筛的输出），不必预先全部产生；
+        同时进行中的请求不超过 concurrency 个，已提交未完成的请求
+        不超过 2 * concurrency 批，上游产生得再快也不会无限堆积。
+        
+        Args:
+            titles: 新闻标题的可迭代对象，重复标题只评分一次
+            verbose: 是否显示详细信息
+            delay: 未指定 rate_limit 时按 1 / delay 限速
+            concurrency: 同时进行中的请求数上限
+            rate_limit: 每秒最多发出的请求数
+            batch_size: 每次请求打包的标题数
+            
+        Yields:
+            (标题, 评分结果或 None)，按完成顺序产出，评分结果格式同 batch_score_news；
+            因 Token 预算用完而未评分的标题同时记录在 self.skipped_titles
+        """
+        self.skipped_titles = []
+        if rate_limit is None:
+            rate_limit = 1.0 / delay if delay > 0 else 0
+        limiter = RateLimiter(rate_limit)
+        concurrency = max(1, concurrency)
+        batch_size = max(1, batch_size)
+        namespace = self.cache_namespace if self.cache is not None else None
+        
+        def score_chunk(chunk: list):
+            limiter.acquire()
+            return self._score_chunk(chunk, verbose, limiter.acquire, limiter)
+        
+        def finish(future, chunk: list):
+            try:
+                chunk_scores = future.result()
+            except Exception as e:
+                print(f"  ❌ 评分出错: {e}")
+                chunk_scores = [None] * len(chunk)
+            for title, score_data in zip(chunk, chunk_scores):
+                if not score_data:
+                    yield title, None
+                    continue
+                if self.cache is not None:
+                    self.cache.put(title, namespace, score_data)
+                yield title, self._build_result(title, score_data)
+        
+        seen = set()
+        chunk = []
+        pending = {}
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for title in titles:
+                if title in seen:
+                    continue
+                seen.add(title)
+                
+                if self.cache is not None:
+                    score_data = self.cache.get(title, namespace)
+                    if score_data is not None:
+                        yield title, self._build_result(title, score_data)
+                        continue
+                
+                chunk.append(title)
+                if len(chunk) < batch_size:
+                    continue
+                pending[executor.submit(score_chunk, chunk)] = chunk
+                chunk = []
+                
+                # 产出已完成的批次；积压过多时阻塞等待，形成背压
+                while pending:
+                    block = len(pending) >= 2 * concurrency
+                    done, _ = wait(pending, timeout=None if block else 0,
+                                   return_when=FIRST_COMPLETED)
+                    if not done:
+                        break
+                    for future in done:
+                        yield from finish(future, pending.pop(future))
+            
+            if chunk:
+                pending[executor.submit(score_chunk, chunk)] = chunk
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from finish(future, pending.pop(future))
+    
+    def _batch_score_sequential(self, chunks: list, total: int, verbose: bool,
+                                delay: float) -> list:
+        """顺序评分：每次请求后等待 delay 秒，返回与标题一一对应的评分数据"""
+        scores = []
         
-        for i, title in enumerate(titles, 1):
+        for k, chunk in enumerate(chunks):
             if verbose:
-                print(f"\n[{i}/{total}] 评分中: {title[:50]}...")
+                print(f"\n{self._chunk_label(len(scores), chunk, total)}")
             
-            score_data = self.score_news(title, verbose=verbose)
+            chunk_scores = self._score_chunk(chunk, verbose, lambda: time.sleep(delay))
             
-            if score_data:
-                results.append({
-                    'title': title,
-                    'ai_score': score_data['total_score'],
-                    'ai_details': {
-                        '受众广度': score_data['audience_score'],
-                        '切身利益': score_data['interest_score'],
-                        '易理解度': score_data['simplicity_score']
-                    },
-                    'ai_reason': score_data['reason'],
-                    'ad_direction': score_data.get('ad_direction', ''),
-                    'target_audience': score_data.get('target_audience', ''),
-                    'emotion': score_data.get('emotion', 'neutral')
-                })
-                
-                if verbose:
-                    print(f"  ✅ AI评分: {score_data['total_score']}/30")
-            else:
-                print(f"  ⚠️  评分失败，跳过")
+            for score_data in chunk_scores:
+                scores.append(score_data)
+                if score_data:
+                    if verbose:
+                        print(f"  ✅ AI评分: {score_data['total_score']}/30")
+                elif not self.usage.exhausted():
+                    print(f"  ⚠️  评分失败，跳过")
             
             # 延迟以避免请求过快
-            if i < total:
+            if k < len(chunks) - 1:
                 time.sleep(delay)
         
-        return results
+        return scores
+    
+    def _batch_score_concurrent(self, chunks: list, total: int, verbose: bool, delay: float,
+                                concurrency: int, rate_limit: Optional[float]) -> list:
+        """
+        并发评分：最多 concurrency 个请求同时进行，请求的发出速率受 rate_limit 限制，
+        返回与标题一一对应的评分数据
+        """
+        if rate_limit is None:
+            rate_limit = 1.0 / delay if delay > 0 else 0
+        limiter = RateLimiter(rate_limit)
+        
+        if verbose:
+            rate_text = f"限速 {rate_limit:g} 次/秒" if rate_limit else "不限速"
+            print(f"  并发评分: {total} 条，并发数 {concurrency}，{rate_text}")
+        
+        def score_one(label: str, chunk: list):
+            limiter.acquire()
+            if verbose:
+                print(f"\n{label}")
+            return self._score_chunk(chunk, verbose, limiter.acquire, limiter)
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = []
+            done = 0
+            for chunk in chunks:
+                label = self._chunk_label(done, chunk, total)
+                futures.append(executor.submit(score_one, label, chunk))
+                done += len(chunk)
+            
+            scores = []
+            for chunk, future in zip(chunks, futures):
+                try:
+                    chunk_scores = future.result()
+                except Exception as e:
+                    print(f"  ❌ 评分出错: {e}")
+                    chunk_scores = [None] * len(chunk)
+                
+                for title, score_data in zip(chunk, chunk_scores):
+                    scores.append(score_data)
+                    i = len(scores)
+                    if score_data:
+                        if verbose:
+                            print(f"  ✅ [{i}/{total}] AI评分: {score_data['total_score']}/30")
+                    elif not self.usage.exhausted():
+                        print(f"  ⚠️  [{i}/{total}] 评分失败，跳过: {title[:30]}")
+        
+        return scores
+    
+    @staticmethod
+    def _chunk_label(done: int, chunk: list, total: int) -> str:
+        """批量评分进度提示"""
+        if len(chunk) == 1:
+            return f"[{done + 1}/{total}] 评分中: {chunk[0][:50]}..."
+        return f"[{done + 1}-{done + len(chunk)}/{total}] 批量评分中: {len(chunk)} 条"
+    
+    def _score_chunk(self, chunk: list, verbose: bool, wait,
+                     limiter: Optional[RateLimiter] = None) -> list:
+        """
+        对一组标题评分：单条直接调用 score_news；多条先批量请求，
+        批量结果中缺失或不合格的条目逐条重新评分（每次重试前调用 wait）。
+        limiter 传给每次请求，遇到 429 时放慢后续请求。
+        Token 预算用完后不再请求，未评分的标题记录在 self.skipped_titles
+        """
+        if self.usage.exhausted():
+            self.skipped_titles.extend(chunk)
+            return [None] * len(chunk)
+        
+        if len(chunk) == 1:
+            scores = [self.score_news(chunk[0], verbose=verbose, limiter=limiter)]
+        else:
+            scores = self.score_news_batch(chunk, verbose=verbose, limiter=limiter)
+            missing = [i for i, score_data in enumerate(scores) if score_data is None]
+            if missing:
+                print(f"  ⚠️  批量结果中 {len(missing)}/{len(chunk)} 条无效，逐条重新评分")
+                for i in missing:
+                    if self.usage.exhausted():
+                        break
+                    wait()
+                    scores[i] = self.score_news(chunk[i], verbose=verbose, limiter=limiter)
+        
+        if self.usage.exhausted():
+            # 预算在本组评分过程中用完，未评分的条目按跳过处理
+            self.skipped_titles.extend(title for title, score_data in zip(chunk, scores)
+                                       if score_data is None)
+        self.usage.add_titles(sum(1 for score_data in scores if score_data))
+        return scores
+    
+    def _build_result(self, title: str, score_data: Dict) -> Dict:
+        """将模型返回的评分数据转换为批量评分结果格式"""
+        return {
+            'title': title,
+            'ai_score': score_data['total_score'],
+            'ai_details': {
+                '受众广度': score_data['audience_score'],
+                '切身利益': score_data['interest_score'],
+                '易理解度': score_data['simplicity_score']
+            },
+            'ai_reason': score_data['reason'],
+            'ad_direction': score_data.get('ad_direction', ''),
+            'target_audience': score_data.get('target_audience', ''),
+            'emotion': score_data.get('emotion', 'neutral')
+        }
 
 
 def test_ai_scorer():
@@ -13,10 +13,13 @@
 import sys
 import os
 import re
+import json
+import time
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from news_scorer import batch_score_news, NewsScorer
-from ai_scorer import AINewsScorer
+from ai_scorer import AINewsScorer, ScoreCache, UsageTracker
 
 
 def get_rating_label(score: int) -> str:
@@ -70,6 +73,48 @@ def load_ai_config():
         return None
 
 
+def create_ai_scorer(ai_config):
+    """根据 AI 配置创建评分器，启用缓存时同时打开评分缓存，并按配置设置 Token 预算"""
+    cache = None
+    if ai_config.get('enable_cache', False):
+        cache = ScoreCache(
+            ai_config.get('cache_file', 'cache/ai_scores.jsonl'),
+            ttl_days=ai_config.get('cache_ttl_days', 7),
+            max_entries=ai_config.get('cache_max_entries', 50000)
+        )
+    
+    usage = UsageTracker(
+        max_tokens_per_run=ai_config.get('max_tokens_per_run', 0),
+        max_tokens_per_day=ai_config.get('max_tokens_per_day', 0),
+        usage_file=ai_config.get('usage_file', 'cache/ai_usage.json'),
+        prompt_price=ai_config.get('prompt_price', 0.15),
+        completion_price=ai_config.get('completion_price', 0.60)
+    )
+    
+    ai_scorer = AINewsScorer(
+        api_key=ai_config['api_key'],
+        model=ai_config.get('model', 'openai/gpt-4o-mini'),
+        base_url=ai_config.get('base_url', 'https://openrouter.ai/api/v1'),
+        cache=cache,
+        usage=usage
+    )
+    ai_scorer.max_retries = ai_config.get('max_retries', 3)
+    ai_scorer.retry_backoff = ai_config.get('retry_backoff', 1.0)
+    return ai_scorer
+
+
+def close_ai_scorer(ai_scorer):
+    """输出缓存命中与 Token 用量统计，整理缓存文件并保存每日用量"""
+    cache_hits = 0
+    if ai_scorer.cache is not None:
+        print(f"  💾 {ai_scorer.cache.stats_text()}")
+        cache_hits = ai_scorer.cache.hits
+        ai_scorer.cache.close()
+    for line in ai_scorer.usage.summary_lines(cache_hits):
+        print(f"  📊 {line}")
+    ai_scorer.usage.save()
+
+
 def extract_titles_from_txt(txt_path):
     """从TXT文件中提取新闻标题"""
     try:
@@ -164,20 +209,24 @@ def score_txt_file(txt_path, min_score=18, output_json=False, mode='keyword', ai
             return
         
         print(f"\n[2/3] AI评分中...")
-        ai_scorer = AINewsScorer(
-            api_key=ai_config['api_key'],
-            model=ai_config.get('model', 'openai/gpt-4o-mini'),
-            base_url=ai_config.get('base_url', 'https://openrouter.ai/api/v1')
-        )
+        ai_scorer = create_ai_scorer(ai_config)
         
         ai_results = ai_scorer.batch_score_news(
             titles, 
             verbose=ai_config.get('verbose', False),
-            delay=ai_config.get('batch_delay', 0.5)
+            delay=ai_config.get('batch_delay', 0.5),
+            concurrency=ai_config.get('concurrency', 1),
+            rate_limit=ai_config.get('rate_limit'),
+            batch_size=ai_config.get('batch_size', 1)
         )
+        close_ai_scorer(ai_scorer)
         
         # 转换为统一格式
         results = []
+        if ai_scorer.skipped_titles:
+            # Token 预算用完后未评分的标题降级为关键词评分
+            print(f"  ⚠️  {len(ai_scorer.skipped_titles)} 条因 Token 预算用完改用关键词评分")
+            results.extend(batch_score_news(ai_scorer.skipped_titles, min_score=min_score))
         for item in ai_results:
             if item['ai_score'] >= min_score:
                 results.append({
@@ -190,73 +239,99 @@ def score_txt_file(txt_path, min_score=18, output_json=False, mode='keyword', ai
                     'ad_direction': item.get('ad_direction', ''),
                 })
         
+        # 降级结果与 AI 结果合并后按评分排序
+        results.sort(key=lambda x: x['score'], reverse=True)
+        
     elif mode == 'hybrid':
-        # 混合模式：关键词粗筛 + AI精评
+        # 混合模式：关键词粗筛 → AI精评 → 综合评分，流水线式边评边输出
         if not ai_config or not ai_config.get('api_key'):
             print(f"\n❌ 混合模式需要配置 API Key")
             print(f"   请设置环境变量：export OPENROUTER_API_KEY='your-key'")
             print(f"   或在 config/ai_config.yaml 中配置")
             return
         
-        # 第一步：关键词粗筛
         keyword_threshold = ai_config.get('keyword_threshold', 12)
-        print(f"\n[2/4] 关键词粗筛中（阈值 {keyword_threshold}分）...")
-        keyword_results = batch_score_news(titles, min_score=keyword_threshold)
+        weights = ai_config.get('hybrid_weights', {'keyword_weight': 0.3, 'ai_weight': 0.7})
+        kw_weight = weights['keyword_weight']
+        ai_weight = weights['ai_weight']
         
-        if not keyword_results:
-            print(f"  ⚠️  没有新闻通过关键词粗筛（{keyword_threshold}分）")
-            results = []
-        else:
-            print(f"  ✅ {len(keyword_results)} 条新闻通过粗筛")
-            
-            # 第二步：AI精评
-            print(f"\n[3/4] AI精评中...")
-            ai_scorer = AINewsScorer(
-                api_key=ai_config['api_key'],
-                model=ai_config.get('model', 'openai/gpt-4o-mini'),
-                base_url=ai_config.get('base_url', 'https://openrouter.ai/api/v1')
-            )
-            
-            filtered_titles = [item['title'] for item in keyword_results]
-            ai_results = ai_scorer.batch_score_news(
-                filtered_titles,
-                verbose=ai_config.get('verbose', False),
-                delay=ai_config.get('batch_delay', 0.5)
-            )
-            
-            # 第三步：综合评分
-            print(f"\n[4/4] 综合评分中...")
-            weights = ai_config.get('hybrid_weights', {'keyword_weight': 0.3, 'ai_weight': 0.7})
-            kw_weight = weights['keyword_weight']
-            ai_weight = weights['ai_weight']
-            
-            # 建立标题到关键词评分的映射
-            kw_scores = {item['title']: item['score'] for item in keyword_results}
-            
-            results = []
-            for ai_item in ai_results:
-                title = ai_item['title']
-                kw_score = kw_scores.get(title, 0)
-                ai_score = ai_item['ai_score']
-                
-                # 计算综合评分
-                final_score = int(kw_score * kw_weight + ai_score * ai_weight)
-                
-                if final_score >= min_score:
+        print(f"\n[2/3] 关键词粗筛（阈值 {keyword_threshold}分）+ AI精评，完成一条输出一条...")
+        keyword_scorer = NewsScorer()
+        kw_scores = {}
+        pruned = {'keyword': 0, 'unreachable': 0}
+        degraded = 0
+        
+        def candidates():
+            """关键词粗筛：低于粗筛阈值、或 AI 满分也达不到最低分数的标题不送 AI"""
+            for title in titles:
+                kw_score, kw_details = keyword_scorer.score_news(title)
+                if kw_score < keyword_threshold:
+                    pruned['keyword'] += 1
+                    continue
+                if int(kw_score * kw_weight + 30 * ai_weight) < min_score:
+                    pruned['unreachable'] += 1
+                    continue
+                kw_scores[title] = (kw_score, kw_details)
+                yield title
+        
+        ai_scorer = create_ai_scorer(ai_config)
+        results = []
+        ai_count = 0
+        for title, ai_item in ai_scorer.iter_score_news(
+            candidates(),
+            verbose=ai_config.get('verbose', False),
+            delay=ai_config.get('batch_delay', 0.5),
+            concurrency=ai_config.get('concurrency', 1),
+            rate_limit=ai_config.get('rate_limit'),
+            batch_size=ai_config.get('batch_size', 1)
+        ):
+            kw_score, kw_details = kw_scores[title]
+            if title in ai_scorer.skipped_titles:
+                # Token 预算用完，降级为关键词评分
+                degraded += 1
+                if kw_score >= min_score:
                     results.append({
                         'title': title,
-                        'score': final_score,
+                        'score': kw_score,
                         'keyword_score': kw_score,
-                        'ai_score': ai_score,
-                        'score_details': ai_item['ai_details'],
-                        'rating_label': get_rating_label(final_score),
-                        'usage_suggestion': get_usage_suggestion(final_score),
-                        'ai_reason': ai_item.get('ai_reason', ''),
-                        'ad_direction': ai_item.get('ad_direction', ''),
+                        'ai_score': None,
+                        'score_details': kw_details,
+                        'rating_label': get_rating_label(kw_score),
+                        'usage_suggestion': get_usage_suggestion(kw_score),
                     })
+                continue
+            
+            ai_count += 1
+            if ai_item is None:
+                print(f"  ⚠️  评分失败，跳过：{title[:30]}")
+                continue
+            
+            # 计算综合评分
+            ai_score = ai_item['ai_score']
+            final_score = int(kw_score * kw_weight + ai_score * ai_weight)
             
-            # 按最终评分排序
-            results.sort(key=lambda x: x['score'], reverse=True)
+            if final_score >= min_score:
+                print(f"  ✅ 【{final_score}分】{title}（关键词{kw_score} + AI{ai_score}）")
+                results.append({
+                    'title': title,
+                    'score': final_score,
+                    'keyword_score': kw_score,
+                    'ai_score': ai_score,
+                    'score_details': ai_item['ai_details'],
+                    'rating_label': get_rating_label(final_score),
+                    'usage_suggestion': get_usage_suggestion(final_score),
+                    'ai_reason': ai_item.get('ai_reason', ''),
+                    'ad_direction': ai_item.get('ad_direction', ''),
+                })
+        close_ai_scorer(ai_scorer)
+        
+        print(f"  粗筛淘汰 {pruned['keyword']} 条，AI 满分也达不到 {min_score} 分跳过 "
+              f"{pruned['unreachable']} 条，AI 精评 {ai_count} 条")
+        if degraded:
+            print(f"  ⚠️  {degraded} 条因 Token 预算用完只做关键词评分")
+        
+        # 按最终评分排序
+        results.sort(key=lambda x: x['score'], reverse=True)
     
     else:
         print(f"\n❌ 不支持的模式: {mode}")
@@ -301,7 +376,10 @@ def score_txt_file(txt_path, min_score=18, output_json=False, mode='keyword', ai
         if mode == 'hybrid':
             kw_score = news.get('keyword_score', 0)
             ai_score = news.get('ai_score', 0)
-            print(f"   综合评分：关键词{kw_score}分 + AI{ai_score}分 = {score}分")
+            if ai_score is None:
+                print(f"   综合评分：关键词{kw_score}分（Token 预算用完，未做AI评分）")
+            else:
+                print(f"   综合评分：关键词{kw_score}分 + AI{ai_score}分 = {score}分")
         
         print(f"   评分详情：受众广度{details['受众广度']}分 + 切身利益{details['切身利益']}分 + 易理解度{details['易理解度']}分")
         print(f"   评级：{rating}")
@@ -333,6 +411,260 @@ def score_txt_file(txt_path, min_score=18, output_json=False, mode='keyword', ai
         print(f"\n✅ 评分结果已保存到：{output_path}")
 
 
+def normalize_date_folder(date_text):
+    """把 2025-12-06 / 20251206 / 2025年12月06日 统一为 output/ 下的日期文件夹名"""
+    digits = re.findall(r'\d+', date_text)
+    if len(digits) == 1 and len(digits[0]) == 8:
+        digits = [digits[0][:4], digits[0][4:6], digits[0][6:]]
+    if len(digits) != 3:
+        return None
+    year, month, day = (int(part) for part in digits)
+    return f"{year:04d}年{month:02d}月{day:02d}日"
+
+
+def extract_titles_from_snapshot(txt_path):
+    """
+    从 output/<日期>/txt/ 下的抓取快照中提取标题
+    
+    快照格式：每个平台一段，首行为 "平台ID | 平台名"，其后每行
+    "排名. 标题 [URL:...] [MOBILE:...]"，失败平台列表段落跳过。
+    
+    Returns:
+        [(平台名, 标题), ...]
+    """
+    try:
+        with open(txt_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        print(f"❌ 读取文件失败：{e}")
+        return []
+    
+    entries = []
+    for section in content.split('\n\n'):
+        lines = section.strip().split('\n')
+        if len(lines) < 2 or '==== 以下ID请求失败 ====' in section:
+            continue
+        source = lines[0].split(' | ', 1)[-1].strip()
+        for line in lines[1:]:
+            title = line.strip()
+            match = re.match(r'\d+\.\s+', title)
+            if match:
+                title = title[match.end():]
+            title = re.sub(r'(?: \[(?:URL|MOBILE):[^\]]*\])+$', '', title).strip()
+            if title:
+                entries.append((source, title))
+    return entries
+
+
+def collect_snapshot_titles(date_from=None, date_to=None):
+    """
+    收集日期范围内（含首尾）所有快照中的标题并全局去重
+    
+    Returns:
+        {标题: {'first_seen', 'last_seen', 'appearances', 'sources'}}，按首次出现顺序
+    """
+    output_dir = Path('output')
+    if not output_dir.exists():
+        return {}
+    
+    date_dirs = sorted(
+        d for d in output_dir.iterdir()
+        if d.is_dir() and (d / 'txt').exists()
+        and (date_from is None or d.name >= date_from)
+        and (date_to is None or d.name <= date_to)
+    )
+    
+    titles = {}
+    for date_dir in date_dirs:
+        for txt_file in sorted((date_dir / 'txt').glob('*.txt')):
+            seen_at = f"{date_dir.name} {txt_file.stem}"
+            for source, title in extract_titles_from_snapshot(txt_file):
+                meta = titles.get(title)
+                if meta is None:
+                    titles[title] = {
+                        'first_seen': seen_at,
+                        'last_seen': seen_at,
+                        'appearances': 1,
+                        'sources': [source],
+                    }
+                else:
+                    meta['last_seen'] = seen_at
+                    meta['appearances'] += 1
+                    if source not in meta['sources']:
+                        meta['sources'].append(source)
+    return titles
+
+
+_KEYWORD_SCORER = None
+
+
+def _keyword_score_chunk(titles):
+    """进程池任务：对一组标题做关键词评分，返回紧凑的元组列表"""
+    global _KEYWORD_SCORER
+    if _KEYWORD_SCORER is None:
+        _KEYWORD_SCORER = NewsScorer()
+    arrays = _KEYWORD_SCORER.score_titles(titles)
+    scores = []
+    for title, total, audience, interest, understanding in zip(
+        titles, arrays['total'], arrays['audience'], arrays['interest'], arrays['understanding']
+    ):
+        # 总分为 0 即被黑名单拒绝，只为这些标题取拒绝原因
+        reason = _KEYWORD_SCORER.score_news(title)[1]['拒绝原因'] if total == 0 else ''
+        scores.append((total, audience, interest, understanding, reason))
+    return scores
+
+
+def keyword_score_bulk(titles, workers=None, chunk_size=20000):
+    """
+    大批量关键词评分：按块分发到进程池，workers <= 1 时在当前进程计算
+    
+    Returns:
+        与 titles 一一对应的 (总分, 受众广度, 切身利益, 易理解度, 拒绝原因) 列表
+    """
+    chunks = [titles[i:i + chunk_size] for i in range(0, len(titles), chunk_size)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(chunks))
+    
+    if workers <= 1:
+        return [score for chunk in chunks for score in _keyword_score_chunk(chunk)]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return [score for chunk_scores in executor.map(_keyword_score_chunk, chunks)
+                for score in chunk_scores]
+
+
+def bulk_score(date_from=None, date_to=None, mode='keyword', ai_config=None,
+               workers=None, output_path=None):
+    """
+    批量回填：对日期范围内所有快照中的标题评分，写出一份汇总数据集
+    
+    标题先全局去重；关键词评分使用进程池，AI 评分（ai/hybrid 模式）
+    使用并发请求。hybrid 模式只对通过关键词粗筛的标题调用 AI。
+    结果不按分数过滤，每个标题一行 JSON（JSONL），便于评估不同的分数阈值。
+    
+    每行都包含 score、score_source 和 status：
+    - scored: 按评分模式得到最终分数，score_source 为 keyword/ai/hybrid
+    - below_keyword_threshold: hybrid 模式未通过关键词粗筛，score 为关键词分数
+    - budget_skipped: Token 预算用完未调用 AI，score 为关键词分数
+    - ai_failed: AI 评分失败，hybrid 模式 score 为关键词分数，ai 模式为 None
+    
+    Args:
+        date_from: 起始日期文件夹（含），None 表示不限
+        date_to: 结束日期文件夹（含），None 表示不限
+        mode: 评分模式 (keyword/ai/hybrid)
+        ai_config: AI配置字典
+        workers: 关键词评分的进程数，默认 CPU 核数
+        output_path: 输出文件路径，默认 output/scored_<起始>_<结束>.jsonl
+    """
+    print("\n" + "=" * 80)
+    print(f"【批量回填评分】")
+    print("=" * 80)
+    print(f"日期范围：{date_from or '最早'} ~ {date_to or '最新'}")
+    print(f"评分模式：{mode}")
+    print("=" * 80)
+    
+    if mode in ['ai', 'hybrid'] and (not ai_config or not ai_config.get('api_key')):
+        print(f"\n❌ {mode} 模式需要配置 API Key")
+        return
+    
+    # keyword 模式三个阶段，ai/hybrid 模式多一个 AI 评分阶段
+    stages = 4 if mode in ['ai', 'hybrid'] else 3
+    print(f"\n[1/{stages}] 收集快照标题...")
+    title_meta = collect_snapshot_titles(date_from, date_to)
+    if not title_meta:
+        print("❌ 日期范围内没有快照数据")
+        return
+    titles = list(title_meta)
+    appearances = sum(meta['appearances'] for meta in title_meta.values())
+    print(f"✅ {appearances} 条快照记录，去重后 {len(titles)} 个标题")
+    
+    print(f"\n[2/{stages}] 关键词评分...")
+    start = time.time()
+    kw_scores = keyword_score_bulk(titles, workers)
+    print(f"✅ 关键词评分完成，耗时 {time.time() - start:.1f} 秒")
+    
+    ai_results = {}
+    skipped = set()
+    keyword_threshold = (ai_config or {}).get('keyword_threshold', 12)
+    if mode in ['ai', 'hybrid']:
+        if mode == 'ai':
+            ai_titles = titles
+        else:
+            ai_titles = [title for title, score in zip(titles, kw_scores)
+                         if score[0] >= keyword_threshold]
+        print(f"\n[3/{stages}] AI评分 {len(ai_titles)} 条...")
+        ai_scorer = create_ai_scorer(ai_config)
+        done = 0
+        for title, ai_item in ai_scorer.iter_score_news(
+            ai_titles,
+            verbose=ai_config.get('verbose', False),
+            delay=ai_config.get('batch_delay', 0.5),
+            concurrency=ai_config.get('concurrency', 1),
+            rate_limit=ai_config.get('rate_limit'),
+            batch_size=ai_config.get('batch_size', 1)
+        ):
+            done += 1
+            if ai_item is not None:
+                ai_results[title] = ai_item
+            if done % 100 == 0:
+                print(f"  AI评分进度 {done}/{len(ai_titles)}")
+        close_ai_scorer(ai_scorer)
+        skipped = set(ai_scorer.skipped_titles)
+        print(f"✅ AI评分成功 {len(ai_results)}/{len(ai_titles)} 条")
+        if skipped:
+            print(f"⚠️  {len(skipped)} 条因 Token 预算用完只做关键词评分")
+    
+    weights = (ai_config or {}).get('hybrid_weights', {'keyword_weight': 0.3, 'ai_weight': 0.7})
+    
+    if output_path is None:
+        output_path = f"output/scored_{date_from or 'all'}_{date_to or 'latest'}.jsonl"
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    
+    print(f"\n[{stages}/{stages}] 写出数据集...")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for title, kw in zip(titles, kw_scores):
+            record = {
+                'title': title,
+                'keyword_score': kw[0],
+                'keyword_details': {'受众广度': kw[1], '切身利益': kw[2], '易理解度': kw[3]},
+                **title_meta[title],
+            }
+            if kw[4]:
+                record['reject_reason'] = kw[4]
+            ai_item = ai_results.get(title)
+            if ai_item is not None:
+                record['ai_score'] = ai_item['ai_score']
+                record['ai_details'] = ai_item['ai_details']
+                record['ai_reason'] = ai_item['ai_reason']
+            if mode == 'keyword':
+                status, source = 'scored', 'keyword'
+            elif ai_item is not None:
+                status, source = 'scored', mode
+            elif title in skipped:
+                # Token 预算用完，降级为关键词评分
+                status, source = 'budget_skipped', 'keyword'
+            elif mode == 'hybrid' and kw[0] < keyword_threshold:
+                status, source = 'below_keyword_threshold', 'keyword'
+            else:
+                status, source = 'ai_failed', 'keyword' if mode == 'hybrid' else None
+            
+            if source == 'keyword':
+                record['score'] = kw[0]
+            elif source == 'ai':
+                record['score'] = ai_item['ai_score']
+            elif source == 'hybrid':
+                record['score'] = int(kw[0] * weights['keyword_weight']
+                                      + ai_item['ai_score'] * weights['ai_weight'])
+            else:
+                record['score'] = None
+            record['score_source'] = source
+            record['status'] = status
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    
+    print(f"✅ {len(titles)} 条评分记录已保存到：{output_path}")
+
+
 def find_latest_txt():
     """查找最新的输出TXT文件"""
     output_dir = Path('output')
@@ -370,11 +702,17 @@ def main():
             print("【用法说明】")
             print("=" * 80)
             print("python batch_score.py <txt文件路径> [选项]")
+            print("python batch_score.py --bulk [--from 日期] [--to 日期] [选项]")
             print("\n参数说明：")
             print("  txt文件路径     必需，TrendRadar输出的新闻TXT文件")
             print("  --mode <模式>   可选，评分模式：keyword(默认)/ai/hybrid")
             print("  --score <分数>  可选，最低分数，默认18分（范围：0-30）")
             print("  --json          可选，同时输出JSON格式结果")
+            print("\n批量回填（--bulk）：")
+            print("  --from <日期>    可选，起始日期（含），如 2025-12-01")
+            print("  --to <日期>      可选，结束日期（含），如 2025-12-06")
+            print("  --workers <数量> 可选，关键词评分进程数，默认CPU核数")
+            print("  --output <路径>  可选，输出JSONL路径，默认 output/scored_<起始>_<结束>.jsonl")
             print("\n评分模式：")
             print("  keyword  关键词评分（快速，免费）")
             print("  ai       AI深度评分（准确，有成本）")
@@ -390,15 +728,22 @@ def main():
             print("  python batch_score.py output/2025年12月06日/txt/10时30分.txt --score 25 --mode hybrid")
             print("\n  # 输出JSON文件")
             print("  python batch_score.py output/2025年12月06日/txt/10时30分.txt --mode hybrid --json")
+            print("\n  # 回填一段时间内所有快照的评分")
+            print("  python batch_score.py --bulk --from 2025-12-01 --to 2025-12-06 --mode hybrid")
             print("\n环境变量：")
             print("  OPENROUTER_API_KEY  OpenRouter API Key（AI模式必需）")
             print("=" * 80)
         return
     
-    txt_path = sys.argv[1]
+    bulk = sys.argv[1] == '--bulk'
+    txt_path = None if bulk else sys.argv[1]
     min_score = 18
     output_json = False
     mode = 'keyword'
+    date_from = None
+    date_to = None
+    workers = None
+    output_path = None
     
     # 解析参数
     i = 2
@@ -428,6 +773,31 @@ def main():
             else:
                 print(f"⚠️  --score 需要指定分数参数")
                 i += 1
+        elif bulk and arg in ['--from', '--to']:
+            if i + 1 < len(sys.argv) and normalize_date_folder(sys.argv[i + 1]):
+                date_folder = normalize_date_folder(sys.argv[i + 1])
+                if arg == '--from':
+                    date_from = date_folder
+                else:
+                    date_to = date_folder
+                i += 2
+            else:
+                print(f"⚠️  {arg} 需要指定日期参数，如 2025-12-06")
+                i += 1
+        elif bulk and arg == '--workers':
+            if i + 1 < len(sys.argv) and sys.argv[i + 1].isdigit():
+                workers = int(sys.argv[i + 1])
+                i += 2
+            else:
+                print(f"⚠️  --workers 需要指定进程数")
+                i += 1
+        elif bulk and arg == '--output':
+            if i + 1 < len(sys.argv):
+                output_path = sys.argv[i + 1]
+                i += 2
+            else:
+                print(f"⚠️  --output 需要指定文件路径")
+                i += 1
         elif arg.isdigit():
             # 兼容旧版本参数格式
             min_score = int(arg)
@@ -463,7 +833,10 @@ def main():
                 print("   请设置：export OPENROUTER_API_KEY='your-key'")
                 return
     
-    score_txt_file(txt_path, min_score, output_json, mode, ai_config)
+    if bulk:
+        bulk_score(date_from, date_to, mode, ai_config, workers, output_path)
+    else:
+        score_txt_file(txt_path, min_score, output_json, mode, ai_config)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,799 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+性能基准测试脚本
+使用 output/ 下已抓取的历史快照数据，测量关键环节的耗时
+
+用法：
+    python benchmark.py                      # 运行全部基准
+    python benchmark.py topk                 # 只运行指定基准
+    python benchmark.py topk --date 2025年11月10日
+"""
+
+import contextlib
+import gc
+import io
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main as trendradar
+
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """注册基准测试"""
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+def find_latest_date_folder():
+    """查找最新的日期文件夹"""
+    output_dir = Path('output')
+    date_dirs = sorted(
+        [d for d in output_dir.iterdir() if d.is_dir() and (d / 'txt').exists()],
+        reverse=True
+    ) if output_dir.exists() else []
+    return date_dirs[0].name if date_dirs else None
+
+
+def load_day(date_folder, snapshot_index=None):
+    """读取指定日期的全部快照，返回 (all_results, id_to_name, title_info)"""
+    txt_dir = Path('output') / date_folder / 'txt'
+    all_results = {}
+    id_to_name = {}
+    title_info = {}
+
+    for file_path in sorted(txt_dir.glob('*.txt')):
+        titles_by_id, file_id_to_name = trendradar.parse_file_titles(file_path)
+        id_to_name.update(file_id_to_name)
+        for source_id, title_data in titles_by_id.items():
+            trendradar.process_source_data(
+                source_id, title_data, file_path.stem, all_results, title_info
+            )
+            if snapshot_index is not None:
+                snapshot_index.add(file_path.stem, source_id, title_data)
+
+    return all_results, id_to_name, title_info
+
+
+def time_it(func, repeat=5):
+    """多次执行取最短耗时（秒），计时期间关闭 GC 以减少抖动"""
+    best = None
+    result = None
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best, result
+
+
+def print_row(label, seconds, baseline=None):
+    """打印一行耗时结果"""
+    line = f"  {label:<36} {seconds * 1000:>10.2f} ms"
+    if baseline:
+        line += f"   ({baseline / seconds:.1f}x)"
+    print(line)
+
+
+@benchmark('topk')
+def bench_topk(date_folder):
+    """全部新闻词组的 Top-K 选择 vs 全量排序"""
+    all_results, id_to_name, title_info = load_day(date_folder)
+    rank_threshold = trendradar.CONFIG['RANK_THRESHOLD']
+
+    # 模拟"全部新闻"兜底词组：当天所有标题都落入同一组
+    all_titles = []
+    for source_id, titles in title_info.items():
+        for title, info in titles.items():
+            all_titles.append({
+                'title': title,
+                'source_name': id_to_name.get(source_id, source_id),
+                'count': info['count'],
+                'ranks': info['ranks'] or [99],
+            })
+
+    # 重复放大到数千条匹配
+    while len(all_titles) < 5000:
+        all_titles = all_titles + [dict(item) for item in all_titles]
+
+    print(f"  词组匹配数: {len(all_titles)}")
+
+    def legacy_sort():
+        return sorted(
+            all_titles,
+            key=lambda x: (
+                -trendradar.calculate_news_weight(x, rank_threshold),
+                min(x['ranks']) if x['ranks'] else 999,
+                -x['count'],
+            ),
+        )
+
+    legacy_time, legacy_result = time_it(legacy_sort)
+    print_row('全量排序（sort key 内计算权重）', legacy_time)
+
+    full_time, full_result = time_it(
+        lambda: trendradar.select_top_news(all_titles, rank_threshold)
+    )
+    print_row('全量排序（权重预计算）', full_time, legacy_time)
+    assert full_result == legacy_result
+
+    for max_count in (10, 50, 200):
+        topk_time, topk_result = time_it(
+            lambda: trendradar.select_top_news(all_titles, rank_threshold, max_count)
+        )
+        print_row(f'Top-{max_count} 堆选择', topk_time, legacy_time)
+        assert topk_result == legacy_result[:max_count]
+
+
+@benchmark('weights')
+def bench_weights(date_folder):
+    """整日快照的新闻权重：逐条计算 vs 批量计算"""
+    _, _, title_info = load_day(date_folder)
+    rank_threshold = trendradar.CONFIG['RANK_THRESHOLD']
+
+    titles = [info for source_titles in title_info.values() for info in source_titles.values()]
+    while len(titles) < 20000:
+        titles = titles + titles
+
+    backend = 'numpy' if trendradar.shared_weights.np is not None else '纯 Python'
+    print(f"  新闻条数: {len(titles)}，批量计算后端: {backend}")
+
+    scalar_time, scalar_result = time_it(
+        lambda: [trendradar.calculate_news_weight(item, rank_threshold) for item in titles]
+    )
+    print_row('逐条 calculate_news_weight', scalar_time)
+
+    batch_time, batch_result = time_it(
+        lambda: trendradar.calculate_news_weights(titles, rank_threshold)
+    )
+    print_row('批量 calculate_news_weights', batch_time, scalar_time)
+    assert batch_result == scalar_result
+
+
+@benchmark('dedup')
+def bench_dedup(date_folder):
+    """跨平台标题去重索引的构建耗时与归并效果"""
+    all_results, id_to_name, title_info = load_day(date_folder)
+
+    build_time, index = time_it(
+        lambda: trendradar.build_title_dedup_index(all_results)
+    )
+    print(f"  标题数: {index.title_count}，簇数: {len(index)}")
+    print_row('构建 TitleDedupIndex', build_time)
+
+    plain_time, (plain_stats, _) = time_it(
+        lambda: trendradar.count_word_frequency(
+            all_results, [], [], id_to_name, title_info, mode='daily'
+        ),
+        repeat=3,
+    )
+    print_row('count_word_frequency（不去重）', plain_time)
+
+    dedup_time, (dedup_stats, _) = time_it(
+        lambda: trendradar.count_word_frequency(
+            all_results, [], [], id_to_name, title_info,
+            mode='daily', dedup_index=index,
+        ),
+        repeat=3,
+    )
+    print_row('count_word_frequency（去重）', dedup_time, plain_time)
+    print(f"  展示条数: {plain_stats[0]['count']} -> {dedup_stats[0]['count']}")
+    assert dedup_stats[0]['count'] == len(index)
+
+
+@benchmark('parallel')
+def bench_parallel(date_folder):
+    """词频统计：串行匹配 vs 按平台分片的进程池并行匹配"""
+    all_results, id_to_name, title_info = load_day(date_folder)
+    word_groups, filter_words = trendradar.load_frequency_words()
+
+    # 放大为更多平台，模拟大平台列表
+    results = {}
+    for copy in range(8):
+        for source_id, titles in all_results.items():
+            results[f"{source_id}-{copy}"] = {
+                f"{title} {copy}": data for title, data in titles.items()
+            }
+    total = sum(len(titles) for titles in results.values())
+    print(f"  平台数: {len(results)}，标题数: {total}，词组数: {len(word_groups)}，CPU: {os.cpu_count()}")
+
+    def run(workers):
+        return trendradar.count_word_frequency(
+            results, word_groups, filter_words, id_to_name,
+            mode='daily', parallel_workers=workers,
+        )
+
+    serial_time, serial_result = time_it(lambda: run(0), repeat=3)
+    print_row('串行匹配', serial_time)
+
+    for workers in (2, 4):
+        parallel_time, parallel_result = time_it(lambda: run(workers), repeat=3)
+        print_row(f'进程池并行（{workers} 进程）', parallel_time, serial_time)
+        assert parallel_result == serial_result
+
+
+def legacy_latest_batch(results, title_info):
+    """扫描全部 title_info 找出最新时间，再逐条比较 last_time 筛选当前榜单，作为对照"""
+    latest_time = None
+    for source_titles in title_info.values():
+        for title_data in source_titles.values():
+            last_time = title_data.get('last_time', '')
+            if last_time and (latest_time is None or last_time > latest_time):
+                latest_time = last_time
+
+    batch = {}
+    for source_id, source_titles in results.items():
+        if source_id not in title_info:
+            continue
+        filtered_titles = {}
+        for title, title_data in source_titles.items():
+            info = title_info[source_id].get(title)
+            if info and info.get('last_time') == latest_time:
+                filtered_titles[title] = title_data
+        if filtered_titles:
+            batch[source_id] = filtered_titles
+    return batch
+
+
+@benchmark('current')
+def bench_current(date_folder):
+    """current 模式：扫描 title_info 筛选最新批次 vs 快照成员索引"""
+    # 快照越多，扫描的历史标题越多；额外测一次快照数最多的一天
+    day_dirs = [d for d in Path('output').iterdir() if (d / 'txt').exists()]
+    busiest = max(day_dirs, key=lambda d: (len(list((d / 'txt').glob('*.txt'))), d.name)).name
+    word_groups, filter_words = trendradar.load_frequency_words()
+
+    for day in dict.fromkeys([date_folder, busiest]):
+        snapshot_index = trendradar.SnapshotIndex()
+        all_results, id_to_name, title_info = load_day(day, snapshot_index)
+        total = sum(len(titles) for titles in all_results.values())
+        latest = sum(len(titles) for titles in snapshot_index.latest_batch(all_results).values())
+        print(f"  {day}：快照数 {len(snapshot_index.snapshots)}，当日标题数 {total}，最新批次 {latest}")
+
+        scan_time, scan_batch = time_it(lambda: legacy_latest_batch(all_results, title_info), repeat=20)
+        index_time, index_batch = time_it(lambda: snapshot_index.latest_batch(all_results), repeat=20)
+        print_row('筛选最新批次：扫描 title_info', scan_time)
+        print_row('筛选最新批次：快照成员索引', index_time, scan_time)
+        assert index_batch == scan_batch
+
+        def run(index):
+            return trendradar.count_word_frequency(
+                all_results, word_groups, filter_words, id_to_name, title_info,
+                mode='current', snapshot_index=index,
+            )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            scan_time, scan_result = time_it(lambda: run(None))
+            index_time, index_result = time_it(lambda: run(snapshot_index))
+        print_row('count_word_frequency：扫描', scan_time)
+        print_row('count_word_frequency：快照索引', index_time, scan_time)
+        assert index_result == scan_result
+
+
+@benchmark('split')
+def bench_split(date_folder):
+    """各推送渠道的消息分批（飞书批次约 30KB）"""
+    all_results, id_to_name, title_info = load_day(date_folder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, _ = trendradar.count_word_frequency(
+            all_results, [], [], id_to_name, title_info, mode='daily'
+        )
+    new_titles = {
+        source_id: dict(list(titles.items())[:20])
+        for source_id, titles in all_results.items()
+    }
+    report_data = trendradar.prepare_report_data(
+        stats, ['failed-a', 'failed-b'], new_titles, id_to_name, 'daily'
+    )
+
+    format_types = ('feishu', 'dingtalk', 'wework', 'telegram', 'ntfy', 'bark', 'slack')
+    for format_type in format_types:
+        split_time, batches = time_it(
+            lambda: trendradar.split_content_into_batches(report_data, format_type)
+        )
+        total_bytes = sum(len(batch.encode('utf-8')) for batch in batches)
+        print_row(f'{format_type}（{len(batches)} 批，{total_bytes // 1024} KB）', split_time)
+
+    # 全部渠道：每个渠道各自构建 vs 共用一次构建的中间表示
+    def all_channels(shared_ir):
+        data = dict(report_data)
+        if shared_ir:
+            data['ir'] = trendradar.build_report_ir(report_data)
+        return [
+            trendradar.split_content_into_batches(data, format_type)
+            for format_type in format_types
+        ]
+
+    separate_time, separate_result = time_it(lambda: all_channels(False))
+    print_row('全部渠道（各自构建）', separate_time)
+    shared_time, shared_result = time_it(lambda: all_channels(True))
+    print_row('全部渠道（共用中间表示）', shared_time, separate_time)
+    assert shared_result == separate_result
+
+
+@benchmark('format')
+def bench_format(date_folder):
+    """所有标题在全部推送渠道逐条格式化：每次重新构建 vs 按标记族缓存片段"""
+    all_results, id_to_name, title_info = load_day(date_folder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, _ = trendradar.count_word_frequency(
+            all_results, [], [], id_to_name, title_info, mode='daily'
+        )
+    report_data = trendradar.prepare_report_data(stats, [], {}, id_to_name, 'daily')
+    titles = [title_data for stat in report_data['stats'] for title_data in stat['titles']]
+    platforms = ('feishu', 'dingtalk', 'wework', 'telegram', 'ntfy', 'bark', 'slack')
+
+    def format_all(cached):
+        format_cache = trendradar.NewsFormatCache() if cached else None
+        return [
+            trendradar.format_title_for_platform(
+                platform, title_data, format_cache=format_cache
+            )
+            for platform in platforms
+            for title_data in titles
+        ]
+
+    print(f'  标题数 {len(titles)}，渠道数 {len(platforms)}')
+    plain_time, plain_result = time_it(lambda: format_all(False))
+    print_row('逐条重新格式化', plain_time)
+    cached_time, cached_result = time_it(lambda: format_all(True))
+    print_row('片段缓存', cached_time, plain_time)
+    assert cached_result == plain_result
+
+
+def naive_keyword_score(scorer, title):
+    """逐个关键词列表做子串判断的原始评分方式，作为对照"""
+    title_lower = title.lower()
+    for keyword in scorer.blacklist_keywords:
+        if keyword.lower() in title_lower:
+            return 0, {'受众广度': 0, '切身利益': 0, '易理解度': 0,
+                       '拒绝原因': f'包含禁用词: {keyword}'}
+
+    def count(keywords):
+        return sum(1 for keyword in keywords if keyword in title_lower)
+
+    if any(keyword in title_lower for keyword in scorer.high_audience_keywords):
+        audience = 10
+    else:
+        medium, low = count(scorer.medium_audience_keywords), count(scorer.low_audience_keywords)
+        audience = 8 if medium >= 2 else 7 if medium else 6 if low >= 2 else 5 if low else 4
+
+    if any(keyword in title_lower for keyword in scorer.direct_interest_keywords):
+        interest = 10
+    else:
+        indirect = count(scorer.indirect_interest_keywords)
+        policy = count(scorer.policy_benefit_keywords)
+        interest = 7 if indirect >= 2 else 6 if indirect else 5 if policy else 3
+
+    professional = sum(1 for term in scorer.professional_terms if term.lower() in title_lower)
+    understanding = {0: 10, 1: 6, 2: 4}.get(professional, 2)
+
+    total = audience + interest + understanding
+    return total, {'受众广度': audience, '切身利益': interest, '易理解度': understanding}
+
+
+@benchmark('scorer')
+def bench_scorer(date_folder):
+    """关键词评分：逐列表子串判断 vs 多模式自动机一次扫描"""
+    from news_scorer import NewsScorer
+
+    all_results, _, _ = load_day(date_folder)
+    titles = [title for titles in all_results.values() for title in titles]
+    scorer = NewsScorer()
+    print(f"  当日标题数: {len(titles)}")
+
+    naive_time, naive_result = time_it(
+        lambda: [naive_keyword_score(scorer, title) for title in titles]
+    )
+    print_row('逐列表子串判断', naive_time)
+    automaton_time, automaton_result = time_it(
+        lambda: [scorer.score_news(title) for title in titles]
+    )
+    print_row('多模式自动机', automaton_time, naive_time)
+    assert automaton_result == naive_result
+
+
+def peak_memory(func):
+    """执行一次并返回 tracemalloc 统计的峰值内存（字节）"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def legacy_filter_news_list(scorer, news_list):
+    """逐条复制字典、评分并生成标签后再排序的原始过滤方式，作为对照"""
+    filtered_list = []
+    for news in news_list:
+        title = news.get('title', '')
+        if not title:
+            continue
+        score, details = scorer.score_news(title)
+        if scorer.should_keep(score):
+            news_with_score = news.copy()
+            news_with_score['score'] = score
+            news_with_score['score_details'] = details
+            news_with_score['rating_label'] = scorer.get_rating_label(score)
+            news_with_score['usage_suggestion'] = scorer.get_usage_suggestion(score)
+            filtered_list.append(news_with_score)
+    filtered_list.sort(key=lambda x: x['score'], reverse=True)
+    return filtered_list
+
+
+@benchmark('scorer_batch')
+def bench_scorer_batch(date_folder):
+    """历史标题批量评分：逐条评分生成字典 vs 分数数组 + 只为保留结果生成标签"""
+    from news_scorer import NewsScorer
+
+    # 截至指定日期的全部快照，每次出现都算一条（含跨快照重复的标题）
+    news_list = []
+    for day_dir in sorted(Path('output').iterdir()):
+        if not (day_dir / 'txt').exists() or day_dir.name > date_folder:
+            continue
+        for file_path in sorted((day_dir / 'txt').glob('*.txt')):
+            titles_by_id, _ = trendradar.parse_file_titles(file_path)
+            for source_id, title_data in titles_by_id.items():
+                news_list.extend({'title': title, 'source': source_id} for title in title_data)
+    titles = [news['title'] for news in news_list]
+    scorer = NewsScorer()
+    print(f"  历史标题数: {len(news_list)}，去重后: {len(set(titles))}")
+
+    legacy_time, legacy_result = time_it(lambda: legacy_filter_news_list(scorer, news_list), repeat=3)
+    print_row('逐条评分并生成字典', legacy_time)
+    batch_time, batch_result = time_it(lambda: scorer.filter_news_list(news_list), repeat=3)
+    print_row('分数数组 + 保留结果生成字典', batch_time, legacy_time)
+    top_time, top_result = time_it(lambda: scorer.filter_news_list(news_list, top_k=50), repeat=3)
+    print_row('分数数组 + Top 50', top_time, legacy_time)
+    arrays_time, _ = time_it(lambda: scorer.score_titles(titles), repeat=3)
+    print_row('仅分数数组 score_titles', arrays_time, legacy_time)
+    assert batch_result == legacy_result
+    assert top_result == legacy_result[:50]
+
+    legacy_peak = peak_memory(lambda: legacy_filter_news_list(scorer, news_list))
+    batch_peak = peak_memory(lambda: scorer.filter_news_list(news_list))
+    top_peak = peak_memory(lambda: scorer.filter_news_list(news_list, top_k=50))
+    print(f"  峰值内存：逐条 {legacy_peak / 1024 / 1024:.1f} MB，"
+          f"分数数组 {batch_peak / 1024 / 1024:.1f} MB，Top 50 {top_peak / 1024 / 1024:.1f} MB")
+
+    # 保留全部标题的分数（如批量回填评分）：每条一个 (总分, 详情字典) vs 四个分数数组
+    tuples_peak = peak_memory(lambda: [scorer.score_news(title) for title in titles])
+    arrays_peak = peak_memory(lambda: scorer.score_titles(titles))
+    print(f"  全部分数峰值内存：逐条结果 {tuples_peak / 1024 / 1024:.1f} MB，"
+          f"分数数组 {arrays_peak / 1024 / 1024:.1f} MB")
+
+
+@benchmark('html')
+def bench_html(date_folder):
+    """大型"全部新闻"HTML 报告：拼接完整字符串写入 vs 分块流式写入"""
+    all_results, id_to_name, title_info = load_day(date_folder)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, total_titles = trendradar.count_word_frequency(
+            all_results, [], [], id_to_name, title_info, mode='daily'
+        )
+    # 放大"全部新闻"词组，模拟长时间运行后的当日汇总
+    stats[0]['titles'] = stats[0]['titles'] * 20
+    stats[0]['count'] = len(stats[0]['titles'])
+    report_data = trendradar.prepare_report_data(
+        stats, [], all_results, id_to_name, 'daily'
+    )
+    print(f"  新闻条数: {stats[0]['count']}，新增条数: {report_data['total_new_count']}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / 'report.html'
+
+        def render_then_write():
+            html = trendradar.render_html_content(report_data, total_titles, True)
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+
+        def stream_write():
+            with open(file_path, 'w', encoding='utf-8') as f:
+                trendradar.write_html_content(f, report_data, total_titles, True)
+
+        render_time, _ = time_it(render_then_write)
+        render_peak = peak_memory(render_then_write)
+        rendered = file_path.read_bytes()
+        print_row(f'完整字符串写入（峰值 {render_peak / 1024 / 1024:.2f} MB）', render_time)
+
+        stream_time, _ = time_it(stream_write)
+        stream_peak = peak_memory(stream_write)
+        print_row(f'分块流式写入（峰值 {stream_peak / 1024 / 1024:.2f} MB）', stream_time, render_time)
+        print(f"  报告大小: {len(rendered) // 1024} KB")
+        assert file_path.read_bytes() == rendered
+
+
+class VirtualClock:
+    """虚拟时钟：sleep 只推进时间不真正等待，用于测量推送节奏"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += max(0.0, seconds)
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, payload=None, text='', headers=None):
+        self.status_code = status_code
+        self._payload = payload or {}
+        self.text = text
+        self.headers = headers or {}
+
+    def json(self):
+        return self._payload
+
+
+class FakeChannelServer:
+    """按渠道频率限制模拟的推送服务端，超限时返回各渠道的限流响应"""
+
+    LIMITS = {
+        'feishu': [(5, 1), (100, 60)],
+        'dingtalk': [(20, 60)],
+        'wework': [(20, 60)],
+        'telegram': [(1, 1), (20, 60)],
+        'slack': [(1, 1)],
+    }
+
+    def __init__(self, clock, channel, latency=0.2):
+        self.clock = clock
+        self.channel = channel
+        self.latency = latency
+        self.accepted = []
+        self.rejected = 0
+
+    def _throttled(self):
+        now = self.clock.now
+        for count, window in self.LIMITS[self.channel]:
+            # 留出浮点误差，恰好间隔一个窗口的请求视为合规
+            recent = [t for t in self.accepted if now - t < window - 1e-6]
+            if len(recent) >= count:
+                return window - (now - recent[-count])
+        return 0
+
+    def post(self, url, **kwargs):
+        self.clock.now += self.latency
+        retry_after = self._throttled()
+        if not retry_after:
+            self.accepted.append(self.clock.now)
+            ok = {
+                'feishu': {'code': 0},
+                'dingtalk': {'errcode': 0},
+                'wework': {'errcode': 0},
+                'telegram': {'ok': True},
+            }
+            return FakeResponse(200, ok.get(self.channel), 'ok')
+
+        self.rejected += 1
+        if self.channel == 'feishu':
+            return FakeResponse(200, {'code': trendradar.FEISHU_THROTTLE_CODE, 'msg': 'frequency limited'})
+        if self.channel == 'dingtalk':
+            return FakeResponse(200, {'errcode': trendradar.DINGTALK_THROTTLE_CODE, 'errmsg': 'send too fast'})
+        if self.channel == 'wework':
+            return FakeResponse(200, {'errcode': trendradar.WEWORK_THROTTLE_CODE, 'errmsg': 'freq out of limit'})
+        if self.channel == 'telegram':
+            return FakeResponse(429, {'ok': False, 'parameters': {'retry_after': int(retry_after) + 1}})
+        return FakeResponse(429, text='rate_limited', headers={'Retry-After': str(int(retry_after) + 1)})
+
+
+@benchmark('pacing')
+def bench_pacing(date_folder):
+    """多批次推送节奏：固定批次间隔 vs 渠道令牌桶（虚拟时钟 + 按渠道限额模拟的服务端）"""
+    all_results, id_to_name, title_info = load_day(date_folder)
+    with contextlib.redirect_stdout(io.StringIO()):
+        stats, _ = trendradar.count_word_frequency(
+            all_results, [], [], id_to_name, title_info, mode='daily'
+        )
+    report_data = trendradar.prepare_report_data(stats, [], {}, id_to_name, 'daily')
+
+    senders = {
+        'feishu': lambda: trendradar.send_to_feishu('https://feishu', report_data, '当日汇总'),
+        'dingtalk': lambda: trendradar.send_to_dingtalk('https://dingtalk', report_data, '当日汇总'),
+        'wework': lambda: trendradar.send_to_wework('https://wework', report_data, '当日汇总'),
+        'telegram': lambda: trendradar.send_to_telegram('token', 'chat', report_data, '当日汇总'),
+        'slack': lambda: trendradar.send_to_slack('https://slack', report_data, '当日汇总'),
+    }
+
+    rate_limit = trendradar.CONFIG['RATE_LIMIT']
+    original = (
+        trendradar.requests.post, trendradar.time.monotonic,
+        trendradar.time.sleep, rate_limit['ENABLED'],
+    )
+    print(f"  批次间隔: {trendradar.CONFIG['BATCH_SEND_INTERVAL']} 秒，单次请求耗时按 0.2 秒计")
+    try:
+        for channel, send in senders.items():
+            row = []
+            for enabled in (False, True):
+                clock = VirtualClock()
+                server = FakeChannelServer(clock, channel)
+                trendradar.requests.post = server.post
+                trendradar.time.monotonic = clock.monotonic
+                trendradar.time.sleep = clock.sleep
+                rate_limit['ENABLED'] = enabled
+                trendradar._channel_pacers.clear()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    success = send()
+                row.append((clock.now, len(server.accepted), server.rejected, success))
+
+            (fixed_time, batches, fixed_rejected, fixed_ok), (paced_time, _, paced_rejected, paced_ok) = row
+            print(
+                f"  {channel:<9} {batches:>3} 批  固定间隔 {fixed_time:>6.1f} 秒"
+                f"（限流 {fixed_rejected} 次{'' if fixed_ok else '，发送失败'}）"
+                f"  令牌桶 {paced_time:>6.1f} 秒（限流 {paced_rejected} 次{'' if paced_ok else '，发送失败'}）"
+            )
+            # 内置限速不应比原先的固定间隔更慢
+            assert paced_ok and paced_time <= fixed_time + 1e-6, channel
+    finally:
+        (
+            trendradar.requests.post, trendradar.time.monotonic,
+            trendradar.time.sleep, rate_limit['ENABLED'],
+        ) = original
+        trendradar._channel_pacers.clear()
+
+
+def run_ai_scoring(base_url, titles, **options):
+    """用全新的评分器（无缓存）跑一遍批量评分，返回 (耗时, 评分结果, 评分器)"""
+    from ai_scorer import AINewsScorer
+
+    scorer = AINewsScorer('mock-key', base_url=base_url)
+    # 模拟服务的 5xx 无需真实退避；429 仍按 Retry-After 等待
+    scorer.retry_backoff = 0.01
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = scorer.batch_score_news(titles, delay=0, **options)
+    return time.perf_counter() - start, results, scorer
+
+
+@benchmark('ai')
+def bench_ai(date_folder):
+    """AI 评分：逐条 / 并发 / 批量打包（本地模拟服务，含错误注入与限流）"""
+    from mock_llm_server import MockChatServer
+
+    all_results, _, _ = load_day(date_folder)
+    titles = list(dict.fromkeys(title for titles in all_results.values() for title in titles))[:100]
+    print(f"  标题数 {len(titles)}，模拟服务延迟 50 ms")
+
+    scenarios = [
+        ('逐条顺序', {}),
+        ('并发 4', {'concurrency': 4, 'rate_limit': 0}),
+        ('批量 10', {'batch_size': 10}),
+        ('并发 4 + 批量 10', {'concurrency': 4, 'rate_limit': 0, 'batch_size': 10}),
+    ]
+    with MockChatServer(latency=0.05) as server:
+        baseline = None
+        reference = None
+        for label, options in scenarios:
+            elapsed, results, scorer = run_ai_scoring(server.base_url, titles, **options)
+            print_row(label, elapsed, baseline)
+            print(f"    成功 {len(results)}/{len(titles)}，请求 {scorer.usage.calls} 次，"
+                  f"tokens {scorer.usage.total_tokens}（每条 {scorer.usage.total_tokens / len(titles):.0f}）")
+            baseline = baseline or elapsed
+            reference = reference or results
+            assert results == reference
+
+    # 只限流不出错：429 按 Retry-After 重试，所有标题都应评分成功
+    print("  只限流：每秒超过 20 次返回 429")
+    with MockChatServer(latency=0.05, max_rps=20) as server:
+        elapsed, results, scorer = run_ai_scoring(server.base_url, titles, concurrency=8, rate_limit=0)
+        print_row('并发 8（逐条）', elapsed)
+        print(f"    成功 {len(results)}/{len(titles)}，请求 {server.stats['requests']} 次"
+              f"（429: {server.stats['429']}），p90 {scorer.usage.percentile(90) * 1000:.0f} ms")
+        assert results == reference
+
+    # 5% 标题硬故障 + 5% 临时 500 + 每秒 20 次上限：临时错误重试后成功，
+    # 失败的应恰好是注入硬故障的标题
+    print("  错误注入：5% 标题硬故障，5% 返回 500，每秒超过 20 次返回 429")
+    with MockChatServer(latency=0.05, error_rate=0.05, max_rps=20, hard_fault_rate=0.05) as server:
+        hard_faults = [title for title in titles if server.is_hard_fault(title)]
+        for label, options in (('并发 8 + 批量 10', {'concurrency': 8, 'rate_limit': 0, 'batch_size': 10}),
+                               ('并发 8 + 批量 10 + 限速 15/秒', {'concurrency': 8, 'rate_limit': 15, 'batch_size': 10})):
+            server.stats.clear()
+            elapsed, results, scorer = run_ai_scoring(server.base_url, titles, **options)
+            print_row(label, elapsed)
+            print(f"    成功 {len(results)}/{len(titles)}，失败 {len(scorer.failed_titles)}"
+                  f"（硬故障 {len(hard_faults)}），请求 {server.stats['requests']} 次"
+                  f"（429: {server.stats['429']}，500: {server.stats['500']}），"
+                  f"p90 {scorer.usage.percentile(90) * 1000:.0f} ms")
+            assert scorer.failed_titles == hard_faults
+            assert results == [result for result in reference if result['title'] not in hard_faults]
+
+
+@benchmark('sentiment')
+def bench_sentiment(date_folder):
+    """情感分析：analyze_sentiment 生成提示词 + 发送到本地模拟服务"""
+    import re
+    import requests
+    from mcp_server.tools.analytics import AnalyticsTools
+    from mock_llm_server import MockChatServer
+
+    date_text = '-'.join(re.findall(r'\d+', date_folder))
+    tools = AnalyticsTools(os.path.dirname(os.path.abspath(__file__)))
+
+    for limit in (20, 100):
+        prompt_time, result = time_it(lambda: tools.analyze_sentiment(
+            date_range={'start': date_text, 'end': date_text}, limit=limit
+        ), repeat=3)
+        if not result.get('success'):
+            print(f"  ❌ analyze_sentiment 失败: {result.get('error')}")
+            return
+        print_row(f'生成提示词（{limit} 条）', prompt_time)
+
+        with MockChatServer(latency=0.05) as server:
+            def ask():
+                response = requests.post(
+                    f"{server.base_url}/chat/completions",
+                    json={'model': 'mock', 'messages': [{'role': 'user', 'content': result['ai_prompt']}]},
+                    timeout=30
+                )
+                return response.json()
+
+            request_time, response = time_it(ask, repeat=3)
+        print_row(f'模拟服务往返（{limit} 条）', request_time)
+        distribution = response['choices'][0]['message']['content'].split('\n')[1:4]
+        print(f"    prompt tokens {response['usage']['prompt_tokens']}，{' '.join(distribution)}")
+
+
+def main():
+    names = []
+    date_folder = None
+
+    i = 1
+    while i < len(sys.argv):
+        arg = sys.argv[i]
+        if arg == '--date' and i + 1 < len(sys.argv):
+            date_folder = sys.argv[i + 1]
+            i += 2
+        else:
+            names.append(arg)
+            i += 1
+
+    date_folder = date_folder or find_latest_date_folder()
+    if not date_folder:
+        print("❌ output/ 下没有可用的快照数据")
+        return
+
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"❌ 未知基准: {', '.join(unknown)}")
+        print(f"   可用基准: {', '.join(BENCHMARKS)}")
+        return
+
+    print("\n" + "=" * 80)
+    print(f"【性能基准测试】数据日期：{date_folder}")
+    print("=" * 80)
+
+    for name in names or list(BENCHMARKS):
+        func = BENCHMARKS[name]
+        print(f"\n[{name}] {func.__doc__}")
+        func(date_folder)
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == '__main__':
+    main()
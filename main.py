@@ -1,24 +1,49 @@
 # coding=utf-8
 
+import atexit
+import hashlib
+import heapq
 import json
 import os
+import queue
 import random
 import re
+import shutil
+import sys
+import threading
 import time
+import unicodedata
 import webbrowser
 import smtplib
+import zlib
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from email.utils import formataddr, formatdate, make_msgid
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, Iterator, List, Tuple, Optional, Union
 
 import pytz
 import requests
 import yaml
 
+from mcp_server.utils import weights as shared_weights
+
+try:
+    import fcntl
+except ImportError:  # Windows 没有 fcntl，发件箱不加文件锁
+    fcntl = None
+
+try:
+    from news_scorer import NewsScorer
+except ImportError:  # 评分模块为可选组件，缺失时跳过评分
+    NewsScorer = None
+
 
 VERSION = "3.4.1"
 
@@ -55,6 +80,35 @@ SMTP_CONFIGS = {
 }
 
 
+# === 推送渠道频率限制 ===
+# rate 为每分钟补充的令牌数，burst 为可连续发送（不等待）的消息数。
+# 令牌桶在任意 T 秒内最多放行 burst + rate * T / 60 条，按此取值保证不超过各渠道的窗口限额
+CHANNEL_RATE_LIMITS = {
+    # 飞书自定义机器人：5 次/秒，100 次/分钟
+    "feishu": {"rate": 90, "burst": 3},
+    # 钉钉自定义机器人：每个机器人 20 条/分钟，超限后会被限流 10 分钟
+    # （20 条/分钟时桶容量只能为 1，与原先 3 秒的固定间隔一致，多批次时不会更慢）
+    "dingtalk": {"rate": 20, "burst": 1},
+    # 企业微信群机器人：20 条/分钟（同上）
+    "wework": {"rate": 20, "burst": 1},
+    # Telegram：同一群组 20 条/分钟
+    "telegram": {"rate": 20, "burst": 1},
+    # 公共 ntfy.sh：突发 60 次，之后每 5 秒恢复 1 次；保留原先至少间隔 2 秒的发送节奏
+    "ntfy": {"rate": 30, "burst": 1},
+    # 自托管 ntfy 服务器：沿用原先 1 秒的间隔
+    "ntfy_self_hosted": {"rate": 60, "burst": 1},
+    # Bark：官方未公布限制，保守设置
+    "bark": {"rate": 60, "burst": 5},
+    # Slack Incoming Webhook：约 1 条/秒
+    "slack": {"rate": 60, "burst": 1},
+}
+
+# 各渠道表示“发送过于频繁”的错误码
+FEISHU_THROTTLE_CODE = 11232
+DINGTALK_THROTTLE_CODE = 130101
+WEWORK_THROTTLE_CODE = 45009
+
+
 # === 配置管理 ===
 def load_config():
     """加载配置文件"""
@@ -84,6 +138,40 @@ def load_config():
             os.environ.get("MAX_NEWS_PER_KEYWORD", "").strip() or "0"
         )
         or config_data["report"].get("max_news_per_keyword", 0),
+        "DEDUP_TITLES": os.environ.get("DEDUP_TITLES", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("DEDUP_TITLES", "").strip()
+        else config_data["report"].get("dedup_titles", False),
+        "SKIP_UNCHANGED_REPORT": os.environ.get("SKIP_UNCHANGED_REPORT", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("SKIP_UNCHANGED_REPORT", "").strip()
+        else config_data["report"].get("skip_unchanged", False),
+        "HTML_FRAGMENTS": os.environ.get("HTML_FRAGMENTS", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("HTML_FRAGMENTS", "").strip()
+        else config_data["report"].get("html_fragments", False),
+        # 0 表示不限制，环境变量设置为 0 时同样生效
+        "HTML_FRAGMENT_MAX_RUNS": int(os.environ["HTML_FRAGMENT_MAX_RUNS"].strip())
+        if os.environ.get("HTML_FRAGMENT_MAX_RUNS", "").strip()
+        else config_data["report"].get("html_fragment_max_runs", 48),
+        "PARALLEL_WORKERS": int(
+            os.environ.get("PARALLEL_WORKERS", "").strip() or "0"
+        )
+        or config_data["report"].get("parallel_workers", 0),
+        "ENABLE_SCORING": os.environ.get("ENABLE_SCORING", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("ENABLE_SCORING", "").strip()
+        else config_data["report"].get("enable_scoring", False),
+        "MIN_SCORE": int(
+            os.environ.get("MIN_SCORE", "").strip()
+            or config_data["report"].get("min_score", 18)
+        ),
+        "SHOW_SCORE_IN_REPORT": os.environ.get("SHOW_SCORE_IN_REPORT", "")
+        .strip()
+        .lower()
+        in ("true", "1")
+        if os.environ.get("SHOW_SCORE_IN_REPORT", "").strip()
+        else config_data["report"].get("show_score_in_report", False),
         "USE_PROXY": config_data["crawler"]["use_proxy"],
         "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
         "ENABLE_CRAWLER": os.environ.get("ENABLE_CRAWLER", "").strip().lower()
@@ -102,6 +190,11 @@ def load_config():
         "BARK_BATCH_SIZE": config_data["notification"].get("bark_batch_size", 3600),
         "SLACK_BATCH_SIZE": config_data["notification"].get("slack_batch_size", 4000),
         "BATCH_SEND_INTERVAL": config_data["notification"]["batch_send_interval"],
+        "PARALLEL_SEND": config_data["notification"].get("parallel_send", True),
+        "SKIP_UNCHANGED_PUSH": os.environ.get("SKIP_UNCHANGED_PUSH", "").strip().lower()
+        in ("true", "1")
+        if os.environ.get("SKIP_UNCHANGED_PUSH", "").strip()
+        else config_data["notification"].get("skip_unchanged_push", False),
         "FEISHU_MESSAGE_SEPARATOR": config_data["notification"][
             "feishu_message_separator"
         ],
@@ -137,6 +230,58 @@ def load_config():
             .get("push_window", {})
             .get("push_record_retention_days", 7),
         },
+        "EMAIL_DELIVERY": {
+            "TIMEOUT": config_data["notification"].get("email", {}).get("timeout", 30),
+            "ASYNC": os.environ.get("EMAIL_ASYNC", "").strip().lower() in ("true", "1")
+            if os.environ.get("EMAIL_ASYNC", "").strip()
+            else config_data["notification"].get("email", {}).get("async_send", False),
+            "ASYNC_WAIT": config_data["notification"]
+            .get("email", {})
+            .get("async_wait", 120),
+        },
+        "RATE_LIMIT": {
+            "ENABLED": os.environ.get("RATE_LIMIT_ENABLED", "").strip().lower()
+            in ("true", "1")
+            if os.environ.get("RATE_LIMIT_ENABLED", "").strip()
+            else config_data["notification"].get("rate_limit", {}).get("enabled", True),
+            "MAX_THROTTLE_RETRIES": config_data["notification"]
+            .get("rate_limit", {})
+            .get("max_throttle_retries", 3),
+            "THROTTLE_BACKOFF": config_data["notification"]
+            .get("rate_limit", {})
+            .get("throttle_backoff", 2),
+            "CHANNELS": {
+                channel: {
+                    **profile,
+                    # channels: 或单个渠道下没有填写内容时 YAML 解析为 None
+                    **(
+                        (
+                            config_data["notification"].get("rate_limit", {}).get(
+                                "channels"
+                            )
+                            or {}
+                        ).get(channel)
+                        or {}
+                    ),
+                }
+                for channel, profile in CHANNEL_RATE_LIMITS.items()
+            },
+        },
+        "OUTBOX": {
+            "ENABLED": os.environ.get("OUTBOX_ENABLED", "").strip().lower()
+            in ("true", "1")
+            if os.environ.get("OUTBOX_ENABLED", "").strip()
+            else config_data["notification"].get("outbox", {}).get("enabled", False),
+            "MAX_RETRIES": config_data["notification"]
+            .get("outbox", {})
+            .get("max_retries", 3),
+            "RETRY_BACKOFF": config_data["notification"]
+            .get("outbox", {})
+            .get("retry_backoff", 2),
+            "EXPIRE_HOURS": config_data["notification"]
+            .get("outbox", {})
+            .get("expire_hours", 24),
+        },
         "WEIGHT_CONFIG": {
             "RANK_WEIGHT": config_data["weight"]["rank_weight"],
             "FREQUENCY_WEIGHT": config_data["weight"]["frequency_weight"],
@@ -467,6 +612,300 @@ class PushRecordManager:
         return result
 
 
+class NotificationOutbox:
+    """推送发件箱：按渠道持久化待发送批次，支持失败重试和断点续发
+
+    每个渠道一个 JSON 文件：pending 为按推送顺序排列的待发批次，
+    sent 记录已送达批次的幂等键（渠道 + 批次内容的哈希），已送达的批次不会重复发送。
+    读写发件箱时用 with 语句持有渠道的文件锁，避免重叠运行的两个进程各自改写同一文件。
+    """
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self.outbox_dir = Path("output") / ".outbox"
+        self.outbox_dir.mkdir(parents=True, exist_ok=True)
+        self.outbox_file = self.outbox_dir / f"{channel}.json"
+        self.lock_file = self.outbox_dir / f"{channel}.lock"
+        self._lock_fd = None
+        self.pending, self.sent = self._load()
+        self._drop_expired()
+
+    def __enter__(self) -> "NotificationOutbox":
+        """获取渠道的排他文件锁，并重新读取其他进程可能已更新的内容"""
+        if fcntl is not None:
+            self._lock_fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                print(f"发件箱：{self.channel} 正被其他进程使用，等待其完成")
+                fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        self.pending, self.sent = self._load()
+        self._drop_expired()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+    @staticmethod
+    def batch_key(channel: str, content: str) -> str:
+        """批次幂等键"""
+        return hashlib.sha1(f"{channel}\n{content}".encode("utf-8")).hexdigest()
+
+    def _load(self) -> Tuple[List[Dict], Dict[str, float]]:
+        if not self.outbox_file.exists():
+            return [], {}
+        try:
+            with open(self.outbox_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data.get("pending", []), data.get("sent", {})
+        except Exception as e:
+            print(f"读取发件箱失败 {self.outbox_file}: {e}")
+            return [], {}
+
+    def save(self) -> None:
+        """原子写入，避免中途退出留下损坏的文件"""
+        temp_file = self.outbox_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"pending": self.pending, "sent": self.sent},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(temp_file, self.outbox_file)
+
+    def _drop_expired(self) -> None:
+        """丢弃过期的积压批次和送达记录"""
+        expire_before = time.time() - CONFIG["OUTBOX"]["EXPIRE_HOURS"] * 3600
+        pending = [entry for entry in self.pending if entry["created_at"] >= expire_before]
+        if len(pending) < len(self.pending):
+            print(
+                f"发件箱丢弃 {self.channel} 过期批次 {len(self.pending) - len(pending)} 个"
+            )
+        self.pending = pending
+        self.sent = {
+            key: sent_at for key, sent_at in self.sent.items() if sent_at >= expire_before
+        }
+
+    def enqueue(self, entries: List[Dict]) -> List[str]:
+        """批次入队，返回各批次的幂等键（已送达或已在队列中的批次不重复入队）
+
+        同一次入队的批次属于同一份报告，共用 report_id。
+        """
+        keys = [self.batch_key(self.channel, entry["content"]) for entry in entries]
+        report_id = keys[0] if keys else ""
+        pending_keys = {entry["key"] for entry in self.pending}
+        now = time.time()
+
+        for key, entry in zip(keys, entries):
+            if key in self.sent or key in pending_keys:
+                continue
+            self.pending.append(
+                {
+                    **entry,
+                    "key": key,
+                    "report_id": report_id,
+                    "created_at": now,
+                    "attempts": 0,
+                }
+            )
+            pending_keys.add(key)
+
+        self.save()
+        return keys
+
+    def flush(
+        self,
+        send_batch: Callable[[Dict], bool],
+        interval: float,
+        allow_partial: bool = False,
+    ) -> int:
+        """按顺序发送待发批次，失败时指数退避重试
+
+        某批次重试用尽后，同一份报告的后续批次留到下次运行从该批次续发
+        （allow_partial 的渠道继续发送后续批次），其他报告的批次照常发送。
+        之前运行中已重试用尽的积压批次本次只再尝试一次，不会长时间阻塞新的推送。
+        返回本次成功发送的批次数。
+        """
+        max_retries = CONFIG["OUTBOX"]["MAX_RETRIES"]
+        retry_backoff = CONFIG["OUTBOX"]["RETRY_BACKOFF"]
+        sent_count = 0
+        blocked_reports = set()
+        first_send = True
+
+        for entry in list(self.pending):
+            report_id = entry.get("report_id", entry["created_at"])
+            if report_id in blocked_reports:
+                continue
+
+            if not first_send:
+                time.sleep(interval)
+            first_send = False
+
+            retries = 0 if entry["attempts"] > max_retries else max_retries
+            for attempt in range(retries + 1):
+                if attempt:
+                    delay = retry_backoff * 2 ** (attempt - 1)
+                    print(
+                        f"发件箱：{self.channel} 第 {entry['batch_num']}/{entry['total_batches']} 批次 {delay} 秒后第 {attempt}/{retries} 次重试"
+                    )
+                    time.sleep(delay)
+                if send_batch(entry):
+                    break
+                entry["attempts"] += 1
+                self.save()
+            else:
+                print(
+                    f"发件箱：{self.channel} 第 {entry['batch_num']}/{entry['total_batches']} 批次重试用尽，留待下次运行续发"
+                )
+                if not allow_partial:
+                    blocked_reports.add(report_id)
+                continue
+
+            self.pending.remove(entry)
+            self.sent[entry["key"]] = time.time()
+            self.save()
+            sent_count += 1
+
+        if self.pending:
+            print(f"发件箱：{self.channel} 还有 {len(self.pending)} 个批次待下次运行续发")
+        return sent_count
+
+
+def compute_report_digest(*parts) -> str:
+    """计算报告内容的稳定摘要：字典按键排序后序列化，内容相同则摘要相同"""
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("ascii")).hexdigest()
+
+
+class ReportDigestStore:
+    """报告摘要记录：按天保存各模式最近一次生成/推送的报告摘要
+
+    记录文件位于 output/<日期>/.report_digest.json，键形如 html:daily:summary、
+    push:daily:当日汇总，值包含摘要、对应文件和记录时间。
+    """
+
+    def __init__(self):
+        self.digest_file = Path("output") / format_date_folder() / ".report_digest.json"
+        self.records = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        if not self.digest_file.exists():
+            return {}
+        try:
+            with open(self.digest_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"读取报告摘要失败 {self.digest_file}: {e}")
+            return {}
+
+    def is_unchanged(self, key: str, digest: str) -> bool:
+        """摘要与上次记录一致（且记录的文件仍存在）时视为未变化"""
+        record = self.records.get(key)
+        if not record or record.get("digest") != digest:
+            return False
+        file_path = record.get("file")
+        return not file_path or Path(file_path).exists()
+
+    def get_file(self, key: str) -> Optional[str]:
+        return self.records.get(key, {}).get("file")
+
+    def record(self, key: str, digest: str, file_path: Optional[str] = None) -> None:
+        """记录摘要，原子写入"""
+        self.records[key] = {
+            "digest": digest,
+            "file": file_path,
+            "time": get_beijing_time().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        try:
+            self.digest_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.digest_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(self.records, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.digest_file)
+        except Exception as e:
+            print(f"保存报告摘要失败: {e}")
+
+
+class NewsScoreStore:
+    """新闻评分记录：按天保存已评分标题的分数，同一天内不重复评分
+
+    记录文件位于 output/<日期>/.news_scores.json，包含评分器关键词配置的摘要，
+    关键词配置变化后已有分数作废、重新评分。
+    """
+
+    def __init__(self, scorer_signature: str):
+        self.score_file = Path("output") / format_date_folder() / ".news_scores.json"
+        self.scorer_signature = scorer_signature
+        self.scores = self._load()
+
+    def _load(self) -> Dict[str, int]:
+        if not self.score_file.exists():
+            return {}
+        try:
+            with open(self.score_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"读取新闻评分记录失败 {self.score_file}: {e}")
+            return {}
+        if data.get("signature") != self.scorer_signature:
+            return {}
+        return data.get("scores", {})
+
+    def save(self) -> None:
+        """原子写入评分记录"""
+        try:
+            self.score_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.score_file.with_suffix(".tmp")
+            with open(temp_file, "w", encoding="utf-8") as f:
+                f.write(
+                    json.dumps(
+                        {"signature": self.scorer_signature, "scores": self.scores},
+                        ensure_ascii=False,
+                        separators=(",", ":"),
+                    )
+                )
+            os.replace(temp_file, self.score_file)
+        except Exception as e:
+            print(f"保存新闻评分记录失败: {e}")
+
+
+def score_news_titles(results: Dict) -> Optional[Dict[str, int]]:
+    """对抓取结果中的标题做关键词评分，返回 {标题: 分数}
+
+    只对当天首次出现的标题评分，已评过的直接复用当天的评分记录。
+    评分模块不可用时返回 None（不做评分过滤）。
+    """
+    if NewsScorer is None:
+        print("新闻评分：未找到 news_scorer 模块，跳过评分")
+        return None
+
+    scorer = NewsScorer({"min_score": CONFIG["MIN_SCORE"]})
+    signature = compute_report_digest(
+        {name: value for name, value in vars(scorer).items() if isinstance(value, list)}
+    )
+    store = NewsScoreStore(signature)
+
+    pending = list(
+        {
+            title
+            for titles in results.values()
+            for title in titles
+            if title not in store.scores
+        }
+    )
+    store.scores.update(zip(pending, scorer.score_titles(pending)["total"]))
+    if pending:
+        store.save()
+
+    total = len({title for titles in results.values() for title in titles})
+    print(f"新闻评分：{total} 条标题，新评分 {len(pending)} 条，复用 {total - len(pending)} 条")
+    return store.scores
+
+
 # === 数据获取 ===
 class DataFetcher:
     """数据获取器"""
@@ -778,10 +1217,72 @@ def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
     return titles_by_id, id_to_name
 
 
+class SnapshotIndex:
+    """快照成员索引：记录每个抓取批次包含哪些标题
+
+    标题 ID 为该标题在当天聚合结果 all_results[source_id] 中的插入序号，
+    current 模式据此直接取出最新批次，无需扫描全部 title_info。
+    """
+
+    def __init__(self):
+        self.titles = {}  # source_id -> [title, ...]（下标即标题 ID）
+        self.title_ids = {}  # source_id -> {title: 标题 ID}
+        self.snapshots = {}  # time_info -> {source_id: [标题 ID, ...]}
+
+    def add(self, time_info: str, source_id: str, title_data: Dict) -> None:
+        """记录一个快照中某平台的全部标题"""
+        if not title_data:
+            return
+
+        titles = self.titles.setdefault(source_id, [])
+        title_ids = self.title_ids.setdefault(source_id, {})
+        members = self.snapshots.setdefault(time_info, {}).setdefault(source_id, [])
+
+        for title in title_data:
+            title_id = title_ids.get(title)
+            if title_id is None:
+                title_id = len(titles)
+                title_ids[title] = title_id
+                titles.append(title)
+            members.append(title_id)
+
+    @property
+    def latest_time(self) -> Optional[str]:
+        """最新一个非空快照的时间"""
+        return max(self.snapshots) if self.snapshots else None
+
+    def latest_batch(self, results: Dict) -> Dict:
+        """取出最新快照中的标题，平台与标题顺序与 results 保持一致"""
+        latest_time = self.latest_time
+        if latest_time is None:
+            return {}
+
+        latest_members = self.snapshots[latest_time]
+        batch = {}
+        for source_id, source_titles in results.items():
+            member_ids = latest_members.get(source_id)
+            if not member_ids:
+                continue
+
+            titles = self.titles[source_id]
+            filtered_titles = {}
+            for title_id in sorted(member_ids):
+                title = titles[title_id]
+                if title in source_titles:
+                    filtered_titles[title] = source_titles[title]
+            if filtered_titles:
+                batch[source_id] = filtered_titles
+        return batch
+
+
 def read_all_today_titles(
     current_platform_ids: Optional[List[str]] = None,
+    snapshot_index: Optional[SnapshotIndex] = None,
 ) -> Tuple[Dict, Dict, Dict]:
-    """读取当天所有标题文件，支持按当前监控平台过滤"""
+    """读取当天所有标题文件，支持按当前监控平台过滤
+
+    传入 snapshot_index 时同时记录每个快照的标题成员。
+    """
     date_folder = format_date_folder()
     txt_dir = Path("output") / date_folder / "txt"
 
@@ -818,6 +1319,8 @@ def read_all_today_titles(
             process_source_data(
                 source_id, title_data, time_info, all_results, title_info
             )
+            if snapshot_index is not None:
+                snapshot_index.add(time_info, source_id, title_data)
 
     return all_results, final_id_to_name, title_info
 
@@ -895,6 +1398,134 @@ def process_source_data(
                     title_info[source_id][title]["mobileUrl"] = mobile_url
 
 
+TITLE_NOISE_PATTERN = re.compile(r"[\W_]+")
+
+# MinHash 使用的哈希族 (a * x + b) mod p，固定种子保证跨进程结果一致
+MINHASH_PRIME = (1 << 61) - 1
+_minhash_random = random.Random(20251101)
+MINHASH_PERMUTATIONS = [
+    (_minhash_random.randrange(1, MINHASH_PRIME), _minhash_random.randrange(MINHASH_PRIME))
+    for _ in range(16)
+]
+
+
+def normalize_title(title: str) -> str:
+    """标题规范化：统一全半角、转小写、去除空白和标点，用于跨平台识别同一条新闻"""
+    if not isinstance(title, str):
+        title = str(title)
+    return TITLE_NOISE_PATTERN.sub("", unicodedata.normalize("NFKC", title).lower())
+
+
+class TitleDedupIndex:
+    """跨平台标题去重索引
+
+    先按规范化标题精确归并，再用字符二元组 MinHash + LSH 分桶查找近似重复，
+    候选标题的 Jaccard 相似度达到阈值才并入同一个簇。
+    """
+
+    BAND_ROWS = 2
+    MIN_FUZZY_LENGTH = 8
+
+    def __init__(self, similarity_threshold: float = 0.6):
+        self.similarity_threshold = similarity_threshold
+        self.clusters: List[List[Tuple[str, str]]] = []
+        self._cluster_shingles: List[set] = []
+        self._cluster_sources: List[set] = []
+        self._canonical_to_cluster: Dict[str, int] = {}
+        self._title_to_cluster: Dict[Tuple[str, str], int] = {}
+        self._band_buckets: Dict[Tuple, List[int]] = {}
+
+    @staticmethod
+    def _shingles(canonical: str) -> set:
+        if len(canonical) < 2:
+            return {canonical}
+        return {canonical[i : i + 2] for i in range(len(canonical) - 1)}
+
+    def _signature_bands(self, shingles: set) -> List[Tuple]:
+        hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+        signature = [
+            min((a * value + b) % MINHASH_PRIME for value in hashes)
+            for a, b in MINHASH_PERMUTATIONS
+        ]
+        rows = self.BAND_ROWS
+        return [
+            (band, tuple(signature[band * rows : (band + 1) * rows]))
+            for band in range(len(signature) // rows)
+        ]
+
+    def _find_similar_cluster(
+        self, source_id: str, shingles: set, bands: List[Tuple]
+    ) -> Optional[int]:
+        checked = set()
+        for band_key in bands:
+            for cluster_id in self._band_buckets.get(band_key, []):
+                if cluster_id in checked:
+                    continue
+                checked.add(cluster_id)
+                # 同一平台内的相似标题视为不同新闻，只做跨平台归并
+                if source_id in self._cluster_sources[cluster_id]:
+                    continue
+                other = self._cluster_shingles[cluster_id]
+                similarity = len(shingles & other) / len(shingles | other)
+                if similarity >= self.similarity_threshold:
+                    return cluster_id
+        return None
+
+    def add(self, source_id: str, title: str) -> int:
+        """加入标题并返回所属簇 ID"""
+        key = (source_id, title)
+        if key in self._title_to_cluster:
+            return self._title_to_cluster[key]
+
+        canonical = normalize_title(title)
+        cluster_id = self._canonical_to_cluster.get(canonical)
+
+        bands = None
+        if cluster_id is None and len(canonical) >= self.MIN_FUZZY_LENGTH:
+            shingles = self._shingles(canonical)
+            bands = self._signature_bands(shingles)
+            cluster_id = self._find_similar_cluster(source_id, shingles, bands)
+
+        if cluster_id is None:
+            cluster_id = len(self.clusters)
+            self.clusters.append([])
+            self._cluster_shingles.append(self._shingles(canonical))
+            self._cluster_sources.append(set())
+            if bands is not None:
+                for band_key in bands:
+                    self._band_buckets.setdefault(band_key, []).append(cluster_id)
+
+        self._canonical_to_cluster.setdefault(canonical, cluster_id)
+        self._title_to_cluster[key] = cluster_id
+        self.clusters[cluster_id].append(key)
+        self._cluster_sources[cluster_id].add(source_id)
+        return cluster_id
+
+    def cluster_of(self, source_id: str, title: str) -> Optional[int]:
+        """查询标题所属簇 ID，未收录时返回 None"""
+        return self._title_to_cluster.get((source_id, title))
+
+    def members(self, cluster_id: int) -> List[Tuple[str, str]]:
+        """返回簇内全部 (source_id, title)"""
+        return self.clusters[cluster_id]
+
+    @property
+    def title_count(self) -> int:
+        return len(self._title_to_cluster)
+
+    def __len__(self) -> int:
+        return len(self.clusters)
+
+
+def build_title_dedup_index(results: Dict) -> TitleDedupIndex:
+    """从抓取结果构建标题去重索引"""
+    dedup_index = TitleDedupIndex()
+    for source_id, titles_data in results.items():
+        for title in titles_data:
+            dedup_index.add(source_id, title)
+    return dedup_index
+
+
 def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
     """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
     date_folder = format_date_folder()
@@ -959,82 +1590,151 @@ def calculate_news_weight(
     title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
 ) -> float:
     """计算新闻权重，用于排序"""
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
-
-    count = title_data.get("count", len(ranks))
-    weight_config = CONFIG["WEIGHT_CONFIG"]
-
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
+    return shared_weights.calculate_news_weight(
+        title_data, rank_threshold, CONFIG["WEIGHT_CONFIG"]
+    )
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
 
-    # 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+def calculate_news_weights(
+    titles: List[Dict], rank_threshold: int = CONFIG["RANK_THRESHOLD"]
+) -> List[float]:
+    """批量计算新闻权重（安装 numpy 时使用向量化计算）"""
+    return shared_weights.calculate_news_weights(
+        titles, rank_threshold, CONFIG["WEIGHT_CONFIG"]
+    )
 
-    # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
 
-    total_weight = (
-        rank_weight * weight_config["RANK_WEIGHT"]
-        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
-        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+def compile_word_groups(
+    word_groups: List[Dict], filter_words: List[str]
+) -> Tuple[Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...], Tuple[str, ...]]:
+    """预先小写化词组与过滤词，得到便于批量匹配和跨进程传递的紧凑结构"""
+    compiled_groups = tuple(
+        (
+            tuple(word.lower() for word in group["required"]),
+            tuple(word.lower() for word in group["normal"]),
+        )
+        for group in word_groups
     )
+    compiled_filters = tuple(word.lower() for word in filter_words)
+    return compiled_groups, compiled_filters
 
-    return total_weight
 
-
-def matches_word_groups(
-    title: str, word_groups: List[Dict], filter_words: List[str]
-) -> bool:
-    """检查标题是否匹配词组规则"""
+def match_word_group_index(
+    title: str,
+    compiled_groups: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...],
+    compiled_filters: Tuple[str, ...],
+) -> int:
+    """返回标题命中的第一个词组下标，未命中返回 -1"""
     # 防御性类型检查：确保 title 是有效字符串
     if not isinstance(title, str):
         title = str(title) if title is not None else ""
     if not title.strip():
-        return False
+        return -1
 
     # 如果没有配置词组，则匹配所有标题（支持显示全部新闻）
-    if not word_groups:
-        return True
+    if not compiled_groups:
+        return 0
 
     title_lower = title.lower()
 
     # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
+    if any(filter_word in title_lower for filter_word in compiled_filters):
+        return -1
 
     # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
+    for index, (required_words, normal_words) in enumerate(compiled_groups):
         # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
+        if required_words and not all(
+            req_word in title_lower for req_word in required_words
+        ):
+            continue
 
         # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
+        if normal_words and not any(
+            normal_word in title_lower for normal_word in normal_words
+        ):
+            continue
+
+        return index
+
+    return -1
+
+
+def matches_word_groups(
+    title: str, word_groups: List[Dict], filter_words: List[str]
+) -> bool:
+    """检查单条标题是否匹配词组规则（批量匹配时应先 compile_word_groups 再逐条调用 match_word_group_index）"""
+    compiled_groups, compiled_filters = compile_word_groups(word_groups, filter_words)
+    return match_word_group_index(title, compiled_groups, compiled_filters) >= 0
+
+
+# 子进程内的已编译词组（由进程池 initializer 设置，避免每个任务重复传输）
+_worker_compiled_groups = None
+_worker_compiled_filters = None
+
+
+def _init_match_worker(compiled_groups, compiled_filters) -> None:
+    """进程池初始化：缓存已编译的词组与过滤词"""
+    global _worker_compiled_groups, _worker_compiled_filters
+    _worker_compiled_groups = compiled_groups
+    _worker_compiled_filters = compiled_filters
+
+
+def _match_titles_worker(titles: List[str]) -> array:
+    """子进程任务：返回一个平台全部标题的词组下标"""
+    return array(
+        "i",
+        [
+            match_word_group_index(
+                title, _worker_compiled_groups, _worker_compiled_filters
             )
-            if not any_normal_present:
-                continue
+            for title in titles
+        ],
+    )
 
-        return True
 
-    return False
+def match_results_to_groups(
+    results: Dict,
+    word_groups: List[Dict],
+    filter_words: List[str],
+    workers: int = 0,
+) -> Dict[str, List[int]]:
+    """计算每个平台每条标题命中的词组下标（顺序与 results 中标题顺序一致）
+
+    workers > 1 且平台数、CPU 核数均大于 1 时按平台分片到进程池并行匹配：
+    每个任务只传输标题字符串列表，返回紧凑的整型数组，
+    按提交顺序收集，结果与串行匹配完全一致。
+    """
+    compiled_groups, compiled_filters = compile_word_groups(word_groups, filter_words)
+
+    source_ids = [source_id for source_id, titles in results.items() if titles]
+    workers = min(workers, len(source_ids), os.cpu_count() or 1)
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_match_worker,
+                initargs=(compiled_groups, compiled_filters),
+            ) as executor:
+                shards = executor.map(
+                    _match_titles_worker,
+                    [list(results[source_id]) for source_id in source_ids],
+                )
+                group_indices = {
+                    source_id: list(indices)
+                    for source_id, indices in zip(source_ids, shards)
+                }
+            return group_indices
+        except (OSError, BrokenProcessPool) as e:
+            print(f"并行匹配不可用，改为串行匹配: {e}")
+
+    return {
+        source_id: [
+            match_word_group_index(title, compiled_groups, compiled_filters)
+            for title in titles
+        ]
+        for source_id, titles in results.items()
+    }
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -1047,47 +1747,104 @@ def format_time_display(first_time: str, last_time: str) -> str:
         return f"[{first_time} ~ {last_time}]"
 
 
-def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
-    """统一的排名格式化方法"""
+# 各格式的排名高亮标记，未列出的格式使用 Markdown 加粗
+RANK_HIGHLIGHT_MARKUP = {
+    "html": ("<font color='red'><strong>", "</strong></font>"),
+    "feishu": ("<font color='red'>**", "**</font>"),
+    "dingtalk": ("**", "**"),
+    "wework": ("**", "**"),
+    "telegram": ("<b>", "</b>"),
+    "slack": ("*", "*"),
+}
+
+
+def format_rank_range(ranks: List[int], rank_threshold: int) -> Tuple[str, bool]:
+    """计算排名区间文本（如 [1 - 5]）及是否需要高亮，无排名时返回空串"""
     if not ranks:
-        return ""
+        return "", False
 
-    unique_ranks = sorted(set(ranks))
-    min_rank = unique_ranks[0]
-    max_rank = unique_ranks[-1]
-
-    if format_type == "html":
-        highlight_start = "<font color='red'><strong>"
-        highlight_end = "</strong></font>"
-    elif format_type == "feishu":
-        highlight_start = "<font color='red'>**"
-        highlight_end = "**</font>"
-    elif format_type == "dingtalk":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "wework":
-        highlight_start = "**"
-        highlight_end = "**"
-    elif format_type == "telegram":
-        highlight_start = "<b>"
-        highlight_end = "</b>"
-    elif format_type == "slack":
-        highlight_start = "*"
-        highlight_end = "*"
+    min_rank = min(ranks)
+    max_rank = max(ranks)
+    if min_rank == max_rank:
+        rank_text = f"[{min_rank}]"
     else:
-        highlight_start = "**"
-        highlight_end = "**"
+        rank_text = f"[{min_rank} - {max_rank}]"
+    return rank_text, min_rank <= rank_threshold
 
-    if min_rank <= rank_threshold:
-        if min_rank == max_rank:
-            return f"{highlight_start}[{min_rank}]{highlight_end}"
-        else:
-            return f"{highlight_start}[{min_rank} - {max_rank}]{highlight_end}"
+
+def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str) -> str:
+    """统一的排名格式化方法"""
+    rank_text, highlight = format_rank_range(ranks, rank_threshold)
+    if not highlight:
+        return rank_text
+
+    highlight_start, highlight_end = RANK_HIGHLIGHT_MARKUP.get(
+        format_type, ("**", "**")
+    )
+    return f"{highlight_start}{rank_text}{highlight_end}"
+
+
+def select_top_news(
+    titles: List[Dict],
+    rank_threshold: int,
+    max_count: int = 0,
+    weights: Optional[List[float]] = None,
+) -> List[Dict]:
+    """按权重排序新闻，max_count > 0 时用堆只选出前 N 条
+
+    排序键为 (-权重, 最高排名, -出现次数)，权重可由调用方批量预先计算；
+    附带原始下标保证与 sorted() 的稳定排序结果完全一致。
+    """
+    if weights is None:
+        weights = calculate_news_weights(titles, rank_threshold)
+
+    decorated = [
+        (
+            -weights[index],
+            min(title_data["ranks"]) if title_data["ranks"] else 999,
+            -title_data["count"],
+            index,
+        )
+        for index, title_data in enumerate(titles)
+    ]
+
+    if 0 < max_count < len(decorated):
+        selected = heapq.nsmallest(max_count, decorated)
     else:
-        if min_rank == max_rank:
-            return f"[{min_rank}]"
-        else:
-            return f"[{min_rank} - {max_rank}]"
+        selected = sorted(decorated)
+
+    return [titles[item[-1]] for item in selected]
+
+
+def merge_cluster_member(
+    entry: Dict,
+    source_name: str,
+    title_data: Dict,
+    info: Optional[Dict],
+    is_new: bool,
+) -> None:
+    """把同簇其他平台的标题合并到簇的首条记录：来源、排名、出现次数、首末时间"""
+    if source_name not in entry["merged_sources"]:
+        entry["merged_sources"].append(source_name)
+        entry["source_name"] = " / ".join(entry["merged_sources"])
+
+    info = info or {}
+    ranks = info.get("ranks") or title_data.get("ranks") or []
+    if ranks:
+        entry["ranks"] = entry["ranks"] + ranks
+    entry["count"] += info.get("count", 1)
+
+    first_time = info.get("first_time", "")
+    last_time = info.get("last_time", "")
+    if first_time and (not entry["first_time"] or first_time < entry["first_time"]):
+        entry["first_time"] = first_time
+    if last_time > entry["last_time"]:
+        entry["last_time"] = last_time
+    entry["time_display"] = format_time_display(
+        entry["first_time"], entry["last_time"]
+    )
+
+    entry["is_new"] = entry["is_new"] or is_new
 
 
 def count_word_frequency(
@@ -1099,8 +1856,20 @@ def count_word_frequency(
     rank_threshold: int = CONFIG["RANK_THRESHOLD"],
     new_titles: Optional[Dict] = None,
     mode: str = "daily",
+    dedup_index: Optional[TitleDedupIndex] = None,
+    parallel_workers: int = 0,
+    snapshot_index: Optional[SnapshotIndex] = None,
+    title_scores: Optional[Dict[str, int]] = None,
+    min_score: int = 0,
 ) -> Tuple[List[Dict], int]:
-    """统计词频，支持必须词、频率词、过滤词，并标记新增标题"""
+    """统计词频，支持必须词、频率词、过滤词，并标记新增标题
+
+    传入 dedup_index 时按标题簇统计：同一簇只匹配和展示一次，
+    其余平台重复标题的来源、排名、出现次数和时间合并到首条记录中。
+    parallel_workers > 1 时按平台分片到进程池并行匹配，结果与串行一致。
+    current 模式下传入 snapshot_index 时直接按最新快照取出当前榜单。
+    传入 title_scores 时低于 min_score 的标题不参与统计，其余条目带上 score。
+    """
 
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
@@ -1122,7 +1891,13 @@ def count_word_frequency(
             all_news_are_new = True
     elif mode == "current":
         # current 模式：只处理当前时间批次的新闻，但统计信息来自全部历史
-        if title_info:
+        if snapshot_index is not None and snapshot_index.latest_time:
+            latest_time = snapshot_index.latest_time
+            results_to_process = snapshot_index.latest_batch(results)
+            print(
+                f"当前榜单模式：最新时间 {latest_time}，筛选出 {sum(len(titles) for titles in results_to_process.values())} 条当前榜单新闻"
+            )
+        elif title_info:
             latest_time = None
             for source_titles in title_info.values():
                 for title_data in source_titles.values():
@@ -1169,6 +1944,8 @@ def count_word_frequency(
     total_titles = 0
     processed_titles = {}
     matched_new_count = 0
+    # 簇 ID -> 已生成的新闻条目（None 表示该簇未匹配任何词组）
+    cluster_entries = {}
 
     if title_info is None:
         title_info = {}
@@ -1179,22 +1956,50 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    # 标题与词组的匹配（可按平台分片并行）
+    group_indices = match_results_to_groups(
+        results_to_process, word_groups, filter_words, parallel_workers
+    )
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
         if source_id not in processed_titles:
             processed_titles[source_id] = {}
 
-        for title, title_data in titles_data.items():
+        source_group_indices = group_indices[source_id]
+        for title_position, (title, title_data) in enumerate(titles_data.items()):
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
+            # 同簇标题已处理过：只合并来源，不再重复匹配和统计
+            cluster_id = (
+                dedup_index.cluster_of(source_id, title) if dedup_index else None
             )
+            if cluster_id is not None and cluster_id in cluster_entries:
+                entry = cluster_entries[cluster_id]
+                if entry is not None:
+                    merge_cluster_member(
+                        entry,
+                        id_to_name.get(source_id, source_id),
+                        title_data,
+                        title_info.get(source_id, {}).get(title),
+                        all_news_are_new
+                        or title in new_titles.get(source_id, {}),
+                    )
+                continue
+
+            # 使用统一的匹配逻辑（词组下标已预先计算）
+            group_index = source_group_indices[title_position]
 
-            if not matches_frequency_words:
+            # 评分低于阈值的新闻视为未匹配
+            score = title_scores.get(title) if title_scores is not None else None
+            if score is not None and score < min_score:
+                group_index = -1
+
+            if group_index < 0:
+                if cluster_id is not None:
+                    cluster_entries[cluster_id] = None
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -1207,115 +2012,69 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
-
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+            # 命中的词组
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
+
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
+
+            # 从历史统计信息中获取完整数据
+            if title_info and source_id in title_info and title in title_info[source_id]:
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            entry = {
+                "title": title,
+                "source_name": source_name,
+                "first_time": first_time,
+                "last_time": last_time,
+                "time_display": time_display,
+                "count": count_info,
+                "ranks": ranks,
+                "rank_threshold": rank_threshold,
+                "url": url,
+                "mobileUrl": mobile_url,
+                "is_new": is_new,
+            }
+            if score is not None:
+                entry["score"] = score
+            word_stats[group_key]["titles"][source_id].append(entry)
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            if cluster_id is not None:
+                entry["merged_sources"] = [source_name]
+                cluster_entries[cluster_id] = entry
 
-                break
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1376,20 +2135,24 @@ def count_word_frequency(
         group["group_key"]: group.get("max_count", 0) for group in word_groups
     }
 
+    # 所有词组的新闻一次性批量计算权重
+    group_titles = {}
     for group_key, data in word_stats.items():
         all_titles = []
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
+        group_titles[group_key] = all_titles
 
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
+    all_weights = calculate_news_weights(
+        [title for titles in group_titles.values() for title in titles],
+        rank_threshold,
+    )
+
+    weight_offset = 0
+    for group_key, data in word_stats.items():
+        all_titles = group_titles[group_key]
+        group_weights = all_weights[weight_offset : weight_offset + len(all_titles)]
+        weight_offset += len(all_titles)
 
         # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
@@ -1397,8 +2160,10 @@ def count_word_frequency(
             # 使用全局配置
             group_max_count = CONFIG.get("MAX_NEWS_PER_KEYWORD", 0)
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        # 按权重排序（有数量限制时只选出前 N 条）
+        sorted_titles = select_top_news(
+            all_titles, rank_threshold, group_max_count, group_weights
+        )
 
         stats.append(
             {
@@ -1432,8 +2197,15 @@ def prepare_report_data(
     new_titles: Optional[Dict] = None,
     id_to_name: Optional[Dict] = None,
     mode: str = "daily",
+    title_scores: Optional[Dict[str, int]] = None,
+    min_score: int = 0,
+    dedup_index: Optional[TitleDedupIndex] = None,
 ) -> Dict:
-    """准备报告数据"""
+    """准备报告数据
+
+    传入 title_scores 时新增新闻与词频统计使用同一评分阈值，低于 min_score 的标题不展示。
+    传入 dedup_index 时新增新闻按标题簇去重，同一簇只展示首次出现的一条。
+    """
     processed_new_titles = []
 
     # 在增量模式下隐藏新增新闻区域
@@ -1444,11 +2216,36 @@ def prepare_report_data(
         filtered_new_titles = {}
         if new_titles and id_to_name:
             word_groups, filter_words = load_frequency_words()
+            # 词组只编译一次，逐条标题直接匹配
+            compiled_groups, compiled_filters = compile_word_groups(
+                word_groups, filter_words
+            )
+            seen_clusters = set()
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
+                    cluster_id = (
+                        dedup_index.cluster_of(source_id, title)
+                        if dedup_index
+                        else None
+                    )
+                    if cluster_id is not None and cluster_id in seen_clusters:
+                        continue
+                    # 评分低于阈值的新闻不计入新增
+                    score = (
+                        title_scores.get(title) if title_scores is not None else None
+                    )
+                    if score is not None and score < min_score:
+                        continue
+                    if (
+                        match_word_group_index(
+                            title, compiled_groups, compiled_filters
+                        )
+                        >= 0
+                    ):
                         filtered_titles[title] = title_data
+                        if cluster_id is not None:
+                            seen_clusters.add(cluster_id)
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
 
@@ -1485,6 +2282,7 @@ def prepare_report_data(
                     )
 
     processed_stats = []
+    show_score = CONFIG["SHOW_SCORE_IN_REPORT"]
     for stat in stats:
         if stat["count"] <= 0:
             continue
@@ -1502,6 +2300,8 @@ def prepare_report_data(
                 "mobile_url": title_data.get("mobileUrl", ""),
                 "is_new": title_data.get("is_new", False),
             }
+            if show_score and "score" in title_data:
+                processed_title["score"] = title_data["score"]
             processed_titles.append(processed_title)
 
         processed_stats.append(
@@ -1523,158 +2323,223 @@ def prepare_report_data(
     }
 
 
-def format_title_for_platform(
-    platform: str, title_data: Dict, show_source: bool = True
-) -> str:
-    """统一的标题格式化方法"""
-    rank_display = format_rank_display(
-        title_data["ranks"], title_data["rank_threshold"], platform
-    )
+# 推送渠道的新闻条目标记：链接、来源、排名高亮、时间与次数后缀
+_MARKDOWN_ITEM_MARKUP = {
+    "link": "[{title}]({url})",
+    "source": "[{source}] ",
+    "highlight": ("**", "**"),
+    "time": " - {time}",
+    "count": " ({count}次)",
+    "score": " ⭐{score}分",
+}
 
-    link_url = title_data["mobile_url"] or title_data["url"]
+NEWS_ITEM_MARKUP = {
+    "feishu": {
+        **_MARKDOWN_ITEM_MARKUP,
+        "source": "<font color='grey'>[{source}]</font> ",
+        "highlight": ("<font color='red'>**", "**</font>"),
+        "time": " <font color='grey'>- {time}</font>",
+        "count": " <font color='green'>({count}次)</font>",
+        "score": " <font color='orange'>⭐{score}分</font>",
+    },
+    "dingtalk": _MARKDOWN_ITEM_MARKUP,
+    "wework": _MARKDOWN_ITEM_MARKUP,
+    "bark": _MARKDOWN_ITEM_MARKUP,
+    "telegram": {
+        **_MARKDOWN_ITEM_MARKUP,
+        "link": '<a href="{url}">{title}</a>',
+        "escape_link_title": True,
+        "highlight": ("<b>", "</b>"),
+        "time": " <code>- {time}</code>",
+        "count": " <code>({count}次)</code>",
+        "score": " <code>⭐{score}分</code>",
+    },
+    "ntfy": {
+        **_MARKDOWN_ITEM_MARKUP,
+        "time": " `- {time}`",
+        "count": " `({count}次)`",
+    },
+    "slack": {
+        **_MARKDOWN_ITEM_MARKUP,
+        # Slack 链接格式: <url|text>，加粗使用单个 *
+        "link": "<{url}|{title}>",
+        "highlight": ("*", "*"),
+        "time": " `- {time}`",
+        "count": " `({count}次)`",
+    },
+}
 
-    cleaned_title = clean_title(title_data["title"])
 
-    if platform == "feishu":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
+def build_news_item(title_data: Dict) -> Dict:
+    """构建与渠道无关的新闻条目：清理标题、确定链接、预先计算排名区间"""
+    rank_text, rank_highlight = format_rank_range(
+        title_data["ranks"], title_data["rank_threshold"]
+    )
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+    return {
+        "title": clean_title(title_data["title"]),
+        "link_url": title_data["mobile_url"] or title_data["url"],
+        "source_name": title_data["source_name"],
+        "is_new": bool(title_data.get("is_new")),
+        "rank_text": rank_text,
+        "rank_highlight": rank_highlight,
+        "time_display": title_data["time_display"],
+        "count": title_data["count"],
+        "score": title_data.get("score"),
+    }
 
-        if show_source:
-            result = f"<font color='grey'>[{title_data['source_name']}]</font> {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <font color='grey'>- {title_data['time_display']}</font>"
-        if title_data["count"] > 1:
-            result += f" <font color='green'>({title_data['count']}次)</font>"
-
-        return result
-
-    elif platform == "dingtalk":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
-
-        return result
-
-    elif platform in ("wework", "bark"):
-        # WeWork 和 Bark 使用 markdown 格式
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
-        else:
-            formatted_title = cleaned_title
-
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
-
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
-
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" - {title_data['time_display']}"
-        if title_data["count"] > 1:
-            result += f" ({title_data['count']}次)"
-
-        return result
-
-    elif platform == "telegram":
-        if link_url:
-            formatted_title = f'<a href="{link_url}">{html_escape(cleaned_title)}</a>'
-        else:
-            formatted_title = cleaned_title
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+def render_news_item(
+    platform: str,
+    item: Dict,
+    show_source: bool = True,
+    is_new: Optional[bool] = None,
+) -> str:
+    """按渠道标记渲染新闻条目，未知渠道返回纯文本标题
 
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
+    is_new 为 None 时使用条目自身的新增标记。
+    """
+    markup = NEWS_ITEM_MARKUP.get(platform)
+    if markup is None:
+        return item["title"]
+
+    if item["link_url"]:
+        title = item["title"]
+        if markup.get("escape_link_title"):
+            title = html_escape(title)
+        formatted_title = markup["link"].format(title=title, url=item["link_url"])
+    else:
+        formatted_title = item["title"]
 
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" <code>- {title_data['time_display']}</code>"
-        if title_data["count"] > 1:
-            result += f" <code>({title_data['count']}次)</code>"
+    if is_new is None:
+        is_new = item["is_new"]
+    title_prefix = "🆕 " if is_new else ""
 
-        return result
+    if show_source:
+        result = (
+            markup["source"].format(source=item["source_name"])
+            + title_prefix
+            + formatted_title
+        )
+    else:
+        result = title_prefix + formatted_title
 
-    elif platform == "ntfy":
-        if link_url:
-            formatted_title = f"[{cleaned_title}]({link_url})"
+    if item["rank_text"]:
+        if item["rank_highlight"]:
+            highlight_start, highlight_end = markup["highlight"]
+            result += f" {highlight_start}{item['rank_text']}{highlight_end}"
         else:
-            formatted_title = cleaned_title
+            result += f" {item['rank_text']}"
+    if item["time_display"]:
+        result += markup["time"].format(time=item["time_display"])
+    if item["count"] > 1:
+        result += markup["count"].format(count=item["count"])
+    if item["score"] is not None:
+        result += markup["score"].format(score=item["score"])
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
+    return result
 
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
 
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" `- {title_data['time_display']}`"
-        if title_data["count"] > 1:
-            result += f" `({title_data['count']}次)`"
+class NewsFormatCache:
+    """单次运行内的新闻片段缓存
 
-        return result
+    片段按 (条目, 标记族) 缓存：共用同一份标记的渠道（钉钉、企业微信、Bark）
+    属于同一标记族，同一条新闻在多个渠道出现时每个标记族只格式化一次。
+    缓存随中间表示一起创建和丢弃，不跨运行保留。
+    """
 
-    elif platform == "slack":
-        # Slack 使用 mrkdwn 格式
-        if link_url:
-            # Slack 链接格式: <url|text>
-            formatted_title = f"<{link_url}|{cleaned_title}>"
-        else:
-            formatted_title = cleaned_title
+    def __init__(self):
+        self._items = {}
+        self._fragments = {}
+
+    def item(self, title_data: Dict) -> Dict:
+        """返回标题数据对应的新闻条目，同一标题数据只构建一次"""
+        key = id(title_data)
+        cached = self._items.get(key)
+        if cached is None:
+            # 同时保存标题数据本身，避免对象释放后 id 被复用
+            cached = (title_data, build_news_item(title_data))
+            self._items[key] = cached
+        return cached[1]
+
+    def render(
+        self,
+        platform: str,
+        item: Dict,
+        show_source: bool = True,
+        is_new: Optional[bool] = None,
+    ) -> str:
+        """按渠道渲染新闻条目，同一标记族命中缓存时直接返回"""
+        markup = NEWS_ITEM_MARKUP.get(platform)
+        if markup is None:
+            return item["title"]
+
+        if is_new is None:
+            is_new = item["is_new"]
+        key = (id(item), id(markup), show_source, is_new)
+        cached = self._fragments.get(key)
+        if cached is None:
+            cached = (item, render_news_item(platform, item, show_source, is_new))
+            self._fragments[key] = cached
+        return cached[1]
+
+
+def build_report_ir(report_data: Dict) -> Dict:
+    """将报告数据渲染为与渠道无关的中间表示，每次运行只需构建一次
+
+    各推送渠道在此基础上套用自己的标记和字节限制，
+    不再各自重复清理标题、计算排名区间；渲染好的片段缓存在 format_cache 中。
+    """
+    format_cache = NewsFormatCache()
+    return {
+        "total_titles": sum(
+            len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+        ),
+        "stats": [
+            {
+                "word": stat["word"],
+                "count": stat["count"],
+                "items": [
+                    format_cache.item(title_data) for title_data in stat["titles"]
+                ],
+            }
+            for stat in report_data["stats"]
+        ],
+        "new_titles": [
+            {
+                "source_name": source_data["source_name"],
+                "items": [
+                    format_cache.item(title_data)
+                    for title_data in source_data["titles"]
+                ],
+            }
+            for source_data in report_data["new_titles"]
+        ],
+        "failed_ids": report_data["failed_ids"],
+        "total_new_count": report_data["total_new_count"],
+        "format_cache": format_cache,
+    }
 
-        title_prefix = "🆕 " if title_data.get("is_new") else ""
 
-        if show_source:
-            result = f"[{title_data['source_name']}] {title_prefix}{formatted_title}"
-        else:
-            result = f"{title_prefix}{formatted_title}"
+def format_title_for_platform(
+    platform: str,
+    title_data: Dict,
+    show_source: bool = True,
+    format_cache: Optional[NewsFormatCache] = None,
+) -> str:
+    """统一的标题格式化方法
 
-        # 排名（使用 * 加粗）
-        rank_display = format_rank_display(
-            title_data["ranks"], title_data["rank_threshold"], "slack"
-        )
-        if rank_display:
-            result += f" {rank_display}"
-        if title_data["time_display"]:
-            result += f" `- {title_data['time_display']}`"
-        if title_data["count"] > 1:
-            result += f" `({title_data['count']}次)`"
+    传入 format_cache 时，同一标题数据在同一标记族下只格式化一次。
+    """
+    if platform in NEWS_ITEM_MARKUP:
+        if format_cache is None:
+            return render_news_item(platform, build_news_item(title_data), show_source)
+        item = format_cache.item(title_data)
+        return format_cache.render(platform, item, show_source)
 
-        return result
+    cleaned_title = clean_title(title_data["title"])
 
-    elif platform == "html":
+    if platform == "html":
         rank_display = format_rank_display(
             title_data["ranks"], title_data["rank_threshold"], "html"
         )
@@ -1699,6 +2564,8 @@ def format_title_for_platform(
             formatted_title += f" <font color='grey'>- {escaped_time}</font>"
         if title_data["count"] > 1:
             formatted_title += f" <font color='green'>({title_data['count']}次)</font>"
+        if title_data.get("score") is not None:
+            formatted_title += f" <font color='orange'>⭐{title_data['score']}分</font>"
 
         if title_data.get("is_new"):
             formatted_title = f"<div class='new-title'>🆕 {formatted_title}</div>"
@@ -1718,6 +2585,9 @@ def generate_html_report(
     mode: str = "daily",
     is_daily_summary: bool = False,
     update_info: Optional[Dict] = None,
+    title_scores: Optional[Dict[str, int]] = None,
+    min_score: int = 0,
+    dedup_index: Optional[TitleDedupIndex] = None,
 ) -> str:
     """生成HTML报告"""
     if is_daily_summary:
@@ -1730,34 +2600,57 @@ def generate_html_report(
     else:
         filename = f"{format_time_filename()}.html"
 
-    file_path = get_output_path("html", filename)
+    report_data = prepare_report_data(
+        stats,
+        failed_ids,
+        new_titles,
+        id_to_name,
+        mode,
+        title_scores,
+        min_score,
+        dedup_index,
+    )
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+    # 分段报告：每次运行只写新增/变化部分的片段，不再生成完整的时间戳报告
+    if CONFIG["HTML_FRAGMENTS"] and not is_daily_summary:
+        return generate_html_fragment_report(report_data, update_info)
 
-    html_content = render_html_content(
-        report_data, total_titles, is_daily_summary, mode, update_info
-    )
+    # 报告内容与上次相同时沿用已生成的文件，跳过渲染和写入
+    digest_store = None
+    if CONFIG["SKIP_UNCHANGED_REPORT"]:
+        digest_key = f"html:{mode}:{'summary' if is_daily_summary else 'realtime'}"
+        digest = compute_report_digest(
+            report_data, total_titles, is_daily_summary, update_info
+        )
+        digest_store = ReportDigestStore()
+        if digest_store.is_unchanged(digest_key, digest):
+            file_path = digest_store.get_file(digest_key)
+            print(f"报告内容未变化，沿用已生成的HTML: {file_path}")
+            if is_daily_summary and file_path:
+                # 首页可能已被其他模式的汇总覆盖，始终用本次沿用的报告刷新
+                shutil.copyfile(file_path, Path("index.html"))
+            return file_path
+
+    file_path = get_output_path("html", filename)
 
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        write_html_content(
+            f, report_data, total_titles, is_daily_summary, mode, update_info
+        )
 
     if is_daily_summary:
-        root_file_path = Path("index.html")
-        with open(root_file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+        # 汇总报告同时作为根目录首页，直接复制已写好的文件，避免二次渲染
+        shutil.copyfile(file_path, Path("index.html"))
+
+    if digest_store is not None:
+        digest_store.record(digest_key, digest, file_path)
 
     return file_path
 
 
-def render_html_content(
-    report_data: Dict,
-    total_titles: int,
-    is_daily_summary: bool = False,
-    mode: str = "daily",
-    update_info: Optional[Dict] = None,
-) -> str:
-    """渲染HTML内容"""
-    html = """
+# HTML 报告的静态部分（头部、样式、保存图片脚本）只在模块加载时构造一次，
+# 渲染时直接输出，不再随每份报告重复拼接
+HTML_REPORT_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -2002,6 +2895,12 @@ def render_html_content(
                 font-weight: 500;
             }
             
+            .score-info {
+                color: #d97706;
+                font-size: 11px;
+                font-weight: 500;
+            }
+            
             .news-title {
                 font-size: 15px;
                 line-height: 1.4;
@@ -2201,320 +3100,82 @@ def render_html_content(
                         <span class="info-label">报告类型</span>
                         <span class="info-value">"""
 
-    # 处理报告类型显示
-    if is_daily_summary:
-        if mode == "current":
-            html += "当前榜单"
-        elif mode == "incremental":
-            html += "增量模式"
-        else:
-            html += "当日汇总"
-    else:
-        html += "实时分析"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">新闻总数</span>
-                        <span class="info-value">"""
-
-    html += f"{total_titles} 条"
-
-    # 计算筛选后的热点新闻数量
-    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">热点新闻</span>
-                        <span class="info-value">"""
-
-    html += f"{hot_news_count} 条"
-
-    html += """</span>
-                    </div>
-                    <div class="info-item">
-                        <span class="info-label">生成时间</span>
-                        <span class="info-value">"""
-
-    now = get_beijing_time()
-    html += now.strftime("%m-%d %H:%M")
-
-    html += """</span>
-                    </div>
+HTML_REPORT_TAIL = """
                 </div>
             </div>
-            
-            <div class="content">"""
-
-    # 处理失败ID错误信息
-    if report_data["failed_ids"]:
-        html += """
-                <div class="error-section">
-                    <div class="error-title">⚠️ 请求失败的平台</div>
-                    <ul class="error-list">"""
-        for id_value in report_data["failed_ids"]:
-            html += f'<li class="error-item">{html_escape(id_value)}</li>'
-        html += """
-                    </ul>
-                </div>"""
-
-    # 处理主要统计数据
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
-
-        for i, stat in enumerate(report_data["stats"], 1):
-            count = stat["count"]
-
-            # 确定热度等级
-            if count >= 10:
-                count_class = "hot"
-            elif count >= 5:
-                count_class = "warm"
-            else:
-                count_class = ""
-
-            escaped_word = html_escape(stat["word"])
-
-            html += f"""
-                <div class="word-group">
-                    <div class="word-header">
-                        <div class="word-info">
-                            <div class="word-name">{escaped_word}</div>
-                            <div class="word-count {count_class}">{count} 条</div>
-                        </div>
-                        <div class="word-index">{i}/{total_count}</div>
-                    </div>"""
-
-            # 处理每个词组下的新闻标题，给每条新闻标上序号
-            for j, title_data in enumerate(stat["titles"], 1):
-                is_new = title_data.get("is_new", False)
-                new_class = "new" if is_new else ""
-
-                html += f"""
-                    <div class="news-item {new_class}">
-                        <div class="news-number">{j}</div>
-                        <div class="news-content">
-                            <div class="news-header">
-                                <span class="source-name">{html_escape(title_data["source_name"])}</span>"""
-
-                # 处理排名显示
-                ranks = title_data.get("ranks", [])
-                if ranks:
-                    min_rank = min(ranks)
-                    max_rank = max(ranks)
-                    rank_threshold = title_data.get("rank_threshold", 10)
-
-                    # 确定排名等级
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= rank_threshold:
-                        rank_class = "high"
-                    else:
-                        rank_class = ""
-
-                    if min_rank == max_rank:
-                        rank_text = str(min_rank)
-                    else:
-                        rank_text = f"{min_rank}-{max_rank}"
-
-                    html += f'<span class="rank-num {rank_class}">{rank_text}</span>'
-
-                # 处理时间显示
-                time_display = title_data.get("time_display", "")
-                if time_display:
-                    # 简化时间显示格式，将波浪线替换为~
-                    simplified_time = (
-                        time_display.replace(" ~ ", "~")
-                        .replace("[", "")
-                        .replace("]", "")
-                    )
-                    html += (
-                        f'<span class="time-info">{html_escape(simplified_time)}</span>'
-                    )
-
-                # 处理出现次数
-                count_info = title_data.get("count", 1)
-                if count_info > 1:
-                    html += f'<span class="count-info">{count_info}次</span>'
-
-                html += """
-                            </div>
-                            <div class="news-title">"""
-
-                # 处理标题和链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                            </div>
-                        </div>
-                    </div>"""
-
-            html += """
-                </div>"""
-
-    # 处理新增新闻区域
-    if report_data["new_titles"]:
-        html += f"""
-                <div class="new-section">
-                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
-
-        for source_data in report_data["new_titles"]:
-            escaped_source = html_escape(source_data["source_name"])
-            titles_count = len(source_data["titles"])
-
-            html += f"""
-                    <div class="new-source-group">
-                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
-
-            # 为新增新闻也添加序号
-            for idx, title_data in enumerate(source_data["titles"], 1):
-                ranks = title_data.get("ranks", [])
-
-                # 处理新增新闻的排名显示
-                rank_class = ""
-                if ranks:
-                    min_rank = min(ranks)
-                    if min_rank <= 3:
-                        rank_class = "top"
-                    elif min_rank <= title_data.get("rank_threshold", 10):
-                        rank_class = "high"
-
-                    if len(ranks) == 1:
-                        rank_text = str(ranks[0])
-                    else:
-                        rank_text = f"{min(ranks)}-{max(ranks)}"
-                else:
-                    rank_text = "?"
-
-                html += f"""
-                        <div class="new-item">
-                            <div class="new-item-number">{idx}</div>
-                            <div class="new-item-rank {rank_class}">{rank_text}</div>
-                            <div class="new-item-content">
-                                <div class="new-item-title">"""
-
-                # 处理新增新闻的链接
-                escaped_title = html_escape(title_data["title"])
-                link_url = title_data.get("mobile_url") or title_data.get("url", "")
-
-                if link_url:
-                    escaped_url = html_escape(link_url)
-                    html += f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
-                else:
-                    html += escaped_title
-
-                html += """
-                                </div>
-                            </div>
-                        </div>"""
-
-            html += """
-                    </div>"""
-
-        html += """
-                </div>"""
-
-    html += """
-            </div>
-            
-            <div class="footer">
-                <div class="footer-content">
-                    由 <span class="project-name">TrendRadar</span> 生成 · 
-                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
-                        GitHub 开源项目
-                    </a>"""
-
-    if update_info:
-        html += f"""
-                    <br>
-                    <span style="color: #ea580c; font-weight: 500;">
-                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
-                    </span>"""
-
-    html += """
-                </div>
-            </div>
-        </div>
-        
-        <script>
-            async function saveAsImage() {
-                const button = event.target;
-                const originalText = button.textContent;
-                
-                try {
-                    button.textContent = '生成中...';
-                    button.disabled = true;
-                    window.scrollTo(0, 0);
-                    
-                    // 等待页面稳定
-                    await new Promise(resolve => setTimeout(resolve, 200));
-                    
-                    // 截图前隐藏按钮
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'hidden';
-                    
-                    // 再次等待确保按钮完全隐藏
-                    await new Promise(resolve => setTimeout(resolve, 100));
-                    
-                    const container = document.querySelector('.container');
-                    
-                    const canvas = await html2canvas(container, {
-                        backgroundColor: '#ffffff',
-                        scale: 1.5,
-                        useCORS: true,
-                        allowTaint: false,
-                        imageTimeout: 10000,
-                        removeContainer: false,
-                        foreignObjectRendering: false,
-                        logging: false,
-                        width: container.offsetWidth,
-                        height: container.offsetHeight,
-                        x: 0,
-                        y: 0,
-                        scrollX: 0,
-                        scrollY: 0,
-                        windowWidth: window.innerWidth,
-                        windowHeight: window.innerHeight
-                    });
-                    
-                    buttons.style.visibility = 'visible';
-                    
-                    const link = document.createElement('a');
-                    const now = new Date();
-                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
-                    
-                    link.download = filename;
-                    link.href = canvas.toDataURL('image/png', 1.0);
-                    
-                    // 触发下载
-                    document.body.appendChild(link);
-                    link.click();
-                    document.body.removeChild(link);
-                    
-                    button.textContent = '保存成功!';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                    
-                } catch (error) {
-                    const buttons = document.querySelector('.save-buttons');
-                    buttons.style.visibility = 'visible';
-                    button.textContent = '保存失败';
-                    setTimeout(() => {
-                        button.textContent = originalText;
-                        button.disabled = false;
-                    }, 2000);
-                }
-            }
+        </div>
+        
+        <script>
+            async function saveAsImage() {
+                const button = event.target;
+                const originalText = button.textContent;
+                
+                try {
+                    button.textContent = '生成中...';
+                    button.disabled = true;
+                    window.scrollTo(0, 0);
+                    
+                    // 等待页面稳定
+                    await new Promise(resolve => setTimeout(resolve, 200));
+                    
+                    // 截图前隐藏按钮
+                    const buttons = document.querySelector('.save-buttons');
+                    buttons.style.visibility = 'hidden';
+                    
+                    // 再次等待确保按钮完全隐藏
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                    
+                    const container = document.querySelector('.container');
+                    
+                    const canvas = await html2canvas(container, {
+                        backgroundColor: '#ffffff',
+                        scale: 1.5,
+                        useCORS: true,
+                        allowTaint: false,
+                        imageTimeout: 10000,
+                        removeContainer: false,
+                        foreignObjectRendering: false,
+                        logging: false,
+                        width: container.offsetWidth,
+                        height: container.offsetHeight,
+                        x: 0,
+                        y: 0,
+                        scrollX: 0,
+                        scrollY: 0,
+                        windowWidth: window.innerWidth,
+                        windowHeight: window.innerHeight
+                    });
+                    
+                    buttons.style.visibility = 'visible';
+                    
+                    const link = document.createElement('a');
+                    const now = new Date();
+                    const filename = `TrendRadar_热点新闻分析_${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}${String(now.getDate()).padStart(2, '0')}_${String(now.getHours()).padStart(2, '0')}${String(now.getMinutes()).padStart(2, '0')}.png`;
+                    
+                    link.download = filename;
+                    link.href = canvas.toDataURL('image/png', 1.0);
+                    
+                    // 触发下载
+                    document.body.appendChild(link);
+                    link.click();
+                    document.body.removeChild(link);
+                    
+                    button.textContent = '保存成功!';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                    
+                } catch (error) {
+                    const buttons = document.querySelector('.save-buttons');
+                    buttons.style.visibility = 'visible';
+                    button.textContent = '保存失败';
+                    setTimeout(() => {
+                        button.textContent = originalText;
+                        button.disabled = false;
+                    }, 2000);
+                }
+            }
             
             async function saveAsMultipleImages() {
                 const button = event.target;
@@ -2755,103 +3416,565 @@ def render_html_content(
     </html>
     """
 
-    return html
 
+def render_html_title_link(title_data: Dict) -> str:
+    """渲染HTML报告中的新闻标题，有链接时包装为超链接"""
+    escaped_title = html_escape(title_data["title"])
+    link_url = title_data.get("mobile_url") or title_data.get("url", "")
 
-def render_feishu_content(
-    report_data: Dict, update_info: Optional[Dict] = None, mode: str = "daily"
-) -> str:
-    """渲染飞书内容"""
-    text_content = ""
+    if link_url:
+        escaped_url = html_escape(link_url)
+        return f'<a href="{escaped_url}" target="_blank" class="news-link">{escaped_title}</a>'
+    return escaped_title
 
-    if report_data["stats"]:
-        text_content += f"📊 **热点词汇统计**\n\n"
 
-    total_count = len(report_data["stats"])
+def iter_html_word_groups(stats: List[Dict]) -> Iterator[str]:
+    """逐段生成词组统计区域的HTML"""
+    total_count = len(stats)
 
-    for i, stat in enumerate(report_data["stats"]):
-        word = stat["word"]
+    for i, stat in enumerate(stats, 1):
         count = stat["count"]
 
-        sequence_display = f"<font color='grey'>[{i + 1}/{total_count}]</font>"
-
+        # 确定热度等级
         if count >= 10:
-            text_content += f"🔥 {sequence_display} **{word}** : <font color='red'>{count}</font> 条\n\n"
+            count_class = "hot"
         elif count >= 5:
-            text_content += f"📈 {sequence_display} **{word}** : <font color='orange'>{count}</font> 条\n\n"
+            count_class = "warm"
         else:
-            text_content += f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-
-        for j, title_data in enumerate(stat["titles"], 1):
-            formatted_title = format_title_for_platform(
-                "feishu", title_data, show_source=True
-            )
-            text_content += f"  {j}. {formatted_title}\n"
+            count_class = ""
 
-            if j < len(stat["titles"]):
-                text_content += "\n"
-
-        if i < len(report_data["stats"]) - 1:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+        escaped_word = html_escape(stat["word"])
 
-    if not text_content:
-        if mode == "incremental":
-            mode_text = "增量模式下暂无新增匹配的热点词汇"
-        elif mode == "current":
-            mode_text = "当前榜单模式下暂无匹配的热点词汇"
-        else:
-            mode_text = "暂无匹配的热点词汇"
-        text_content = f"📭 {mode_text}\n\n"
+        yield f"""
+                <div class="word-group">
+                    <div class="word-header">
+                        <div class="word-info">
+                            <div class="word-name">{escaped_word}</div>
+                            <div class="word-count {count_class}">{count} 条</div>
+                        </div>
+                        <div class="word-index">{i}/{total_count}</div>
+                    </div>"""
 
-    if report_data["new_titles"]:
-        if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+        # 处理每个词组下的新闻标题，给每条新闻标上序号
+        for j, title_data in enumerate(stat["titles"], 1):
+            is_new = title_data.get("is_new", False)
+            new_class = "new" if is_new else ""
+
+            # 处理排名显示
+            rank_html = ""
+            ranks = title_data.get("ranks", [])
+            if ranks:
+                min_rank = min(ranks)
+                max_rank = max(ranks)
+                rank_threshold = title_data.get("rank_threshold", 10)
+
+                # 确定排名等级
+                if min_rank <= 3:
+                    rank_class = "top"
+                elif min_rank <= rank_threshold:
+                    rank_class = "high"
+                else:
+                    rank_class = ""
 
-        text_content += (
-            f"🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        )
+                if min_rank == max_rank:
+                    rank_text = str(min_rank)
+                else:
+                    rank_text = f"{min_rank}-{max_rank}"
+
+                rank_html = f'<span class="rank-num {rank_class}">{rank_text}</span>'
+
+            # 处理时间显示
+            time_html = ""
+            time_display = title_data.get("time_display", "")
+            if time_display:
+                # 简化时间显示格式，将波浪线替换为~
+                simplified_time = (
+                    time_display.replace(" ~ ", "~")
+                    .replace("[", "")
+                    .replace("]", "")
+                )
+                time_html = (
+                    f'<span class="time-info">{html_escape(simplified_time)}</span>'
+                )
 
-        for source_data in report_data["new_titles"]:
-            text_content += (
-                f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n"
-            )
+            # 处理出现次数
+            count_html = ""
+            count_info = title_data.get("count", 1)
+            if count_info > 1:
+                count_html = f'<span class="count-info">{count_info}次</span>'
 
-            for j, title_data in enumerate(source_data["titles"], 1):
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
-                formatted_title = format_title_for_platform(
-                    "feishu", title_data_copy, show_source=False
-                )
-                text_content += f"  {j}. {formatted_title}\n"
+            # 处理评分（开启 show_score_in_report 时才带有 score）
+            if title_data.get("score") is not None:
+                count_html += f'<span class="score-info">⭐{title_data["score"]}分</span>'
 
-            text_content += "\n"
+            # 每条新闻合成一个片段输出，减少流式写入时的小片段数量
+            yield f"""
+                    <div class="news-item {new_class}">
+                        <div class="news-number">{j}</div>
+                        <div class="news-content">
+                            <div class="news-header">
+                                <span class="source-name">{html_escape(title_data["source_name"])}</span>{rank_html}{time_html}{count_html}
+                            </div>
+                            <div class="news-title">{render_html_title_link(title_data)}
+                            </div>
+                        </div>
+                    </div>"""
 
-    if report_data["failed_ids"]:
-        if text_content and "暂无匹配" not in text_content:
-            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+        yield """
+                </div>"""
 
-        text_content += "⚠️ **数据获取失败的平台：**\n\n"
-        for i, id_value in enumerate(report_data["failed_ids"], 1):
-            text_content += f"  • <font color='red'>{id_value}</font>\n"
 
-    now = get_beijing_time()
-    text_content += (
-        f"\n\n<font color='grey'>更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}</font>"
-    )
+def iter_html_footer(update_info: Optional[Dict] = None) -> Iterator[str]:
+    """逐段生成内容区结尾、页脚和静态脚本"""
+    yield """
+            </div>
+            
+            <div class="footer">
+                <div class="footer-content">
+                    由 <span class="project-name">TrendRadar</span> 生成 · 
+                    <a href="https://github.com/sansan0/TrendRadar" target="_blank" class="footer-link">
+                        GitHub 开源项目
+                    </a>"""
 
     if update_info:
-        text_content += f"\n<font color='grey'>TrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}</font>"
-
-    return text_content
+        yield f"""
+                    <br>
+                    <span style="color: #ea580c; font-weight: 500;">
+                        发现新版本 {update_info['remote_version']}，当前版本 {update_info['current_version']}
+                    </span>"""
 
+    yield HTML_REPORT_TAIL
 
-def render_dingtalk_content(
-    report_data: Dict, update_info: Optional[Dict] = None, mode: str = "daily"
-) -> str:
-    """渲染钉钉内容"""
-    text_content = ""
 
-    total_titles = sum(
+def iter_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> Iterator[str]:
+    """逐段生成HTML内容：静态头部/样式/脚本直接取预渲染常量，动态部分按片段产出"""
+    yield HTML_REPORT_HEAD
+
+    # 处理报告类型显示
+    if is_daily_summary:
+        if mode == "current":
+            yield "当前榜单"
+        elif mode == "incremental":
+            yield "增量模式"
+        else:
+            yield "当日汇总"
+    else:
+        yield "实时分析"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">新闻总数</span>
+                        <span class="info-value">"""
+
+    yield f"{total_titles} 条"
+
+    # 计算筛选后的热点新闻数量
+    hot_news_count = sum(len(stat["titles"]) for stat in report_data["stats"])
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">热点新闻</span>
+                        <span class="info-value">"""
+
+    yield f"{hot_news_count} 条"
+
+    yield """</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">生成时间</span>
+                        <span class="info-value">"""
+
+    now = get_beijing_time()
+    yield now.strftime("%m-%d %H:%M")
+
+    yield """</span>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="content">"""
+
+    # 处理失败ID错误信息
+    if report_data["failed_ids"]:
+        yield """
+                <div class="error-section">
+                    <div class="error-title">⚠️ 请求失败的平台</div>
+                    <ul class="error-list">"""
+        for id_value in report_data["failed_ids"]:
+            yield f'<li class="error-item">{html_escape(id_value)}</li>'
+        yield """
+                    </ul>
+                </div>"""
+
+    # 处理主要统计数据
+    if report_data["stats"]:
+        yield from iter_html_word_groups(report_data["stats"])
+
+    # 处理新增新闻区域
+    if report_data["new_titles"]:
+        yield f"""
+                <div class="new-section">
+                    <div class="new-section-title">本次新增热点 (共 {report_data['total_new_count']} 条)</div>"""
+
+        for source_data in report_data["new_titles"]:
+            escaped_source = html_escape(source_data["source_name"])
+            titles_count = len(source_data["titles"])
+
+            yield f"""
+                    <div class="new-source-group">
+                        <div class="new-source-title">{escaped_source} · {titles_count}条</div>"""
+
+            # 为新增新闻也添加序号
+            for idx, title_data in enumerate(source_data["titles"], 1):
+                ranks = title_data.get("ranks", [])
+
+                # 处理新增新闻的排名显示
+                rank_class = ""
+                if ranks:
+                    min_rank = min(ranks)
+                    if min_rank <= 3:
+                        rank_class = "top"
+                    elif min_rank <= title_data.get("rank_threshold", 10):
+                        rank_class = "high"
+
+                    if len(ranks) == 1:
+                        rank_text = str(ranks[0])
+                    else:
+                        rank_text = f"{min(ranks)}-{max(ranks)}"
+                else:
+                    rank_text = "?"
+
+                yield f"""
+                        <div class="new-item">
+                            <div class="new-item-number">{idx}</div>
+                            <div class="new-item-rank {rank_class}">{rank_text}</div>
+                            <div class="new-item-content">
+                                <div class="new-item-title">{render_html_title_link(title_data)}
+                                </div>
+                            </div>
+                        </div>"""
+
+            yield """
+                    </div>"""
+
+        yield """
+                </div>"""
+
+    yield from iter_html_footer(update_info)
+
+
+def render_html_content(
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> str:
+    """渲染HTML内容"""
+    return "".join(
+        iter_html_content(report_data, total_titles, is_daily_summary, mode, update_info)
+    )
+
+
+HTML_WRITE_CHUNK_SIZE = 64 * 1024
+
+
+def write_html_content(
+    file,
+    report_data: Dict,
+    total_titles: int,
+    is_daily_summary: bool = False,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+) -> None:
+    """将HTML内容分块写入已打开的文件，不在内存中拼出完整页面"""
+    chunk = []
+    chunk_size = 0
+    for part in iter_html_content(
+        report_data, total_titles, is_daily_summary, mode, update_info
+    ):
+        chunk.append(part)
+        chunk_size += len(part)
+        # 攒够一块再写，避免逐个小片段写入带来的调用开销
+        if chunk_size >= HTML_WRITE_CHUNK_SIZE:
+            file.write("".join(chunk))
+            chunk = []
+            chunk_size = 0
+    if chunk:
+        file.write("".join(chunk))
+
+
+HTML_FRAGMENT_INDEX_FILE = "分段报告.html"
+
+# 分段报告的懒加载脚本：片段文件是形如 trendradarFragment(名称, HTML) 的 JS，
+# 通过 <script> 标签加载，直接双击打开（file://）时同样可用
+HTML_FRAGMENT_LOADER = """
+                <script>
+                    window.trendradarFragment = function(name, html) {
+                        var node = document.querySelector('.run-fragment[data-name="' + name + '"]');
+                        if (node) {
+                            node.querySelector('.run-fragment-body').innerHTML = html;
+                            node.setAttribute('data-loaded', 'done');
+                        }
+                    };
+                    (function() {
+                        function load(node) {
+                            if (node.getAttribute('data-loaded')) return;
+                            node.setAttribute('data-loaded', 'loading');
+                            var script = document.createElement('script');
+                            script.src = node.getAttribute('data-src');
+                            document.body.appendChild(script);
+                        }
+                        var nodes = Array.prototype.slice.call(
+                            document.querySelectorAll('.run-fragment:not([data-loaded])')
+                        );
+                        if ('IntersectionObserver' in window) {
+                            var observer = new IntersectionObserver(function(entries) {
+                                entries.forEach(function(entry) {
+                                    if (entry.isIntersecting) {
+                                        observer.unobserve(entry.target);
+                                        load(entry.target);
+                                    }
+                                });
+                            }, { rootMargin: '300px' });
+                            nodes.forEach(function(node) { observer.observe(node); });
+                        } else {
+                            nodes.forEach(load);
+                        }
+                    })();
+                </script>"""
+
+
+def collect_changed_fragment_stats(
+    stats: List[Dict], seen_items: Dict[str, str]
+) -> List[Dict]:
+    """筛选相对之前运行新出现或排名区间有变化的新闻，并把本次状态写回 seen_items"""
+    changed_stats = []
+    for stat in stats:
+        changed_titles = []
+        for title_data in stat["titles"]:
+            item_key = f"{stat['word']}\n{title_data['source_name']}\n{title_data['title']}"
+            ranks = title_data.get("ranks", [])
+            # 只比较报告中展示的排名区间，区间内的名次波动不算变化
+            rank_range = f"{min(ranks)}-{max(ranks)}" if ranks else ""
+            if seen_items.get(item_key) != rank_range:
+                seen_items[item_key] = rank_range
+                changed_titles.append(title_data)
+        if changed_titles:
+            changed_stats.append(
+                {"word": stat["word"], "count": len(changed_titles), "titles": changed_titles}
+            )
+    return changed_stats
+
+
+def iter_html_fragment_index(
+    runs: List[Dict],
+    latest_html: str,
+    update_info: Optional[Dict] = None,
+) -> Iterator[str]:
+    """逐段生成分段报告首页：最新一次运行的片段内联，更早的片段滚动到附近时再加载"""
+    yield HTML_REPORT_HEAD
+    yield "分段报告"
+
+    latest_count = runs[-1]["count"] if runs else 0
+    yield f"""</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">运行片段</span>
+                        <span class="info-value">{len(runs)} 个</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">本次变化</span>
+                        <span class="info-value">{latest_count} 条</span>
+                    </div>
+                    <div class="info-item">
+                        <span class="info-label">最近变化</span>
+                        <span class="info-value">{get_beijing_time().strftime("%m-%d %H:%M")}</span>
+                    </div>
+                </div>
+            </div>
+
+            <div class="content">"""
+
+    for position, run in enumerate(reversed(runs)):
+        name = html_escape(run["name"])
+        loaded = ' data-loaded="done"' if position == 0 else ""
+        body = latest_html if position == 0 else "加载中…"
+        yield f"""
+                <div class="new-section run-fragment" data-name="{name}" data-src="fragments/{name}.js"{loaded}>
+                    <div class="new-section-title">{name} · 新增或变化 {run['count']} 条</div>
+                    <div class="run-fragment-body">{body}</div>
+                </div>"""
+
+    yield HTML_FRAGMENT_LOADER
+    yield from iter_html_footer(update_info)
+
+
+def generate_html_fragment_report(
+    report_data: Dict, update_info: Optional[Dict] = None
+) -> str:
+    """分段报告：本次运行只渲染新增或排名变化的新闻，写成独立的片段文件，
+    首页只列出各次运行的片段并按需加载，返回首页路径"""
+    fragment_dir = Path(get_output_path("html", "fragments"))
+    ensure_directory_exists(str(fragment_dir))
+    state_file = fragment_dir / "state.json"
+    index_path = get_output_path("html", HTML_FRAGMENT_INDEX_FILE)
+
+    state = {"items": {}, "runs": []}
+    if state_file.exists():
+        try:
+            with open(state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"读取分段报告状态失败，将重新开始: {e}")
+
+    changed_stats = collect_changed_fragment_stats(report_data["stats"], state["items"])
+    if not changed_stats and Path(index_path).exists():
+        # 首页只在有变化时重写，页头时间即最近一次变化的时间
+        print("分段报告：本次没有新增或变化的新闻，不生成新片段")
+        return index_path
+
+    latest_html = "".join(iter_html_word_groups(changed_stats))
+    if changed_stats:
+        run_name = format_time_filename()
+        # U+2028/U+2029 在旧版浏览器的 JS 字符串中不合法，单独转义
+        payload = (
+            json.dumps(latest_html, ensure_ascii=False)
+            .replace("\u2028", "\\u2028")
+            .replace("\u2029", "\\u2029")
+        )
+        with open(fragment_dir / f"{run_name}.js", "w", encoding="utf-8") as f:
+            f.write(f"trendradarFragment({json.dumps(run_name)}, {payload});\n")
+
+        runs = [run for run in state["runs"] if run["name"] != run_name]
+        runs.append(
+            {"name": run_name, "count": sum(stat["count"] for stat in changed_stats)}
+        )
+
+        # 只保留最近的若干次运行，更早的片段文件一并删除
+        max_runs = CONFIG["HTML_FRAGMENT_MAX_RUNS"]
+        if max_runs > 0 and len(runs) > max_runs:
+            for run in runs[:-max_runs]:
+                try:
+                    (fragment_dir / f"{run['name']}.js").unlink()
+                except FileNotFoundError:
+                    pass
+            runs = runs[-max_runs:]
+        state["runs"] = runs
+
+    temp_file = state_file.with_suffix(".tmp")
+    with open(temp_file, "w", encoding="utf-8") as f:
+        f.write(json.dumps(state, ensure_ascii=False, separators=(",", ":")))
+    os.replace(temp_file, state_file)
+
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write("".join(iter_html_fragment_index(state["runs"], latest_html, update_info)))
+
+    return index_path
+
+
+def render_feishu_content(
+    report_data: Dict, update_info: Optional[Dict] = None, mode: str = "daily"
+) -> str:
+    """渲染飞书内容"""
+    text_content = ""
+
+    if report_data["stats"]:
+        text_content += f"📊 **热点词汇统计**\n\n"
+
+    total_count = len(report_data["stats"])
+
+    for i, stat in enumerate(report_data["stats"]):
+        word = stat["word"]
+        count = stat["count"]
+
+        sequence_display = f"<font color='grey'>[{i + 1}/{total_count}]</font>"
+
+        if count >= 10:
+            text_content += f"🔥 {sequence_display} **{word}** : <font color='red'>{count}</font> 条\n\n"
+        elif count >= 5:
+            text_content += f"📈 {sequence_display} **{word}** : <font color='orange'>{count}</font> 条\n\n"
+        else:
+            text_content += f"📌 {sequence_display} **{word}** : {count} 条\n\n"
+
+        for j, title_data in enumerate(stat["titles"], 1):
+            formatted_title = format_title_for_platform(
+                "feishu", title_data, show_source=True
+            )
+            text_content += f"  {j}. {formatted_title}\n"
+
+            if j < len(stat["titles"]):
+                text_content += "\n"
+
+        if i < len(report_data["stats"]) - 1:
+            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+
+    if not text_content:
+        if mode == "incremental":
+            mode_text = "增量模式下暂无新增匹配的热点词汇"
+        elif mode == "current":
+            mode_text = "当前榜单模式下暂无匹配的热点词汇"
+        else:
+            mode_text = "暂无匹配的热点词汇"
+        text_content = f"📭 {mode_text}\n\n"
+
+    if report_data["new_titles"]:
+        if text_content and "暂无匹配" not in text_content:
+            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+
+        text_content += (
+            f"🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
+        )
+
+        for source_data in report_data["new_titles"]:
+            text_content += (
+                f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n"
+            )
+
+            for j, title_data in enumerate(source_data["titles"], 1):
+                title_data_copy = title_data.copy()
+                title_data_copy["is_new"] = False
+                formatted_title = format_title_for_platform(
+                    "feishu", title_data_copy, show_source=False
+                )
+                text_content += f"  {j}. {formatted_title}\n"
+
+            text_content += "\n"
+
+    if report_data["failed_ids"]:
+        if text_content and "暂无匹配" not in text_content:
+            text_content += f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
+
+        text_content += "⚠️ **数据获取失败的平台：**\n\n"
+        for i, id_value in enumerate(report_data["failed_ids"], 1):
+            text_content += f"  • <font color='red'>{id_value}</font>\n"
+
+    now = get_beijing_time()
+    text_content += (
+        f"\n\n<font color='grey'>更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}</font>"
+    )
+
+    if update_info:
+        text_content += f"\n<font color='grey'>TrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}</font>"
+
+    return text_content
+
+
+def render_dingtalk_content(
+    report_data: Dict, update_info: Optional[Dict] = None, mode: str = "daily"
+) -> str:
+    """渲染钉钉内容"""
+    text_content = ""
+
+    total_titles = sum(
         len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
     )
     now = get_beijing_time()
@@ -3022,6 +4145,196 @@ def add_batch_headers(
     return result
 
 
+class _BatchBuilder:
+    """按字节预算累积消息片段
+
+    每个片段只编码一次，维护当前批次的运行字节数，
+    避免对不断增长的批次字符串反复拼接和编码。
+    """
+
+    def __init__(self, base_header: str, base_footer: str, max_bytes: int):
+        self.batches = []
+        self.parts = [base_header]
+        self.size = len(base_header.encode("utf-8"))
+        self.footer = base_footer
+        self.footer_size = len(base_footer.encode("utf-8"))
+        self.max_bytes = max_bytes
+        self.has_content = False
+
+    def try_add(self, fragment: str) -> bool:
+        """片段放得下（加上尾部仍小于上限）时追加到当前批次"""
+        fragment_size = len(fragment.encode("utf-8"))
+        if self.size + fragment_size + self.footer_size >= self.max_bytes:
+            return False
+        self.add(fragment, fragment_size)
+        return True
+
+    def add(self, fragment: str, fragment_size: Optional[int] = None) -> None:
+        """无条件追加片段"""
+        if fragment_size is None:
+            fragment_size = len(fragment.encode("utf-8"))
+        self.parts.append(fragment)
+        self.size += fragment_size
+        self.has_content = True
+
+    def start_new_batch(self, *fragments: str) -> None:
+        """结束当前批次（有内容时），以给定片段开启新批次"""
+        self._flush()
+        self.parts = list(fragments)
+        self.size = sum(len(fragment.encode("utf-8")) for fragment in fragments)
+        self.has_content = True
+
+    def _flush(self) -> None:
+        if self.has_content:
+            self.parts.append(self.footer)
+            self.batches.append("".join(self.parts))
+
+    def finish(self) -> List[str]:
+        """完成最后批次并返回全部批次"""
+        self._flush()
+        self.has_content = False
+        return self.batches
+
+
+_BOLD_WORD_HEADERS = (
+    "🔥 {sequence} **{word}** : **{count}** 条\n\n",
+    "📈 {sequence} **{word}** : **{count}** 条\n\n",
+    "📌 {sequence} **{word}** : {count} 条\n\n",
+)
+
+# 推送渠道的分段标记（模板中 {separator} 为飞书分隔线配置）
+# item / new_first_item / new_item 分别为词组新闻、新增新闻首条、新增新闻其余条目
+# 使用的条目标记，None 表示纯文本标题
+BATCH_MARKUP = {
+    "wework": {
+        "item": "wework",
+        "new_first_item": "wework",
+        "new_item": "wework",
+        "header": "**总新闻数：** {total}\n\n\n\n",
+        "footer": "\n\n\n> 更新时间：{now}",
+        "footer_update": "\n> TrendRadar 发现新版本 **{remote}**，当前 **{current}**",
+        "stats_header": "📊 **热点词汇统计**\n\n",
+        "word_headers": _BOLD_WORD_HEADERS,
+        "separator": "\n\n\n\n",
+        "new_header": "\n\n\n\n🆕 **本次新增热点新闻** (共 {total_new} 条)\n\n",
+        "source_header": "**{source}** ({count} 条):\n\n",
+        "failed_header": "\n\n\n\n⚠️ **数据获取失败的平台：**\n\n",
+        "failed_line": "  • {id}\n",
+    },
+    "telegram": {
+        "item": "telegram",
+        "new_first_item": "telegram",
+        "new_item": "telegram",
+        "header": "总新闻数： {total}\n\n",
+        "footer": "\n\n更新时间：{now}",
+        "footer_update": "\nTrendRadar 发现新版本 {remote}，当前 {current}",
+        "stats_header": "📊 热点词汇统计\n\n",
+        "word_headers": (
+            "🔥 {sequence} {word} : {count} 条\n\n",
+            "📈 {sequence} {word} : {count} 条\n\n",
+            "📌 {sequence} {word} : {count} 条\n\n",
+        ),
+        "separator": "\n\n",
+        "new_header": "\n\n🆕 本次新增热点新闻 (共 {total_new} 条)\n\n",
+        "source_header": "{source} ({count} 条):\n\n",
+        "failed_header": "\n\n⚠️ 数据获取失败的平台：\n\n",
+        "failed_line": "  • {id}\n",
+    },
+    "ntfy": {
+        "item": "ntfy",
+        "new_first_item": None,
+        "new_item": None,
+        "header": "**总新闻数：** {total}\n\n",
+        "footer": "\n\n> 更新时间：{now}",
+        "footer_update": "\n> TrendRadar 发现新版本 **{remote}**，当前 **{current}**",
+        "stats_header": "📊 **热点词汇统计**\n\n",
+        "word_headers": _BOLD_WORD_HEADERS,
+        "separator": "\n\n",
+        "new_header": "\n\n🆕 **本次新增热点新闻** (共 {total_new} 条)\n\n",
+        "source_header": "**{source}** ({count} 条):\n\n",
+        "failed_header": "\n\n⚠️ **数据获取失败的平台：**\n\n",
+        "failed_line": "  • {id}\n",
+    },
+    "feishu": {
+        "item": "feishu",
+        "new_first_item": "feishu",
+        "new_item": "feishu",
+        "header": "",
+        "footer": "\n\n<font color='grey'>更新时间：{now}</font>",
+        "footer_update": "\n<font color='grey'>TrendRadar 发现新版本 {remote}，当前 {current}</font>",
+        "stats_header": "📊 **热点词汇统计**\n\n",
+        "word_headers": (
+            "🔥 <font color='grey'>{sequence}</font> **{word}** : <font color='red'>{count}</font> 条\n\n",
+            "📈 <font color='grey'>{sequence}</font> **{word}** : <font color='orange'>{count}</font> 条\n\n",
+            "📌 <font color='grey'>{sequence}</font> **{word}** : {count} 条\n\n",
+        ),
+        "separator": "\n{separator}\n\n",
+        "new_header": "\n{separator}\n\n🆕 **本次新增热点新闻** (共 {total_new} 条)\n\n",
+        "source_header": "**{source}** ({count} 条):\n\n",
+        "failed_header": "\n{separator}\n\n⚠️ **数据获取失败的平台：**\n\n",
+        "failed_line": "  • <font color='red'>{id}</font>\n",
+    },
+    "dingtalk": {
+        "item": "dingtalk",
+        "new_first_item": "dingtalk",
+        "new_item": "dingtalk",
+        "header": "**总新闻数：** {total}\n\n**时间：** {now}\n\n**类型：** 热点分析报告\n\n---\n\n",
+        "footer": "\n\n> 更新时间：{now}",
+        "footer_update": "\n> TrendRadar 发现新版本 **{remote}**，当前 **{current}**",
+        "stats_header": "📊 **热点词汇统计**\n\n",
+        "word_headers": _BOLD_WORD_HEADERS,
+        "separator": "\n---\n\n",
+        "new_header": "\n---\n\n🆕 **本次新增热点新闻** (共 {total_new} 条)\n\n",
+        "source_header": "**{source}** ({count} 条):\n\n",
+        "failed_header": "\n---\n\n⚠️ **数据获取失败的平台：**\n\n",
+        "failed_line": "  • **{id}**\n",
+    },
+    "slack": {
+        "item": "slack",
+        "new_first_item": "slack",
+        "new_item": "slack",
+        "header": "*总新闻数：* {total}\n\n",
+        "footer": "\n\n_更新时间：{now}_",
+        "footer_update": "\n_TrendRadar 发现新版本 *{remote}*，当前 *{current}_",
+        "stats_header": "📊 *热点词汇统计*\n\n",
+        "word_headers": (
+            "🔥 {sequence} *{word}* : *{count}* 条\n\n",
+            "📈 {sequence} *{word}* : *{count}* 条\n\n",
+            "📌 {sequence} *{word}* : {count} 条\n\n",
+        ),
+        "separator": "\n\n",
+        "new_header": "\n\n🆕 *本次新增热点新闻* (共 {total_new} 条)\n\n",
+        "source_header": "*{source}* ({count} 条):\n\n",
+        "failed_header": "",
+        "failed_line": "  • {id}\n",
+    },
+}
+
+# Bark 复用企业微信的 markdown 标记，但新增新闻的后续条目为纯文本，且没有失败平台标题
+BATCH_MARKUP["bark"] = {
+    **BATCH_MARKUP["wework"],
+    "new_item": None,
+    "failed_header": "",
+}
+
+# 未知渠道：只输出纯文本标题和失败平台列表
+_PLAIN_BATCH_MARKUP = {
+    "item": None,
+    "new_first_item": None,
+    "new_item": None,
+    "header": "",
+    "footer": "",
+    "footer_update": "",
+    "stats_header": "",
+    "word_headers": ("", "", ""),
+    "separator": "",
+    "new_header": "",
+    "source_header": "",
+    "failed_header": "",
+    "failed_line": "  • {id}\n",
+}
+
+
 def split_content_into_batches(
     report_data: Dict,
     format_type: str,
@@ -3029,7 +4342,11 @@ def split_content_into_batches(
     max_bytes: int = None,
     mode: str = "daily",
 ) -> List[str]:
-    """分批处理消息内容，确保词组标题+至少第一条新闻的完整性"""
+    """分批处理消息内容，确保词组标题+至少第一条新闻的完整性
+
+    report_data 中带有 build_report_ir 生成的 "ir" 时直接复用，
+    否则现场构建；各渠道只套用 BATCH_MARKUP 中的标记。
+    """
     if max_bytes is None:
         if format_type == "dingtalk":
             max_bytes = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
@@ -3040,78 +4357,26 @@ def split_content_into_batches(
         else:
             max_bytes = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
 
-    batches = []
-
-    total_titles = sum(
-        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-    )
-    now = get_beijing_time()
-
-    base_header = ""
-    if format_type in ("wework", "bark"):
-        base_header = f"**总新闻数：** {total_titles}\n\n\n\n"
-    elif format_type == "telegram":
-        base_header = f"总新闻数： {total_titles}\n\n"
-    elif format_type == "ntfy":
-        base_header = f"**总新闻数：** {total_titles}\n\n"
-    elif format_type == "feishu":
-        base_header = ""
-    elif format_type == "dingtalk":
-        base_header = f"**总新闻数：** {total_titles}\n\n"
-        base_header += f"**时间：** {now.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        base_header += f"**类型：** 热点分析报告\n\n"
-        base_header += "---\n\n"
-    elif format_type == "slack":
-        base_header = f"*总新闻数：* {total_titles}\n\n"
-
-    base_footer = ""
-    if format_type in ("wework", "bark"):
-        base_footer = f"\n\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
-        if update_info:
-            base_footer += f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
-    elif format_type == "telegram":
-        base_footer = f"\n\n更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
-        if update_info:
-            base_footer += f"\nTrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}"
-    elif format_type == "ntfy":
-        base_footer = f"\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
-        if update_info:
-            base_footer += f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
-    elif format_type == "feishu":
-        base_footer = f"\n\n<font color='grey'>更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}</font>"
-        if update_info:
-            base_footer += f"\n<font color='grey'>TrendRadar 发现新版本 {update_info['remote_version']}，当前 {update_info['current_version']}</font>"
-    elif format_type == "dingtalk":
-        base_footer = f"\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
-        if update_info:
-            base_footer += f"\n> TrendRadar 发现新版本 **{update_info['remote_version']}**，当前 **{update_info['current_version']}**"
-    elif format_type == "slack":
-        base_footer = f"\n\n_更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}_"
-        if update_info:
-            base_footer += f"\n_TrendRadar 发现新版本 *{update_info['remote_version']}*，当前 *{update_info['current_version']}_"
-
-    stats_header = ""
-    if report_data["stats"]:
-        if format_type in ("wework", "bark"):
-            stats_header = f"📊 **热点词汇统计**\n\n"
-        elif format_type == "telegram":
-            stats_header = f"📊 热点词汇统计\n\n"
-        elif format_type == "ntfy":
-            stats_header = f"📊 **热点词汇统计**\n\n"
-        elif format_type == "feishu":
-            stats_header = f"📊 **热点词汇统计**\n\n"
-        elif format_type == "dingtalk":
-            stats_header = f"📊 **热点词汇统计**\n\n"
-        elif format_type == "slack":
-            stats_header = f"📊 *热点词汇统计*\n\n"
+    report_ir = report_data.get("ir") or build_report_ir(report_data)
+    render_item = report_ir["format_cache"].render
+    markup = BATCH_MARKUP.get(format_type, _PLAIN_BATCH_MARKUP)
+    separator_line = CONFIG["FEISHU_MESSAGE_SEPARATOR"]
+    now = get_beijing_time().strftime("%Y-%m-%d %H:%M:%S")
+
+    base_header = markup["header"].format(total=report_ir["total_titles"], now=now)
+    base_footer = markup["footer"].format(now=now)
+    if update_info and markup["footer_update"]:
+        base_footer += markup["footer_update"].format(
+            remote=update_info["remote_version"],
+            current=update_info["current_version"],
+        )
 
-    current_batch = base_header
-    current_batch_has_content = False
+    stats_header = markup["stats_header"] if report_ir["stats"] else ""
 
     if (
-        not report_data["stats"]
-        and not report_data["new_titles"]
-        and not report_data["failed_ids"]
+        not report_ir["stats"]
+        and not report_ir["new_titles"]
+        and not report_ir["failed_ids"]
     ):
         if mode == "incremental":
             mode_text = "增量模式下暂无新增匹配的热点词汇"
@@ -3120,414 +4385,147 @@ def split_content_into_batches(
         else:
             mode_text = "暂无匹配的热点词汇"
         simple_content = f"📭 {mode_text}\n\n"
-        final_content = base_header + simple_content + base_footer
-        batches.append(final_content)
-        return batches
+        return [base_header + simple_content + base_footer]
+
+    batch = _BatchBuilder(base_header, base_footer, max_bytes)
 
     # 处理热点词汇统计
-    if report_data["stats"]:
-        total_count = len(report_data["stats"])
+    if report_ir["stats"]:
+        total_count = len(report_ir["stats"])
+        separator = markup["separator"].format(separator=separator_line)
 
         # 添加统计标题
-        test_content = current_batch + stats_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            < max_bytes
-        ):
-            current_batch = test_content
-            current_batch_has_content = True
-        else:
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + stats_header
-            current_batch_has_content = True
+        if not batch.try_add(stats_header):
+            batch.start_new_batch(base_header, stats_header)
 
         # 逐个处理词组（确保词组标题+第一条新闻的原子性）
-        for i, stat in enumerate(report_data["stats"]):
-            word = stat["word"]
+        for i, stat in enumerate(report_ir["stats"]):
             count = stat["count"]
-            sequence_display = f"[{i + 1}/{total_count}]"
+            items = stat["items"]
 
             # 构建词组标题
-            word_header = ""
-            if format_type in ("wework", "bark"):
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-            elif format_type == "telegram":
-                if count >= 10:
-                    word_header = f"🔥 {sequence_display} {word} : {count} 条\n\n"
-                elif count >= 5:
-                    word_header = f"📈 {sequence_display} {word} : {count} 条\n\n"
-                else:
-                    word_header = f"📌 {sequence_display} {word} : {count} 条\n\n"
-            elif format_type == "ntfy":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-            elif format_type == "feishu":
-                if count >= 10:
-                    word_header = f"🔥 <font color='grey'>{sequence_display}</font> **{word}** : <font color='red'>{count}</font> 条\n\n"
-                elif count >= 5:
-                    word_header = f"📈 <font color='grey'>{sequence_display}</font> **{word}** : <font color='orange'>{count}</font> 条\n\n"
-                else:
-                    word_header = f"📌 <font color='grey'>{sequence_display}</font> **{word}** : {count} 条\n\n"
-            elif format_type == "dingtalk":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} **{word}** : **{count}** 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} **{word}** : {count} 条\n\n"
-            elif format_type == "slack":
-                if count >= 10:
-                    word_header = (
-                        f"🔥 {sequence_display} *{word}* : *{count}* 条\n\n"
-                    )
-                elif count >= 5:
-                    word_header = (
-                        f"📈 {sequence_display} *{word}* : *{count}* 条\n\n"
-                    )
-                else:
-                    word_header = f"📌 {sequence_display} *{word}* : {count} 条\n\n"
+            if count >= 10:
+                word_header_template = markup["word_headers"][0]
+            elif count >= 5:
+                word_header_template = markup["word_headers"][1]
+            else:
+                word_header_template = markup["word_headers"][2]
+            word_header = word_header_template.format(
+                sequence=f"[{i + 1}/{total_count}]", word=stat["word"], count=count
+            )
 
             # 构建第一条新闻
             first_news_line = ""
-            if stat["titles"]:
-                first_title_data = stat["titles"][0]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", first_title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", first_title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", first_title_data, show_source=True
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", first_title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", first_title_data, show_source=True
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", first_title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{first_title_data['title']}"
-
+            if items:
+                formatted_title = render_item(markup["item"], items[0])
                 first_news_line = f"  1. {formatted_title}\n"
-                if len(stat["titles"]) > 1:
+                if len(items) > 1:
                     first_news_line += "\n"
 
             # 原子性检查：词组标题+第一条新闻必须一起处理
             word_with_first_news = word_header + first_news_line
-            test_content = current_batch + word_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
+            if not batch.try_add(word_with_first_news):
                 # 当前批次容纳不下，开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + stats_header + word_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+                batch.start_new_batch(base_header, stats_header, word_with_first_news)
 
             # 处理剩余新闻条目
-            for j in range(start_index, len(stat["titles"])):
-                title_data = stat["titles"][j]
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data, show_source=True
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data, show_source=True
-                    )
-                elif format_type == "ntfy":
-                    formatted_title = format_title_for_platform(
-                        "ntfy", title_data, show_source=True
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data, show_source=True
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data, show_source=True
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data, show_source=True
-                    )
-                else:
-                    formatted_title = f"{title_data['title']}"
-
+            for j in range(1, len(items)):
+                formatted_title = render_item(markup["item"], items[j])
                 news_line = f"  {j + 1}. {formatted_title}\n"
-                if j < len(stat["titles"]) - 1:
+                if j < len(items) - 1:
                     news_line += "\n"
 
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + stats_header + word_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+                if not batch.try_add(news_line):
+                    batch.start_new_batch(
+                        base_header, stats_header, word_header, news_line
+                    )
 
             # 词组间分隔符
-            if i < len(report_data["stats"]) - 1:
-                separator = ""
-                if format_type in ("wework", "bark"):
-                    separator = f"\n\n\n\n"
-                elif format_type == "telegram":
-                    separator = f"\n\n"
-                elif format_type == "ntfy":
-                    separator = f"\n\n"
-                elif format_type == "feishu":
-                    separator = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n"
-                elif format_type == "dingtalk":
-                    separator = f"\n---\n\n"
-                elif format_type == "slack":
-                    separator = f"\n\n"
-
-                test_content = current_batch + separator
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    < max_bytes
-                ):
-                    current_batch = test_content
+            if i < total_count - 1:
+                batch.try_add(separator)
 
     # 处理新增新闻（同样确保来源标题+第一条新闻的原子性）
-    if report_data["new_titles"]:
-        new_header = ""
-        if format_type in ("wework", "bark"):
-            new_header = f"\n\n\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        elif format_type == "telegram":
-            new_header = (
-                f"\n\n🆕 本次新增热点新闻 (共 {report_data['total_new_count']} 条)\n\n"
-            )
-        elif format_type == "ntfy":
-            new_header = f"\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        elif format_type == "feishu":
-            new_header = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        elif format_type == "dingtalk":
-            new_header = f"\n---\n\n🆕 **本次新增热点新闻** (共 {report_data['total_new_count']} 条)\n\n"
-        elif format_type == "slack":
-            new_header = f"\n\n🆕 *本次新增热点新闻* (共 {report_data['total_new_count']} 条)\n\n"
-
-        test_content = current_batch + new_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + new_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+    if report_ir["new_titles"]:
+        new_header = markup["new_header"].format(
+            separator=separator_line, total_new=report_ir["total_new_count"]
+        )
+        if not batch.try_add(new_header):
+            batch.start_new_batch(base_header, new_header)
 
         # 逐个处理新增新闻来源
-        for source_data in report_data["new_titles"]:
-            source_header = ""
-            if format_type in ("wework", "bark"):
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "telegram":
-                source_header = f"{source_data['source_name']} ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "ntfy":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "feishu":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "dingtalk":
-                source_header = f"**{source_data['source_name']}** ({len(source_data['titles'])} 条):\n\n"
-            elif format_type == "slack":
-                source_header = f"*{source_data['source_name']}* ({len(source_data['titles'])} 条):\n\n"
-
-            # 构建第一条新增新闻
-            first_news_line = ""
-            if source_data["titles"]:
-                first_title_data = source_data["titles"][0]
-                title_data_copy = first_title_data.copy()
-                title_data_copy["is_new"] = False
-
-                if format_type in ("wework", "bark"):
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
-                    )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
+        for source_data in report_ir["new_titles"]:
+            items = source_data["items"]
+            source_header = markup["source_header"].format(
+                source=source_data["source_name"], count=len(items)
+            )
 
+            # 构建第一条新增新闻（来源已在标题中，不再显示新增标记）
+            first_news_line = ""
+            if items:
+                formatted_title = render_item(
+                    markup["new_first_item"], items[0], show_source=False, is_new=False
+                )
                 first_news_line = f"  1. {formatted_title}\n"
 
             # 原子性检查：来源标题+第一条新闻
             source_with_first_news = source_header + first_news_line
-            test_content = current_batch + source_with_first_news
-
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + new_header + source_with_first_news
-                current_batch_has_content = True
-                start_index = 1
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
-                start_index = 1
+            if not batch.try_add(source_with_first_news):
+                batch.start_new_batch(base_header, new_header, source_with_first_news)
 
             # 处理剩余新增新闻
-            for j in range(start_index, len(source_data["titles"])):
-                title_data = source_data["titles"][j]
-                title_data_copy = title_data.copy()
-                title_data_copy["is_new"] = False
+            for j in range(1, len(items)):
+                formatted_title = render_item(
+                    markup["new_item"], items[j], show_source=False, is_new=False
+                )
+                news_line = f"  {j + 1}. {formatted_title}\n"
 
-                if format_type == "wework":
-                    formatted_title = format_title_for_platform(
-                        "wework", title_data_copy, show_source=False
-                    )
-                elif format_type == "telegram":
-                    formatted_title = format_title_for_platform(
-                        "telegram", title_data_copy, show_source=False
+                if not batch.try_add(news_line):
+                    batch.start_new_batch(
+                        base_header, new_header, source_header, news_line
                     )
-                elif format_type == "feishu":
-                    formatted_title = format_title_for_platform(
-                        "feishu", title_data_copy, show_source=False
-                    )
-                elif format_type == "dingtalk":
-                    formatted_title = format_title_for_platform(
-                        "dingtalk", title_data_copy, show_source=False
-                    )
-                elif format_type == "slack":
-                    formatted_title = format_title_for_platform(
-                        "slack", title_data_copy, show_source=False
-                    )
-                else:
-                    formatted_title = f"{title_data_copy['title']}"
 
-                news_line = f"  {j + 1}. {formatted_title}\n"
-
-                test_content = current_batch + news_line
-                if (
-                    len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                    >= max_bytes
-                ):
-                    if current_batch_has_content:
-                        batches.append(current_batch + base_footer)
-                    current_batch = base_header + new_header + source_header + news_line
-                    current_batch_has_content = True
-                else:
-                    current_batch = test_content
-                    current_batch_has_content = True
+            batch.add("\n")
 
-            current_batch += "\n"
+    if report_ir["failed_ids"]:
+        failed_header = markup["failed_header"].format(separator=separator_line)
+        if not batch.try_add(failed_header):
+            batch.start_new_batch(base_header, failed_header)
 
-    if report_data["failed_ids"]:
-        failed_header = ""
-        if format_type == "wework":
-            failed_header = f"\n\n\n\n⚠️ **数据获取失败的平台：**\n\n"
-        elif format_type == "telegram":
-            failed_header = f"\n\n⚠️ 数据获取失败的平台：\n\n"
-        elif format_type == "ntfy":
-            failed_header = f"\n\n⚠️ **数据获取失败的平台：**\n\n"
-        elif format_type == "feishu":
-            failed_header = f"\n{CONFIG['FEISHU_MESSAGE_SEPARATOR']}\n\n⚠️ **数据获取失败的平台：**\n\n"
-        elif format_type == "dingtalk":
-            failed_header = f"\n---\n\n⚠️ **数据获取失败的平台：**\n\n"
+        for id_value in report_ir["failed_ids"]:
+            failed_line = markup["failed_line"].format(id=id_value)
+            if not batch.try_add(failed_line):
+                batch.start_new_batch(base_header, failed_header, failed_line)
 
-        test_content = current_batch + failed_header
-        if (
-            len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-            >= max_bytes
-        ):
-            if current_batch_has_content:
-                batches.append(current_batch + base_footer)
-            current_batch = base_header + failed_header
-            current_batch_has_content = True
-        else:
-            current_batch = test_content
-            current_batch_has_content = True
+    # 完成最后批次
+    return batch.finish()
 
-        for i, id_value in enumerate(report_data["failed_ids"], 1):
-            if format_type == "feishu":
-                failed_line = f"  • <font color='red'>{id_value}</font>\n"
-            elif format_type == "dingtalk":
-                failed_line = f"  • **{id_value}**\n"
-            else:
-                failed_line = f"  • {id_value}\n"
 
-            test_content = current_batch + failed_line
-            if (
-                len(test_content.encode("utf-8")) + len(base_footer.encode("utf-8"))
-                >= max_bytes
-            ):
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + failed_header + failed_line
-                current_batch_has_content = True
-            else:
-                current_batch = test_content
-                current_batch_has_content = True
+def dispatch_notification_channels(
+    channel_tasks: List[Tuple[str, Callable, tuple]], parallel: bool = True
+) -> Dict[str, bool]:
+    """执行各渠道的发送任务，结果按任务顺序汇总
 
-    # 完成最后批次
-    if current_batch_has_content:
-        batches.append(current_batch + base_footer)
+    parallel 为 True 且有多个渠道时，每个渠道在独立线程中发送，
+    渠道内部的批次顺序和批次间隔不变，慢渠道不会拖慢其他渠道。
+    """
+    if not parallel or len(channel_tasks) <= 1:
+        return {
+            channel: send_func(*args) for channel, send_func, args in channel_tasks
+        }
 
-    return batches
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(channel_tasks)) as executor:
+        futures = [
+            (channel, executor.submit(send_func, *args))
+            for channel, send_func, args in channel_tasks
+        ]
+        for channel, future in futures:
+            try:
+                results[channel] = future.result()
+            except Exception as e:
+                print(f"{channel} 通知发送出错：{e}")
+                results[channel] = False
+    return results
 
 
 def send_to_notifications(
@@ -3540,8 +4538,14 @@ def send_to_notifications(
     proxy_url: Optional[str] = None,
     mode: str = "daily",
     html_file_path: Optional[str] = None,
-) -> Dict[str, bool]:
-    """发送数据到多个通知平台"""
+    title_scores: Optional[Dict[str, int]] = None,
+    min_score: int = 0,
+    dedup_index: Optional[TitleDedupIndex] = None,
+) -> Dict[str, Union[bool, "PendingEmail"]]:
+    """发送数据到多个通知平台
+
+    后台发送的邮件结果为 PendingEmail，送达后才记录推送和推送摘要。
+    """
     results = {}
 
     if CONFIG["PUSH_WINDOW"]["ENABLED"]:
@@ -3563,7 +4567,26 @@ def send_to_notifications(
             else:
                 print(f"推送窗口控制：今天首次推送")
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+    report_data = prepare_report_data(
+        stats,
+        failed_ids,
+        new_titles,
+        id_to_name,
+        mode,
+        title_scores,
+        min_score,
+        dedup_index,
+    )
+
+    # 推送内容摘要（需在配置中开启跳过未变化的推送）
+    digest_store = None
+    if CONFIG["SKIP_UNCHANGED_PUSH"]:
+        digest = compute_report_digest(
+            report_data,
+            report_type,
+            update_info if CONFIG["SHOW_VERSION_UPDATE"] else None,
+        )
+        digest_store = ReportDigestStore()
 
     feishu_url = CONFIG["FEISHU_WEBHOOK_URL"]
     dingtalk_url = CONFIG["DINGTALK_WEBHOOK_URL"]
@@ -3583,94 +4606,471 @@ def send_to_notifications(
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
+    # 收集已配置的渠道：(渠道名, 发送函数, 参数)，顺序即结果顺序
+    channel_tasks = []
+
     # 发送到飞书
     if feishu_url:
-        results["feishu"] = send_to_feishu(
-            feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode
+        channel_tasks.append(
+            (
+                "feishu",
+                send_to_feishu,
+                (feishu_url, report_data, report_type, update_info_to_send, proxy_url, mode),
+            )
         )
 
     # 发送到钉钉
     if dingtalk_url:
-        results["dingtalk"] = send_to_dingtalk(
-            dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode
+        channel_tasks.append(
+            (
+                "dingtalk",
+                send_to_dingtalk,
+                (dingtalk_url, report_data, report_type, update_info_to_send, proxy_url, mode),
+            )
         )
 
     # 发送到企业微信
     if wework_url:
-        results["wework"] = send_to_wework(
-            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
+        channel_tasks.append(
+            (
+                "wework",
+                send_to_wework,
+                (wework_url, report_data, report_type, update_info_to_send, proxy_url, mode),
+            )
         )
 
     # 发送到 Telegram
     if telegram_token and telegram_chat_id:
-        results["telegram"] = send_to_telegram(
-            telegram_token,
-            telegram_chat_id,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
+        channel_tasks.append(
+            (
+                "telegram",
+                send_to_telegram,
+                (
+                    telegram_token,
+                    telegram_chat_id,
+                    report_data,
+                    report_type,
+                    update_info_to_send,
+                    proxy_url,
+                    mode,
+                ),
+            )
+        )
+
+    # 发送到 ntfy
+    if ntfy_server_url and ntfy_topic:
+        channel_tasks.append(
+            (
+                "ntfy",
+                send_to_ntfy,
+                (
+                    ntfy_server_url,
+                    ntfy_topic,
+                    ntfy_token,
+                    report_data,
+                    report_type,
+                    update_info_to_send,
+                    proxy_url,
+                    mode,
+                ),
+            )
+        )
+
+    # 发送到 Bark
+    if bark_url:
+        channel_tasks.append(
+            (
+                "bark",
+                send_to_bark,
+                (bark_url, report_data, report_type, update_info_to_send, proxy_url, mode),
+            )
+        )
+
+    # 发送到 Slack
+    if slack_webhook_url:
+        channel_tasks.append(
+            (
+                "slack",
+                send_to_slack,
+                (
+                    slack_webhook_url,
+                    report_data,
+                    report_type,
+                    update_info_to_send,
+                    proxy_url,
+                    mode,
+                ),
+            )
         )
 
-    # 发送到 ntfy
-    if ntfy_server_url and ntfy_topic:
-        results["ntfy"] = send_to_ntfy(
-            ntfy_server_url,
-            ntfy_topic,
-            ntfy_token,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
+    # 发送邮件
+    if email_from and email_password and email_to:
+        channel_tasks.append(
+            (
+                "email",
+                send_to_email,
+                (
+                    email_from,
+                    email_password,
+                    email_to,
+                    report_type,
+                    html_file_path,
+                    email_smtp_server,
+                    email_smtp_port,
+                ),
+            )
+        )
+
+    # 按渠道判断内容是否与上次成功推送相同：上次失败的渠道本次仍会推送
+    if digest_store is not None and channel_tasks:
+        changed_tasks = [
+            task
+            for task in channel_tasks
+            if not digest_store.is_unchanged(
+                f"push:{mode}:{report_type}:{task[0]}", digest
+            )
+        ]
+        if not changed_tasks:
+            print(f"{report_type}内容与上次推送相同，跳过推送")
+            return results
+        skipped = [
+            NOTIFICATION_CHANNEL_NAMES.get(task[0], task[0])
+            for task in channel_tasks
+            if task not in changed_tasks
+        ]
+        if skipped:
+            print(f"{report_type}内容与上次推送相同，跳过渠道：{', '.join(skipped)}")
+        channel_tasks = changed_tasks
+
+    # 渠道无关的中间表示只构建一次，各渠道分批时直接复用
+    report_data["ir"] = build_report_ir(report_data)
+
+    results.update(
+        dispatch_notification_channels(channel_tasks, CONFIG["PARALLEL_SEND"])
+    )
+
+    if not results:
+        print("未配置任何通知渠道，跳过通知发送")
+
+    record_once_per_day = (
+        CONFIG["PUSH_WINDOW"]["ENABLED"] and CONFIG["PUSH_WINDOW"]["ONCE_PER_DAY"]
+    )
+    push_recorded = False
+
+    def record_delivery(channel: str, success: bool) -> None:
+        """渠道送达后记录推送（每天只推一次时）和该渠道的推送摘要"""
+        nonlocal push_recorded
+        if not success:
+            return
+        if record_once_per_day and not push_recorded:
+            PushRecordManager().record_push(report_type)
+            push_recorded = True
+        if digest_store is not None:
+            digest_store.record(f"push:{mode}:{report_type}:{channel}", digest)
+
+    # 后台发送的邮件结果未定，等 wait_for_email_deliveries 得到结果后再记录
+    for channel, result in results.items():
+        if isinstance(result, PendingEmail):
+            result.on_result(
+                lambda success, channel=channel: record_delivery(channel, success)
+            )
+        else:
+            record_delivery(channel, result)
+
+    return results
+
+
+NOTIFICATION_CHANNEL_NAMES = {
+    "feishu": "飞书",
+    "dingtalk": "钉钉",
+    "wework": "企业微信",
+    "telegram": "Telegram",
+    "ntfy": "ntfy",
+    "bark": "Bark",
+    "slack": "Slack",
+    "email": "邮件",
+}
+
+# 部分批次送达也视为成功、失败批次不阻塞后续批次的渠道（deliver_batches 的 allow_partial）
+PARTIAL_DELIVERY_CHANNELS = {"ntfy", "bark"}
+
+
+def build_batch_entries(
+    batches: List[str], report_type: str, reverse: bool = False, **extra
+) -> List[Dict]:
+    """将批次内容包装为按推送顺序排列的发送条目
+
+    reverse 为 True 时从最后一批开始推送（batch_num 仍为用户视角的编号）。
+    extra 中的字段附加到每个条目，供单批次发送函数使用。
+    """
+    total_batches = len(batches)
+    numbered = list(enumerate(batches, 1))
+    if reverse:
+        numbered.reverse()
+
+    return [
+        {
+            "content": content,
+            "batch_num": batch_num,
+            "total_batches": total_batches,
+            "push_index": push_index,
+            "report_type": report_type,
+            **extra,
+        }
+        for push_index, (batch_num, content) in enumerate(numbered, 1)
+    ]
+
+
+class NotificationThrottled(Exception):
+    """渠道返回限流响应，retry_after 为服务端要求的等待秒数（未提供时为 None）"""
+
+    def __init__(self, retry_after: Optional[float] = None):
+        super().__init__(f"限流，建议等待 {retry_after} 秒" if retry_after else "限流")
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(response) -> Optional[float]:
+    """读取响应头中的 Retry-After（秒）"""
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+class ChannelPacer:
+    """渠道发送节奏：令牌桶限速，收到限流响应后暂停发送
+
+    rate 为每秒补充的令牌数（<=0 表示不限速），burst 为桶容量。
+    waited / throttled 累计限速等待的秒数和限流次数，用于汇报推送节奏。
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, int(burst))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waited = 0.0
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """取得一个发送令牌，必要时等待，返回等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self.blocked_until - now)
+            if self.rate > 0:
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens < 1:
+                    wait = max(wait, (1 - self.tokens) / self.rate)
+                # 先预扣令牌（可为负），并发调用时后来者顺延等待
+                self.tokens -= 1
+            self.waited += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def throttle(self, delay: float) -> None:
+        """服务端限流：delay 秒内不再发送，并清空桶内积攒的令牌"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+            self.tokens = min(self.tokens, 0.0)
+            self.throttled += 1
+
+
+_channel_pacers: Dict[str, ChannelPacer] = {}
+_channel_pacers_lock = threading.Lock()
+
+
+def get_channel_pacer(channel: str, interval: float) -> ChannelPacer:
+    """获取渠道的发送节奏控制器
+
+    启用频率限制时按渠道的限速配置创建，并在同一进程内共享（同一次运行的实时推送
+    和汇总推送共用令牌桶）；未启用时按固定间隔 interval 发送，与原先的批次间隔一致。
+    """
+    if not CONFIG["RATE_LIMIT"]["ENABLED"]:
+        return ChannelPacer(1 / interval if interval > 0 else 0)
+
+    # 自托管的 ntfy 服务器不受 ntfy.sh 公共限额约束，使用单独的限速配置
+    profile_key = channel
+    if channel == "ntfy" and "ntfy.sh" not in (CONFIG["NTFY_SERVER_URL"] or ""):
+        profile_key = "ntfy_self_hosted"
+
+    with _channel_pacers_lock:
+        pacer = _channel_pacers.get(channel)
+        if pacer is None:
+            profile = CONFIG["RATE_LIMIT"]["CHANNELS"].get(profile_key)
+            if profile:
+                pacer = ChannelPacer(profile["rate"] / 60, profile["burst"])
+            else:
+                pacer = ChannelPacer(1 / interval if interval > 0 else 0)
+            _channel_pacers[channel] = pacer
+        return pacer
+
+
+def send_paced_batch(
+    pacer: ChannelPacer, send_batch: Callable[[Dict], bool], entry: Dict
+) -> bool:
+    """按节奏发送单个批次，遇到限流时等待服务端要求的时间（或指数退避）后重试"""
+    max_retries = CONFIG["RATE_LIMIT"]["MAX_THROTTLE_RETRIES"]
+    backoff = CONFIG["RATE_LIMIT"]["THROTTLE_BACKOFF"]
+
+    for attempt in range(max_retries + 1):
+        pacer.acquire()
+        try:
+            return send_batch(entry)
+        except NotificationThrottled as e:
+            delay = e.retry_after or backoff * 2 ** attempt
+            pacer.throttle(delay)
+            if attempt < max_retries:
+                print(
+                    f"第 {entry['batch_num']}/{entry['total_batches']} 批次被限流，{delay:g} 秒后重试（{attempt + 1}/{max_retries}）"
+                )
+
+    print(f"第 {entry['batch_num']}/{entry['total_batches']} 批次限流重试用尽")
+    return False
+
+
+def deliver_batches(
+    channel: str,
+    entries: List[Dict],
+    send_batch: Callable[[Dict], bool],
+    report_type: str,
+    interval: float,
+    allow_partial: bool = False,
+) -> bool:
+    """按顺序逐批发送，发送节奏由渠道的令牌桶控制（未启用频率限制时为固定间隔 interval 秒）
+
+    遇到失败批次即停止（allow_partial 的渠道继续发送后续批次）；
+    启用发件箱时批次先持久化，失败按退避重试，未送达的批次留待下次运行续发。
+    allow_partial 为 True 时部分批次成功也视为成功。
+    """
+    channel_name = NOTIFICATION_CHANNEL_NAMES.get(channel, channel)
+    total_batches = len(entries)
+
+    pacer = get_channel_pacer(channel, interval)
+    start_time = time.monotonic()
+    waited_before, throttled_before = pacer.waited, pacer.throttled
+
+    def paced_send(entry: Dict) -> bool:
+        return send_paced_batch(pacer, send_batch, entry)
+
+    if CONFIG["OUTBOX"]["ENABLED"]:
+        with NotificationOutbox(channel) as outbox:
+            backlog = len(outbox.pending)
+            keys = outbox.enqueue(entries)
+            if backlog:
+                print(f"{channel_name}发件箱中有 {backlog} 个积压批次，先行续发")
+            outbox.flush(paced_send, 0, allow_partial)
+            success_count = sum(1 for key in keys if key in outbox.sent)
+    else:
+        success_count = 0
+        for entry in entries:
+            if paced_send(entry):
+                success_count += 1
+            elif not allow_partial:
+                break
+
+    if total_batches > 1:
+        print(
+            f"{channel_name}推送节奏：{total_batches} 批次用时 {time.monotonic() - start_time:.1f} 秒，"
+            f"限速等待 {pacer.waited - waited_before:.1f} 秒，限流 {pacer.throttled - throttled_before} 次"
         )
 
-    # 发送到 Bark
-    if bark_url:
-        results["bark"] = send_to_bark(
-            bark_url,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
-        )
+    if success_count < total_batches and not allow_partial:
+        return False
 
-    # 发送到 Slack
-    if slack_webhook_url:
-        results["slack"] = send_to_slack(
-            slack_webhook_url,
-            report_data,
-            report_type,
-            update_info_to_send,
-            proxy_url,
-            mode,
+    # 判断整体发送是否成功
+    if success_count == total_batches:
+        print(f"{channel_name}所有 {total_batches} 批次发送完成 [{report_type}]")
+        return True
+    elif allow_partial and success_count > 0:
+        print(
+            f"{channel_name}部分发送成功：{success_count}/{total_batches} 批次 [{report_type}]"
         )
+        return True  # 部分成功也视为成功
+    elif allow_partial:
+        print(f"{channel_name}发送完全失败 [{report_type}]")
+    return False
 
-    # 发送邮件
-    if email_from and email_password and email_to:
-        results["email"] = send_to_email(
-            email_from,
-            email_password,
-            email_to,
-            report_type,
-            html_file_path,
-            email_smtp_server,
-            email_smtp_port,
+
+def _outbox_batch_sender(
+    channel: str, proxy_url: Optional[str] = None
+) -> Optional[Tuple[Callable[[Dict], bool], float]]:
+    """根据当前配置构建渠道的单批次发送函数与批次间隔，用于补发发件箱积压批次"""
+    interval = CONFIG["BATCH_SEND_INTERVAL"]
+
+    if channel == "feishu" and CONFIG["FEISHU_WEBHOOK_URL"]:
+        url = CONFIG["FEISHU_WEBHOOK_URL"]
+        return lambda entry: _send_feishu_batch(url, entry, proxy_url), interval
+    if channel == "dingtalk" and CONFIG["DINGTALK_WEBHOOK_URL"]:
+        url = CONFIG["DINGTALK_WEBHOOK_URL"]
+        return lambda entry: _send_dingtalk_batch(url, entry, proxy_url), interval
+    if channel == "wework" and CONFIG["WEWORK_WEBHOOK_URL"]:
+        url = CONFIG["WEWORK_WEBHOOK_URL"]
+        return lambda entry: _send_wework_batch(url, entry, proxy_url), interval
+    if channel == "telegram" and CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"]:
+        bot_token = CONFIG["TELEGRAM_BOT_TOKEN"]
+        chat_id = CONFIG["TELEGRAM_CHAT_ID"]
+        return (
+            lambda entry: _send_telegram_batch(bot_token, chat_id, entry, proxy_url),
+            interval,
+        )
+    if channel == "ntfy" and CONFIG["NTFY_SERVER_URL"] and CONFIG["NTFY_TOPIC"]:
+        server_url = CONFIG["NTFY_SERVER_URL"]
+        topic = CONFIG["NTFY_TOPIC"]
+        token = CONFIG.get("NTFY_TOKEN", "")
+        return (
+            lambda entry: _send_ntfy_batch(server_url, topic, token, entry, proxy_url),
+            2 if "ntfy.sh" in server_url else 1,
         )
+    if channel == "bark" and CONFIG["BARK_URL"]:
+        api_endpoint, device_key = _parse_bark_url(CONFIG["BARK_URL"])
+        if device_key:
+            return (
+                lambda entry: _send_bark_batch(api_endpoint, device_key, entry, proxy_url),
+                interval,
+            )
+    if channel == "slack" and CONFIG["SLACK_WEBHOOK_URL"]:
+        url = CONFIG["SLACK_WEBHOOK_URL"]
+        return lambda entry: _send_slack_batch(url, entry, proxy_url), interval
+    return None
 
-    if not results:
-        print("未配置任何通知渠道，跳过通知发送")
 
-    # 如果成功发送了任何通知，且启用了每天只推一次，则记录推送
-    if (
-        CONFIG["PUSH_WINDOW"]["ENABLED"]
-        and CONFIG["PUSH_WINDOW"]["ONCE_PER_DAY"]
-        and any(results.values())
-    ):
-        push_manager = PushRecordManager()
-        push_manager.record_push(report_type)
+def flush_notification_outbox(proxy_url: Optional[str] = None) -> Dict[str, int]:
+    """补发发件箱中所有渠道的积压批次，返回各渠道本次发送成功的批次数"""
+    results = {}
+    outbox_dir = Path("output") / ".outbox"
+    if not outbox_dir.exists():
+        print("发件箱为空")
+        return results
+
+    for outbox_file in sorted(outbox_dir.glob("*.json")):
+        channel = outbox_file.stem
+        with NotificationOutbox(channel) as outbox:
+            if not outbox.pending:
+                outbox.save()
+                continue
+
+            sender = _outbox_batch_sender(channel, proxy_url)
+            if sender is None:
+                print(
+                    f"发件箱：{channel} 渠道未配置，保留 {len(outbox.pending)} 个积压批次"
+                )
+                continue
+
+            send_batch, interval = sender
+            pacer = get_channel_pacer(channel, interval)
+            print(f"发件箱：补发 {channel} 的 {len(outbox.pending)} 个积压批次")
+            results[channel] = outbox.flush(
+                lambda entry: send_paced_batch(pacer, send_batch, entry),
+                0,
+                channel in PARTIAL_DELIVERY_CHANNELS,
+            )
 
     return results
 
@@ -3684,11 +5084,6 @@ def send_to_feishu(
     mode: str = "daily",
 ) -> bool:
     """发送到飞书（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，使用飞书专用的批次大小
     feishu_batch_size = CONFIG.get("FEISHU_BATCH_SIZE", 29000)
     # 预留批次头部空间，避免添加头部后超限
@@ -3706,57 +5101,74 @@ def send_to_feishu(
 
     print(f"飞书消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送飞书第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
+    total_titles = sum(
+        len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
+    )
+    entries = build_batch_entries(batches, report_type, total_titles=total_titles)
 
-        total_titles = sum(
-            len(stat["titles"]) for stat in report_data["stats"] if stat["count"] > 0
-        )
-        now = get_beijing_time()
+    return deliver_batches(
+        "feishu",
+        entries,
+        lambda entry: _send_feishu_batch(webhook_url, entry, proxy_url),
+        report_type,
+        CONFIG["BATCH_SEND_INTERVAL"],
+    )
 
-        payload = {
-            "msg_type": "text",
-            "content": {
-                "total_titles": total_titles,
-                "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
-                "report_type": report_type,
-                "text": batch_content,
-            },
-        }
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                # 检查飞书的响应状态
-                if result.get("StatusCode") == 0 or result.get("code") == 0:
-                    print(f"飞书第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
-                    print(
-                        f"飞书第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{error_msg}"
-                    )
-                    return False
-            else:
-                print(
-                    f"飞书第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"飞书第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
+def _send_feishu_batch(
+    webhook_url: str, entry: Dict, proxy_url: Optional[str] = None
+) -> bool:
+    """发送飞书单个批次"""
+    headers = {"Content-Type": "application/json"}
+    proxies = None
+    if proxy_url:
+        proxies = {"http": proxy_url, "https": proxy_url}
+
+    report_type = entry["report_type"]
+    batch_label = f"{entry['batch_num']}/{entry['total_batches']}"
+    batch_content = entry["content"]
+    batch_size = len(batch_content.encode("utf-8"))
+    print(f"发送飞书第 {batch_label} 批次，大小：{batch_size} 字节 [{report_type}]")
 
-    print(f"飞书所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    now = get_beijing_time()
+
+    payload = {
+        "msg_type": "text",
+        "content": {
+            "total_titles": entry.get("total_titles", 0),
+            "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "report_type": report_type,
+            "text": batch_content,
+        },
+    }
+
+    try:
+        response = requests.post(
+            webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+        )
+        if response.status_code == 200:
+            result = response.json()
+            # 检查飞书的响应状态
+            if result.get("StatusCode") == 0 or result.get("code") == 0:
+                print(f"飞书第 {batch_label} 批次发送成功 [{report_type}]")
+                return True
+            if result.get("code") == FEISHU_THROTTLE_CODE:
+                print(f"飞书第 {batch_label} 批次触发频率限制 [{report_type}]")
+                raise NotificationThrottled()
+            error_msg = result.get("msg") or result.get("StatusMessage", "未知错误")
+            print(f"飞书第 {batch_label} 批次发送失败 [{report_type}]，错误：{error_msg}")
+        elif response.status_code == 429:
+            print(f"飞书第 {batch_label} 批次触发频率限制 [{report_type}]")
+            raise NotificationThrottled(_retry_after_seconds(response))
+        else:
+            print(
+                f"飞书第 {batch_label} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+            )
+    except NotificationThrottled:
+        raise
+    except Exception as e:
+        print(f"飞书第 {batch_label} 批次发送出错 [{report_type}]：{e}")
+    return False
 
 
 def send_to_dingtalk(
@@ -3768,11 +5180,6 @@ def send_to_dingtalk(
     mode: str = "daily",
 ) -> bool:
     """发送到钉钉（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，使用钉钉专用的批次大小
     dingtalk_batch_size = CONFIG.get("DINGTALK_BATCH_SIZE", 20000)
     # 预留批次头部空间，避免添加头部后超限
@@ -3790,48 +5197,65 @@ def send_to_dingtalk(
 
     print(f"钉钉消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送钉钉第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
+    return deliver_batches(
+        "dingtalk",
+        build_batch_entries(batches, report_type),
+        lambda entry: _send_dingtalk_batch(webhook_url, entry, proxy_url),
+        report_type,
+        CONFIG["BATCH_SEND_INTERVAL"],
+    )
 
-        payload = {
-            "msgtype": "markdown",
-            "markdown": {
-                "title": f"TrendRadar 热点分析报告 - {report_type}",
-                "text": batch_content,
-            },
-        }
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"钉钉第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"钉钉第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"钉钉第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"钉钉第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
+def _send_dingtalk_batch(
+    webhook_url: str, entry: Dict, proxy_url: Optional[str] = None
+) -> bool:
+    """发送钉钉单个批次"""
+    headers = {"Content-Type": "application/json"}
+    proxies = None
+    if proxy_url:
+        proxies = {"http": proxy_url, "https": proxy_url}
+
+    report_type = entry["report_type"]
+    batch_label = f"{entry['batch_num']}/{entry['total_batches']}"
+    batch_content = entry["content"]
+    batch_size = len(batch_content.encode("utf-8"))
+    print(f"发送钉钉第 {batch_label} 批次，大小：{batch_size} 字节 [{report_type}]")
+
+    payload = {
+        "msgtype": "markdown",
+        "markdown": {
+            "title": f"TrendRadar 热点分析报告 - {report_type}",
+            "text": batch_content,
+        },
+    }
 
-    print(f"钉钉所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    try:
+        response = requests.post(
+            webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+        )
+        if response.status_code == 200:
+            result = response.json()
+            if result.get("errcode") == 0:
+                print(f"钉钉第 {batch_label} 批次发送成功 [{report_type}]")
+                return True
+            if result.get("errcode") == DINGTALK_THROTTLE_CODE:
+                print(f"钉钉第 {batch_label} 批次触发频率限制 [{report_type}]")
+                raise NotificationThrottled()
+            print(
+                f"钉钉第 {batch_label} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
+            )
+        elif response.status_code == 429:
+            print(f"钉钉第 {batch_label} 批次触发频率限制 [{report_type}]")
+            raise NotificationThrottled(_retry_after_seconds(response))
+        else:
+            print(
+                f"钉钉第 {batch_label} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+            )
+    except NotificationThrottled:
+        raise
+    except Exception as e:
+        print(f"钉钉第 {batch_label} 批次发送出错 [{report_type}]：{e}")
+    return False
 
 
 def strip_markdown(text: str) -> str:
@@ -3887,11 +5311,6 @@ def send_to_wework(
     mode: str = "daily",
 ) -> bool:
     """发送到企业微信（支持分批发送，支持 markdown 和 text 两种格式）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取消息类型配置（markdown 或 text）
     msg_type = CONFIG.get("WEWORK_MSG_TYPE", "markdown").lower()
     is_text_mode = msg_type == "text"
@@ -3916,50 +5335,68 @@ def send_to_wework(
 
     print(f"企业微信消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        # 根据消息类型构建 payload
-        if is_text_mode:
-            # text 格式：去除 markdown 语法
-            plain_content = strip_markdown(batch_content)
-            payload = {"msgtype": "text", "text": {"content": plain_content}}
-            batch_size = len(plain_content.encode("utf-8"))
-        else:
-            # markdown 格式：保持原样
-            payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
-            batch_size = len(batch_content.encode("utf-8"))
+    return deliver_batches(
+        "wework",
+        build_batch_entries(batches, report_type),
+        lambda entry: _send_wework_batch(webhook_url, entry, proxy_url),
+        report_type,
+        CONFIG["BATCH_SEND_INTERVAL"],
+    )
 
-        print(
-            f"发送企业微信第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("errcode") == 0:
-                    print(f"企业微信第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"企业微信第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
-        except Exception as e:
-            print(f"企业微信第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
+def _send_wework_batch(
+    webhook_url: str, entry: Dict, proxy_url: Optional[str] = None
+) -> bool:
+    """发送企业微信单个批次（text 模式下去除 markdown 语法）"""
+    headers = {"Content-Type": "application/json"}
+    proxies = None
+    if proxy_url:
+        proxies = {"http": proxy_url, "https": proxy_url}
+
+    report_type = entry["report_type"]
+    batch_label = f"{entry['batch_num']}/{entry['total_batches']}"
+    batch_content = entry["content"]
+
+    # 根据消息类型构建 payload
+    if CONFIG.get("WEWORK_MSG_TYPE", "markdown").lower() == "text":
+        # text 格式：去除 markdown 语法
+        plain_content = strip_markdown(batch_content)
+        payload = {"msgtype": "text", "text": {"content": plain_content}}
+        batch_size = len(plain_content.encode("utf-8"))
+    else:
+        # markdown 格式：保持原样
+        payload = {"msgtype": "markdown", "markdown": {"content": batch_content}}
+        batch_size = len(batch_content.encode("utf-8"))
+
+    print(f"发送企业微信第 {batch_label} 批次，大小：{batch_size} 字节 [{report_type}]")
 
-    print(f"企业微信所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    try:
+        response = requests.post(
+            webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+        )
+        if response.status_code == 200:
+            result = response.json()
+            if result.get("errcode") == 0:
+                print(f"企业微信第 {batch_label} 批次发送成功 [{report_type}]")
+                return True
+            if result.get("errcode") == WEWORK_THROTTLE_CODE:
+                print(f"企业微信第 {batch_label} 批次触发频率限制 [{report_type}]")
+                raise NotificationThrottled()
+            print(
+                f"企业微信第 {batch_label} 批次发送失败 [{report_type}]，错误：{result.get('errmsg')}"
+            )
+        elif response.status_code == 429:
+            print(f"企业微信第 {batch_label} 批次触发频率限制 [{report_type}]")
+            raise NotificationThrottled(_retry_after_seconds(response))
+        else:
+            print(
+                f"企业微信第 {batch_label} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+            )
+    except NotificationThrottled:
+        raise
+    except Exception as e:
+        print(f"企业微信第 {batch_label} 批次发送出错 [{report_type}]：{e}")
+    return False
 
 
 def send_to_telegram(
@@ -3972,13 +5409,6 @@ def send_to_telegram(
     mode: str = "daily",
 ) -> bool:
     """发送到Telegram（支持分批发送）"""
-    headers = {"Content-Type": "application/json"}
-    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容，预留批次头部空间
     telegram_batch_size = CONFIG.get("MESSAGE_BATCH_SIZE", 4000)
     header_reserve = _get_max_batch_header_size("telegram")
@@ -3991,47 +5421,257 @@ def send_to_telegram(
 
     print(f"Telegram消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送Telegram第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
+    return deliver_batches(
+        "telegram",
+        build_batch_entries(batches, report_type),
+        lambda entry: _send_telegram_batch(bot_token, chat_id, entry, proxy_url),
+        report_type,
+        CONFIG["BATCH_SEND_INTERVAL"],
+    )
+
+
+def _send_telegram_batch(
+    bot_token: str, chat_id: str, entry: Dict, proxy_url: Optional[str] = None
+) -> bool:
+    """发送 Telegram 单个批次"""
+    headers = {"Content-Type": "application/json"}
+    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+
+    proxies = None
+    if proxy_url:
+        proxies = {"http": proxy_url, "https": proxy_url}
+
+    report_type = entry["report_type"]
+    batch_label = f"{entry['batch_num']}/{entry['total_batches']}"
+    batch_content = entry["content"]
+    batch_size = len(batch_content.encode("utf-8"))
+    print(f"发送Telegram第 {batch_label} 批次，大小：{batch_size} 字节 [{report_type}]")
+
+    payload = {
+        "chat_id": chat_id,
+        "text": batch_content,
+        "parse_mode": "HTML",
+        "disable_web_page_preview": True,
+    }
+
+    try:
+        response = requests.post(
+            url, headers=headers, json=payload, proxies=proxies, timeout=30
         )
+        if response.status_code == 200:
+            result = response.json()
+            if result.get("ok"):
+                print(f"Telegram第 {batch_label} 批次发送成功 [{report_type}]")
+                return True
+            print(
+                f"Telegram第 {batch_label} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
+            )
+        elif response.status_code == 429:
+            # Telegram 在 parameters.retry_after 中给出需要等待的秒数
+            try:
+                retry_after = response.json().get("parameters", {}).get("retry_after")
+            except ValueError:
+                retry_after = None
+            print(f"Telegram第 {batch_label} 批次触发频率限制 [{report_type}]")
+            raise NotificationThrottled(retry_after or _retry_after_seconds(response))
+        else:
+            print(
+                f"Telegram第 {batch_label} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+            )
+    except NotificationThrottled:
+        raise
+    except Exception as e:
+        print(f"Telegram第 {batch_label} 批次发送出错 [{report_type}]：{e}")
+    return False
 
-        payload = {
-            "chat_id": chat_id,
-            "text": batch_content,
-            "parse_mode": "HTML",
-            "disable_web_page_preview": True,
-        }
 
+class SMTPConnectionPool:
+    """SMTP 连接池：按 (服务器, 端口, 加密方式, 账号) 复用已登录的连接
+
+    取用前先发 NOOP 探活，失效的连接直接丢弃并重新建立；进程退出时统一 QUIT。
+    """
+
+    def __init__(self):
+        self._connections = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _connect(
+        smtp_server: str,
+        smtp_port: int,
+        use_tls: bool,
+        from_email: str,
+        password: str,
+        timeout: float,
+    ) -> smtplib.SMTP:
+        if use_tls:
+            # TLS 模式
+            server = smtplib.SMTP(smtp_server, smtp_port, timeout=timeout)
+            server.set_debuglevel(0)  # 设为1可以查看详细调试信息
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+        else:
+            # SSL 模式
+            server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=timeout)
+            server.set_debuglevel(0)
+            server.ehlo()
+
+        # 登录
+        server.login(from_email, password)
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
         try:
-            response = requests.post(
-                url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("ok"):
-                    print(f"Telegram第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                    # 批次间间隔
-                    if i < len(batches):
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{result.get('description')}"
-                    )
-                    return False
-            else:
-                print(
-                    f"Telegram第 {i}/{len(batches)} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                return False
+            server.quit()
+        except Exception:
+            server.close()
+
+    def acquire(
+        self,
+        smtp_server: str,
+        smtp_port: int,
+        use_tls: bool,
+        from_email: str,
+        password: str,
+        timeout: float = 30,
+    ) -> Tuple[smtplib.SMTP, bool]:
+        """取出可用连接，返回 (连接, 是否为复用的连接)"""
+        key = (smtp_server, smtp_port, use_tls, from_email)
+        with self._lock:
+            server = self._connections.pop(key, None)
+
+        if server is not None:
+            try:
+                if server.noop()[0] == 250:
+                    return server, True
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close(server)
+
+        return (
+            self._connect(smtp_server, smtp_port, use_tls, from_email, password, timeout),
+            False,
+        )
+
+    def release(
+        self, smtp_server: str, smtp_port: int, use_tls: bool, from_email: str, server
+    ) -> None:
+        """归还连接；同一账号已有空闲连接时关闭多余的"""
+        key = (smtp_server, smtp_port, use_tls, from_email)
+        with self._lock:
+            existing = self._connections.get(key)
+            if existing is None:
+                self._connections[key] = server
+                return
+        self._close(server)
+
+    def discard(self, server: smtplib.SMTP) -> None:
+        self._close(server)
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+        for server in connections:
+            self._close(server)
+
+
+SMTP_POOL = SMTPConnectionPool()
+atexit.register(SMTP_POOL.close_all)
+
+
+
+class PendingEmail:
+    """后台发送中的邮件
+
+    send_to_email 开启后台发送时返回此对象而不是 True：投递结果要等
+    wait_for_email_deliveries 确定后才知道，依赖结果的记录（推送记录、
+    推送摘要）通过 on_result 注册，届时以最终结果调用。
+    """
+
+    def __init__(self, report_type: str, future: Future):
+        self.report_type = report_type
+        self.future = future
+        self._callbacks: List[Callable[[bool], None]] = []
+
+    def on_result(self, callback: Callable[[bool], None]) -> None:
+        self._callbacks.append(callback)
+
+    def resolve(self, success: bool) -> None:
+        for callback in self._callbacks:
+            try:
+                callback(success)
+            except Exception as e:
+                print(f"处理邮件发送结果出错 [{self.report_type}]：{e}")
+
+
+# 后台邮件发送：守护线程依次投递（同一连接可复用），程序退出前统一等待并汇报结果；
+# 守护线程不会阻止解释器退出，超时未完成的邮件直接记为失败
+_email_queue: Optional[queue.Queue] = None
+_email_deliveries: List[PendingEmail] = []
+
+
+def _email_worker(jobs: queue.Queue) -> None:
+    while True:
+        future, delivery_args = jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(deliver_email(*delivery_args))
         except Exception as e:
-            print(f"Telegram第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
+            future.set_exception(e)
+
+
+def queue_email_delivery(report_type: str, delivery_args: tuple) -> PendingEmail:
+    """把邮件放入后台发送队列"""
+    global _email_queue
+    if _email_queue is None:
+        _email_queue = queue.Queue()
+        threading.Thread(
+            target=_email_worker, args=(_email_queue,), name="email", daemon=True
+        ).start()
+
+    pending = PendingEmail(report_type, Future())
+    _email_queue.put((pending.future, delivery_args))
+    _email_deliveries.append(pending)
+    return pending
+
+
+def resolve_smtp_settings(
+    from_email: str,
+    custom_smtp_server: Optional[str] = None,
+    custom_smtp_port: Optional[int] = None,
+) -> Tuple[str, int, bool]:
+    """根据自定义配置或邮箱域名确定 (SMTP服务器, 端口, 是否使用STARTTLS)"""
+    domain = from_email.split("@")[-1].lower()
+
+    if custom_smtp_server and custom_smtp_port:
+        # 使用自定义 SMTP 配置
+        smtp_server = custom_smtp_server
+        smtp_port = int(custom_smtp_port)
+        # 根据端口判断加密方式：465=SSL, 587=TLS
+        if smtp_port == 465:
+            use_tls = False  # SSL 模式（SMTP_SSL）
+        elif smtp_port == 587:
+            use_tls = True   # TLS 模式（STARTTLS）
+        else:
+            # 其他端口优先尝试 TLS（更安全，更广泛支持）
+            use_tls = True
+    elif domain in SMTP_CONFIGS:
+        # 使用预设配置
+        config = SMTP_CONFIGS[domain]
+        smtp_server = config["server"]
+        smtp_port = config["port"]
+        use_tls = config["encryption"] == "TLS"
+    else:
+        print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
+        smtp_server = f"smtp.{domain}"
+        smtp_port = 587
+        use_tls = True
 
-    print(f"Telegram所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+    return smtp_server, smtp_port, use_tls
 
 
 def send_to_email(
@@ -4042,8 +5682,12 @@ def send_to_email(
     html_file_path: str,
     custom_smtp_server: Optional[str] = None,
     custom_smtp_port: Optional[int] = None,
-) -> bool:
-    """发送邮件通知"""
+) -> Union[bool, PendingEmail]:
+    """发送邮件通知
+
+    开启后台发送时只负责组装邮件并放入发送队列，返回 PendingEmail，
+    实际结果在程序退出前由 wait_for_email_deliveries 确定并汇报。
+    """
     try:
         if not html_file_path or not Path(html_file_path).exists():
             print(f"错误：HTML文件不存在或未提供: {html_file_path}")
@@ -4053,31 +5697,9 @@ def send_to_email(
         with open(html_file_path, "r", encoding="utf-8") as f:
             html_content = f.read()
 
-        domain = from_email.split("@")[-1].lower()
-
-        if custom_smtp_server and custom_smtp_port:
-            # 使用自定义 SMTP 配置
-            smtp_server = custom_smtp_server
-            smtp_port = int(custom_smtp_port)
-            # 根据端口判断加密方式：465=SSL, 587=TLS
-            if smtp_port == 465:
-                use_tls = False  # SSL 模式（SMTP_SSL）
-            elif smtp_port == 587:
-                use_tls = True   # TLS 模式（STARTTLS）
-            else:
-                # 其他端口优先尝试 TLS（更安全，更广泛支持）
-                use_tls = True
-        elif domain in SMTP_CONFIGS:
-            # 使用预设配置
-            config = SMTP_CONFIGS[domain]
-            smtp_server = config["server"]
-            smtp_port = config["port"]
-            use_tls = config["encryption"] == "TLS"
-        else:
-            print(f"未识别的邮箱服务商: {domain}，使用通用 SMTP 配置")
-            smtp_server = f"smtp.{domain}"
-            smtp_port = 587
-            use_tls = True
+        smtp_server, smtp_port, use_tls = resolve_smtp_settings(
+            from_email, custom_smtp_server, custom_smtp_port
+        )
 
         msg = MIMEMultipart("alternative")
 
@@ -4117,38 +5739,73 @@ TrendRadar 热点分析报告
         html_part = MIMEText(html_content, "html", "utf-8")
         msg.attach(html_part)
 
-        print(f"正在发送邮件到 {to_email}...")
-        print(f"SMTP 服务器: {smtp_server}:{smtp_port}")
-        print(f"发件人: {from_email}")
+    except Exception as e:
+        print(f"邮件发送失败 [{report_type}]：{e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
 
-        try:
-            if use_tls:
-                # TLS 模式
-                server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)  # 设为1可以查看详细调试信息
-                server.ehlo()
-                server.starttls()
-                server.ehlo()
-            else:
-                # SSL 模式
-                server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-                server.set_debuglevel(0)
-                server.ehlo()
+    delivery_args = (
+        smtp_server,
+        smtp_port,
+        use_tls,
+        from_email,
+        password,
+        recipients,
+        msg,
+        report_type,
+    )
 
-            # 登录
-            server.login(from_email, password)
+    if CONFIG["EMAIL_DELIVERY"]["ASYNC"]:
+        pending = queue_email_delivery(report_type, delivery_args)
+        print(f"邮件已加入后台发送队列 [{report_type}] -> {to_email}")
+        return pending
+
+    return deliver_email(*delivery_args)
 
-            # 发送邮件
-            server.send_message(msg)
-            server.quit()
 
+def deliver_email(
+    smtp_server: str,
+    smtp_port: int,
+    use_tls: bool,
+    from_email: str,
+    password: str,
+    recipients: List[str],
+    msg: MIMEMultipart,
+    report_type: str,
+) -> bool:
+    """通过连接池投递邮件：所有收件人在同一次 SMTP 会话中发送，
+    复用的连接在发送时断开则换新连接重试一次"""
+    to_email = ", ".join(recipients)
+    print(f"正在发送邮件到 {to_email}...")
+    print(f"SMTP 服务器: {smtp_server}:{smtp_port}")
+    print(f"发件人: {from_email}")
+
+    timeout = CONFIG["EMAIL_DELIVERY"]["TIMEOUT"]
+    try:
+        while True:
+            server, reused = SMTP_POOL.acquire(
+                smtp_server, smtp_port, use_tls, from_email, password, timeout
+            )
+            try:
+                # 发送邮件
+                server.send_message(msg, from_addr=from_email, to_addrs=recipients)
+            except smtplib.SMTPServerDisconnected:
+                SMTP_POOL.discard(server)
+                if reused:
+                    print("复用的 SMTP 连接已断开，重新连接后重试")
+                    continue
+                print(f"邮件发送失败：服务器意外断开连接，请检查网络或稍后重试")
+                return False
+            except Exception:
+                SMTP_POOL.discard(server)
+                raise
+
+            SMTP_POOL.release(smtp_server, smtp_port, use_tls, from_email, server)
             print(f"邮件发送成功 [{report_type}] -> {to_email}")
             return True
 
-        except smtplib.SMTPServerDisconnected:
-            print(f"邮件发送失败：服务器意外断开连接，请检查网络或稍后重试")
-            return False
-
     except smtplib.SMTPAuthenticationError as e:
         print(f"邮件发送失败：认证错误，请检查邮箱和密码/授权码")
         print(f"详细错误: {str(e)}")
@@ -4166,6 +5823,9 @@ TrendRadar 热点分析报告
         print(f"邮件发送失败：无法连接到 SMTP 服务器 {smtp_server}:{smtp_port}")
         print(f"详细错误: {str(e)}")
         return False
+    except smtplib.SMTPServerDisconnected:
+        print(f"邮件发送失败：服务器意外断开连接，请检查网络或稍后重试")
+        return False
     except Exception as e:
         print(f"邮件发送失败 [{report_type}]：{e}")
         import traceback
@@ -4174,6 +5834,41 @@ TrendRadar 热点分析报告
         return False
 
 
+def wait_for_email_deliveries(timeout: Optional[float] = None) -> Dict[str, bool]:
+    """等待后台队列中的邮件发送完成并汇报结果，超时未完成的记为失败
+
+    每封邮件的最终结果同时交给 PendingEmail 注册的回调（推送记录、推送摘要）。
+    """
+    if not _email_deliveries:
+        return {}
+
+    if timeout is None:
+        timeout = CONFIG["EMAIL_DELIVERY"]["ASYNC_WAIT"]
+    deadline = time.time() + timeout
+    results = {}
+    print(f"等待后台邮件发送完成（{len(_email_deliveries)} 封）...")
+    for pending in _email_deliveries:
+        report_type = pending.report_type
+        try:
+            success = pending.future.result(timeout=max(0, deadline - time.time()))
+        except FutureTimeoutError:
+            print(f"邮件发送超时 [{report_type}]：超过 {timeout} 秒仍未完成")
+            # 尚未开始投递的取消掉；正在投递的守护线程随进程退出
+            pending.future.cancel()
+            success = False
+        except Exception as e:
+            print(f"邮件发送失败 [{report_type}]：{e}")
+            success = False
+        pending.resolve(success)
+        results[report_type] = results.get(report_type, True) and success
+
+    _email_deliveries.clear()
+
+    sent_count = sum(1 for success in results.values() if success)
+    print(f"后台邮件发送完成：成功 {sent_count}/{len(results)}")
+    return results
+
+
 def send_to_ntfy(
     server_url: str,
     topic: str,
@@ -4185,6 +5880,44 @@ def send_to_ntfy(
     mode: str = "daily",
 ) -> bool:
     """发送到ntfy（支持分批发送，严格遵守4KB限制）"""
+    # 获取分批内容，使用ntfy专用的4KB限制，预留批次头部空间
+    ntfy_batch_size = 3800
+    header_reserve = _get_max_batch_header_size("ntfy")
+    batches = split_content_into_batches(
+        report_data, "ntfy", update_info, max_bytes=ntfy_batch_size - header_reserve, mode=mode
+    )
+
+    # 统一添加批次头部（已预留空间，不会超限）
+    batches = add_batch_headers(batches, "ntfy", ntfy_batch_size)
+
+    total_batches = len(batches)
+    print(f"ntfy消息分为 {total_batches} 批次发送 [{report_type}]")
+
+    # 反转批次顺序，使得在ntfy客户端显示时顺序正确
+    # ntfy显示最新消息在上面，所以我们从最后一批开始推送
+    print(f"ntfy将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
+
+    # 公共服务器建议 2-3 秒，自托管可以更短
+    interval = 2 if "ntfy.sh" in server_url else 1
+
+    return deliver_batches(
+        "ntfy",
+        build_batch_entries(batches, report_type, reverse=True),
+        lambda entry: _send_ntfy_batch(server_url, topic, token, entry, proxy_url),
+        report_type,
+        interval,
+        allow_partial=True,
+    )
+
+
+def _send_ntfy_batch(
+    server_url: str,
+    topic: str,
+    token: Optional[str],
+    entry: Dict,
+    proxy_url: Optional[str] = None,
+) -> bool:
+    """发送 ntfy 单个批次（遇到 429 速率限制时抛出 NotificationThrottled，由发送节奏控制等待后重试）"""
     # 避免 HTTP header 编码问题
     report_type_en_map = {
         "当日汇总": "Daily Summary",
@@ -4193,6 +5926,7 @@ def send_to_ntfy(
         "实时增量": "Realtime Incremental", 
         "实时当前榜单": "Realtime Current Ranking",  
     }
+    report_type = entry["report_type"]
     report_type_en = report_type_en_map.get(report_type, "News Report") 
 
     headers = {
@@ -4216,115 +5950,84 @@ def send_to_ntfy(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
-    # 获取分批内容，使用ntfy专用的4KB限制，预留批次头部空间
-    ntfy_batch_size = 3800
-    header_reserve = _get_max_batch_header_size("ntfy")
-    batches = split_content_into_batches(
-        report_data, "ntfy", update_info, max_bytes=ntfy_batch_size - header_reserve, mode=mode
+    # 批次编号为用户视角的编号，推送顺序为反向
+    actual_batch_num = entry["batch_num"]
+    total_batches = entry["total_batches"]
+    batch_content = entry["content"]
+
+    batch_size = len(batch_content.encode("utf-8"))
+    print(
+        f"发送ntfy第 {actual_batch_num}/{total_batches} 批次（推送顺序: {entry['push_index']}/{total_batches}），大小：{batch_size} 字节 [{report_type}]"
     )
 
-    # 统一添加批次头部（已预留空间，不会超限）
-    batches = add_batch_headers(batches, "ntfy", ntfy_batch_size)
+    # 检查消息大小，确保不超过4KB
+    if batch_size > 4096:
+        print(f"警告：ntfy第 {actual_batch_num} 批次消息过大（{batch_size} 字节），可能被拒绝")
 
-    total_batches = len(batches)
-    print(f"ntfy消息分为 {total_batches} 批次发送 [{report_type}]")
+    # 更新 headers 的批次标识
+    if total_batches > 1:
+        headers["Title"] = f"{report_type_en} ({actual_batch_num}/{total_batches})"
 
-    # 反转批次顺序，使得在ntfy客户端显示时顺序正确
-    # ntfy显示最新消息在上面，所以我们从最后一批开始推送
-    reversed_batches = list(reversed(batches))
+    try:
+        response = requests.post(
+            url,
+            headers=headers,
+            data=batch_content.encode("utf-8"),
+            proxies=proxies,
+            timeout=30,
+        )
 
-    print(f"ntfy将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
+        if response.status_code == 200:
+            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
+            return True
+        elif response.status_code == 429:
+            print(
+                f"ntfy第 {actual_batch_num}/{total_batches} 批次速率限制 [{report_type}]，等待后重试"
+            )
+            # 服务端未给出等待时间时沿用原先的 10 秒
+            raise NotificationThrottled(_retry_after_seconds(response) or 10)
+        elif response.status_code == 413:
+            print(
+                f"ntfy第 {actual_batch_num}/{total_batches} 批次消息过大被拒绝 [{report_type}]，消息大小：{batch_size} 字节"
+            )
+        else:
+            print(
+                f"ntfy第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+            )
+            try:
+                print(f"错误详情：{response.text}")
+            except:
+                pass
 
-    # 逐批发送（反向顺序）
-    success_count = 0
-    for idx, batch_content in enumerate(reversed_batches, 1):
-        # 计算正确的批次编号（用户视角的编号）
-        actual_batch_num = total_batches - idx + 1
+    except NotificationThrottled:
+        raise
+    except requests.exceptions.ConnectTimeout:
+        print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接超时 [{report_type}]")
+    except requests.exceptions.ReadTimeout:
+        print(f"ntfy第 {actual_batch_num}/{total_batches} 批次读取超时 [{report_type}]")
+    except requests.exceptions.ConnectionError as e:
+        print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接错误 [{report_type}]：{e}")
+    except Exception as e:
+        print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
 
-        batch_size = len(batch_content.encode("utf-8"))
-        print(
-            f"发送ntfy第 {actual_batch_num}/{total_batches} 批次（推送顺序: {idx}/{total_batches}），大小：{batch_size} 字节 [{report_type}]"
-        )
+    return False
 
-        # 检查消息大小，确保不超过4KB
-        if batch_size > 4096:
-            print(f"警告：ntfy第 {actual_batch_num} 批次消息过大（{batch_size} 字节），可能被拒绝")
 
-        # 更新 headers 的批次标识
-        current_headers = headers.copy()
-        if total_batches > 1:
-            current_headers["Title"] = (
-                f"{report_type_en} ({actual_batch_num}/{total_batches})"
-            )
+def _parse_bark_url(bark_url: str) -> Tuple[Optional[str], Optional[str]]:
+    """解析 Bark URL，返回 (API 端点, device_key)
 
-        try:
-            response = requests.post(
-                url,
-                headers=current_headers,
-                data=batch_content.encode("utf-8"),
-                proxies=proxies,
-                timeout=30,
-            )
+    Bark URL 格式: https://api.day.app/device_key 或 https://bark.day.app/device_key
+    """
+    from urllib.parse import urlparse
 
-            if response.status_code == 200:
-                print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
-                success_count += 1
-                if idx < total_batches:
-                    # 公共服务器建议 2-3 秒，自托管可以更短
-                    interval = 2 if "ntfy.sh" in server_url else 1
-                    time.sleep(interval)
-            elif response.status_code == 429:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次速率限制 [{report_type}]，等待后重试"
-                )
-                time.sleep(10)  # 等待10秒后重试
-                # 重试一次
-                retry_response = requests.post(
-                    url,
-                    headers=current_headers,
-                    data=batch_content.encode("utf-8"),
-                    proxies=proxies,
-                    timeout=30,
-                )
-                if retry_response.status_code == 200:
-                    print(f"ntfy第 {actual_batch_num}/{total_batches} 批次重试成功 [{report_type}]")
-                    success_count += 1
-                else:
-                    print(
-                        f"ntfy第 {actual_batch_num}/{total_batches} 批次重试失败，状态码：{retry_response.status_code}"
-                    )
-            elif response.status_code == 413:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次消息过大被拒绝 [{report_type}]，消息大小：{batch_size} 字节"
-                )
-            else:
-                print(
-                    f"ntfy第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                try:
-                    print(f"错误详情：{response.text}")
-                except:
-                    pass
+    parsed_url = urlparse(bark_url)
+    device_key = parsed_url.path.strip('/').split('/')[0] if parsed_url.path else None
 
-        except requests.exceptions.ConnectTimeout:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接超时 [{report_type}]")
-        except requests.exceptions.ReadTimeout:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次读取超时 [{report_type}]")
-        except requests.exceptions.ConnectionError as e:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次连接错误 [{report_type}]：{e}")
-        except Exception as e:
-            print(f"ntfy第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
+    if not device_key:
+        return None, None
 
-    # 判断整体发送是否成功
-    if success_count == total_batches:
-        print(f"ntfy所有 {total_batches} 批次发送完成 [{report_type}]")
-        return True
-    elif success_count > 0:
-        print(f"ntfy部分发送成功：{success_count}/{total_batches} 批次 [{report_type}]")
-        return True  # 部分成功也视为成功
-    else:
-        print(f"ntfy发送完全失败 [{report_type}]")
-        return False
+    # 构建正确的 API 端点
+    return f"{parsed_url.scheme}://{parsed_url.netloc}/push", device_key
 
 
 def send_to_bark(
@@ -4336,24 +6039,13 @@ def send_to_bark(
     mode: str = "daily",
 ) -> bool:
     """发送到Bark（支持分批发送，使用 markdown 格式）"""
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 解析 Bark URL，提取 device_key 和 API 端点
-    # Bark URL 格式: https://api.day.app/device_key 或 https://bark.day.app/device_key
-    from urllib.parse import urlparse
-
-    parsed_url = urlparse(bark_url)
-    device_key = parsed_url.path.strip('/').split('/')[0] if parsed_url.path else None
+    api_endpoint, device_key = _parse_bark_url(bark_url)
 
     if not device_key:
         print(f"Bark URL 格式错误，无法提取 device_key: {bark_url}")
         return False
 
-    # 构建正确的 API 端点
-    api_endpoint = f"{parsed_url.scheme}://{parsed_url.netloc}/push"
-
     # 获取分批内容（Bark 限制为 3600 字节以避免 413 错误），预留批次头部空间
     bark_batch_size = CONFIG["BARK_BATCH_SIZE"]
     header_reserve = _get_max_batch_header_size("bark")
@@ -4369,85 +6061,93 @@ def send_to_bark(
 
     # 反转批次顺序，使得在Bark客户端显示时顺序正确
     # Bark显示最新消息在上面，所以我们从最后一批开始推送
-    reversed_batches = list(reversed(batches))
-
     print(f"Bark将按反向顺序推送（最后批次先推送），确保客户端显示顺序正确")
 
-    # 逐批发送（反向顺序）
-    success_count = 0
-    for idx, batch_content in enumerate(reversed_batches, 1):
-        # 计算正确的批次编号（用户视角的编号）
-        actual_batch_num = total_batches - idx + 1
+    return deliver_batches(
+        "bark",
+        build_batch_entries(batches, report_type, reverse=True),
+        lambda entry: _send_bark_batch(api_endpoint, device_key, entry, proxy_url),
+        report_type,
+        CONFIG["BATCH_SEND_INTERVAL"],
+        allow_partial=True,
+    )
 
-        batch_size = len(batch_content.encode("utf-8"))
+
+def _send_bark_batch(
+    api_endpoint: str, device_key: str, entry: Dict, proxy_url: Optional[str] = None
+) -> bool:
+    """发送 Bark 单个批次"""
+    proxies = None
+    if proxy_url:
+        proxies = {"http": proxy_url, "https": proxy_url}
+
+    # 批次编号为用户视角的编号，推送顺序为反向
+    report_type = entry["report_type"]
+    actual_batch_num = entry["batch_num"]
+    total_batches = entry["total_batches"]
+    batch_content = entry["content"]
+
+    batch_size = len(batch_content.encode("utf-8"))
+    print(
+        f"发送Bark第 {actual_batch_num}/{total_batches} 批次（推送顺序: {entry['push_index']}/{total_batches}），大小：{batch_size} 字节 [{report_type}]"
+    )
+
+    # 检查消息大小（Bark使用APNs，限制4KB）
+    if batch_size > 4096:
         print(
-            f"发送Bark第 {actual_batch_num}/{total_batches} 批次（推送顺序: {idx}/{total_batches}），大小：{batch_size} 字节 [{report_type}]"
+            f"警告：Bark第 {actual_batch_num}/{total_batches} 批次消息过大（{batch_size} 字节），可能被拒绝"
         )
 
-        # 检查消息大小（Bark使用APNs，限制4KB）
-        if batch_size > 4096:
-            print(
-                f"警告：Bark第 {actual_batch_num}/{total_batches} 批次消息过大（{batch_size} 字节），可能被拒绝"
-            )
+    # 构建JSON payload
+    payload = {
+        "title": report_type,
+        "markdown": batch_content,
+        "device_key": device_key,
+        "sound": "default",
+        "group": "TrendRadar",
+        "action": "none",  # 点击推送跳到 APP 不弹出弹框,方便阅读
+    }
 
-        # 构建JSON payload
-        payload = {
-            "title": report_type,
-            "markdown": batch_content,
-            "device_key": device_key,
-            "sound": "default",
-            "group": "TrendRadar",
-            "action": "none",  # 点击推送跳到 APP 不弹出弹框,方便阅读
-        }
+    try:
+        response = requests.post(
+            api_endpoint,
+            json=payload,
+            proxies=proxies,
+            timeout=30,
+        )
 
-        try:
-            response = requests.post(
-                api_endpoint,
-                json=payload,
-                proxies=proxies,
-                timeout=30,
+        if response.status_code == 200:
+            result = response.json()
+            if result.get("code") == 200:
+                print(f"Bark第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
+                return True
+            print(
+                f"Bark第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，错误：{result.get('message', '未知错误')}"
             )
+        elif response.status_code == 429:
+            print(f"Bark第 {actual_batch_num}/{total_batches} 批次触发频率限制 [{report_type}]")
+            raise NotificationThrottled(_retry_after_seconds(response))
+        else:
+            print(
+                f"Bark第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
+            )
+            try:
+                print(f"错误详情：{response.text}")
+            except:
+                pass
 
-            if response.status_code == 200:
-                result = response.json()
-                if result.get("code") == 200:
-                    print(f"Bark第 {actual_batch_num}/{total_batches} 批次发送成功 [{report_type}]")
-                    success_count += 1
-                    # 批次间间隔
-                    if idx < total_batches:
-                        time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-                else:
-                    print(
-                        f"Bark第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，错误：{result.get('message', '未知错误')}"
-                    )
-            else:
-                print(
-                    f"Bark第 {actual_batch_num}/{total_batches} 批次发送失败 [{report_type}]，状态码：{response.status_code}"
-                )
-                try:
-                    print(f"错误详情：{response.text}")
-                except:
-                    pass
-
-        except requests.exceptions.ConnectTimeout:
-            print(f"Bark第 {actual_batch_num}/{total_batches} 批次连接超时 [{report_type}]")
-        except requests.exceptions.ReadTimeout:
-            print(f"Bark第 {actual_batch_num}/{total_batches} 批次读取超时 [{report_type}]")
-        except requests.exceptions.ConnectionError as e:
-            print(f"Bark第 {actual_batch_num}/{total_batches} 批次连接错误 [{report_type}]：{e}")
-        except Exception as e:
-            print(f"Bark第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
+    except NotificationThrottled:
+        raise
+    except requests.exceptions.ConnectTimeout:
+        print(f"Bark第 {actual_batch_num}/{total_batches} 批次连接超时 [{report_type}]")
+    except requests.exceptions.ReadTimeout:
+        print(f"Bark第 {actual_batch_num}/{total_batches} 批次读取超时 [{report_type}]")
+    except requests.exceptions.ConnectionError as e:
+        print(f"Bark第 {actual_batch_num}/{total_batches} 批次连接错误 [{report_type}]：{e}")
+    except Exception as e:
+        print(f"Bark第 {actual_batch_num}/{total_batches} 批次发送异常 [{report_type}]：{e}")
 
-    # 判断整体发送是否成功
-    if success_count == total_batches:
-        print(f"Bark所有 {total_batches} 批次发送完成 [{report_type}]")
-        return True
-    elif success_count > 0:
-        print(f"Bark部分发送成功：{success_count}/{total_batches} 批次 [{report_type}]")
-        return True  # 部分成功也视为成功
-    else:
-        print(f"Bark发送完全失败 [{report_type}]")
-        return False
+    return False
 
 
 def convert_markdown_to_mrkdwn(content: str) -> str:
@@ -4477,11 +6177,6 @@ def send_to_slack(
     mode: str = "daily",
 ) -> bool:
     """发送到Slack（支持分批发送，使用 mrkdwn 格式）"""
-    headers = {"Content-Type": "application/json"}
-    proxies = None
-    if proxy_url:
-        proxies = {"http": proxy_url, "https": proxy_url}
-
     # 获取分批内容（使用 Slack 批次大小），预留批次头部空间
     slack_batch_size = CONFIG["SLACK_BATCH_SIZE"]
     header_reserve = _get_max_batch_header_size("slack")
@@ -4494,44 +6189,57 @@ def send_to_slack(
 
     print(f"Slack消息分为 {len(batches)} 批次发送 [{report_type}]")
 
-    # 逐批发送
-    for i, batch_content in enumerate(batches, 1):
-        # 转换 Markdown 到 mrkdwn 格式
-        mrkdwn_content = convert_markdown_to_mrkdwn(batch_content)
+    return deliver_batches(
+        "slack",
+        build_batch_entries(batches, report_type),
+        lambda entry: _send_slack_batch(webhook_url, entry, proxy_url),
+        report_type,
+        CONFIG["BATCH_SEND_INTERVAL"],
+    )
 
-        batch_size = len(mrkdwn_content.encode("utf-8"))
-        print(
-            f"发送Slack第 {i}/{len(batches)} 批次，大小：{batch_size} 字节 [{report_type}]"
-        )
 
-        # 构建 Slack payload（使用简单的 text 字段，支持 mrkdwn）
-        payload = {
-            "text": mrkdwn_content
-        }
+def _send_slack_batch(
+    webhook_url: str, entry: Dict, proxy_url: Optional[str] = None
+) -> bool:
+    """发送 Slack 单个批次（转换为 mrkdwn 格式）"""
+    headers = {"Content-Type": "application/json"}
+    proxies = None
+    if proxy_url:
+        proxies = {"http": proxy_url, "https": proxy_url}
 
-        try:
-            response = requests.post(
-                webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
-            )
+    report_type = entry["report_type"]
+    batch_label = f"{entry['batch_num']}/{entry['total_batches']}"
 
-            # Slack Incoming Webhooks 成功时返回 "ok" 文本
-            if response.status_code == 200 and response.text == "ok":
-                print(f"Slack第 {i}/{len(batches)} 批次发送成功 [{report_type}]")
-                # 批次间间隔
-                if i < len(batches):
-                    time.sleep(CONFIG["BATCH_SEND_INTERVAL"])
-            else:
-                error_msg = response.text if response.text else f"状态码：{response.status_code}"
-                print(
-                    f"Slack第 {i}/{len(batches)} 批次发送失败 [{report_type}]，错误：{error_msg}"
-                )
-                return False
-        except Exception as e:
-            print(f"Slack第 {i}/{len(batches)} 批次发送出错 [{report_type}]：{e}")
-            return False
+    # 转换 Markdown 到 mrkdwn 格式
+    mrkdwn_content = convert_markdown_to_mrkdwn(entry["content"])
+
+    batch_size = len(mrkdwn_content.encode("utf-8"))
+    print(f"发送Slack第 {batch_label} 批次，大小：{batch_size} 字节 [{report_type}]")
+
+    # 构建 Slack payload（使用简单的 text 字段，支持 mrkdwn）
+    payload = {
+        "text": mrkdwn_content
+    }
+
+    try:
+        response = requests.post(
+            webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
+        )
 
-    print(f"Slack所有 {len(batches)} 批次发送完成 [{report_type}]")
-    return True
+        # Slack Incoming Webhooks 成功时返回 "ok" 文本
+        if response.status_code == 200 and response.text == "ok":
+            print(f"Slack第 {batch_label} 批次发送成功 [{report_type}]")
+            return True
+        if response.status_code == 429:
+            print(f"Slack第 {batch_label} 批次触发频率限制 [{report_type}]")
+            raise NotificationThrottled(_retry_after_seconds(response))
+        error_msg = response.text if response.text else f"状态码：{response.status_code}"
+        print(f"Slack第 {batch_label} 批次发送失败 [{report_type}]，错误：{error_msg}")
+    except NotificationThrottled:
+        raise
+    except Exception as e:
+        print(f"Slack第 {batch_label} 批次发送出错 [{report_type}]：{e}")
+    return False
 
 
 # === 主分析器 ===
@@ -4577,6 +6285,9 @@ class NewsAnalyzer:
         self.is_docker_container = self._detect_docker_environment()
         self.update_info = None
         self.proxy_url = None
+        self._analysis_data = None
+        self._title_scores = None
+        self._dedup_index = None
         self._setup_proxy()
         self.data_fetcher = DataFetcher(self.proxy_url)
 
@@ -4668,8 +6379,14 @@ class NewsAnalyzer:
 
     def _load_analysis_data(
         self,
-    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
-        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
+    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List, SnapshotIndex]]:
+        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据
+
+        同一次运行中抓取数据落盘后不再变化，实时报告与汇总报告共用一次加载结果。
+        """
+        if self._analysis_data is not None:
+            return self._analysis_data
+
         try:
             # 获取当前配置的监控平台ID列表
             current_platform_ids = []
@@ -4678,8 +6395,9 @@ class NewsAnalyzer:
 
             print(f"当前监控平台: {current_platform_ids}")
 
+            snapshot_index = SnapshotIndex()
             all_results, id_to_name, title_info = read_all_today_titles(
-                current_platform_ids
+                current_platform_ids, snapshot_index
             )
 
             if not all_results:
@@ -4692,18 +6410,26 @@ class NewsAnalyzer:
             new_titles = detect_latest_new_titles(current_platform_ids)
             word_groups, filter_words = load_frequency_words()
 
-            return (
+            self._analysis_data = (
                 all_results,
                 id_to_name,
                 title_info,
                 new_titles,
                 word_groups,
                 filter_words,
+                snapshot_index,
             )
+            return self._analysis_data
         except Exception as e:
             print(f"数据加载失败: {e}")
             return None
 
+    def _score_today_titles(self, results: Dict) -> Optional[Dict[str, int]]:
+        """新闻评分：每次运行只评一次，覆盖当天全部标题（已包含本次抓取结果），
+        实时报告、汇总报告和推送共用这份结果"""
+        analysis_data = self._load_analysis_data()
+        return score_news_titles(analysis_data[0] if analysis_data else results)
+
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
         """从当前抓取结果构建标题信息"""
         title_info = {}
@@ -4735,8 +6461,22 @@ class NewsAnalyzer:
         id_to_name: Dict,
         failed_ids: Optional[List] = None,
         is_daily_summary: bool = False,
+        snapshot_index: Optional[SnapshotIndex] = None,
     ) -> Tuple[List[Dict], str]:
-        """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
+        """统一的分析流水线：数据处理 → 评分过滤（可选）→ 统计计算 → HTML生成"""
+
+        # 跨平台标题去重
+        dedup_index = None
+        if CONFIG["DEDUP_TITLES"]:
+            dedup_index = build_title_dedup_index(data_source)
+            print(
+                f"标题去重：{dedup_index.title_count} 条标题归并为 {len(dedup_index)} 个簇"
+            )
+
+        # 新闻评分结果由 run() 计算一次，低分新闻不参与统计
+        title_scores = self._title_scores
+        # 随后的通知推送沿用本次去重索引处理新增新闻
+        self._dedup_index = dedup_index
 
         # 统计计算
         stats, total_titles = count_word_frequency(
@@ -4748,6 +6488,11 @@ class NewsAnalyzer:
             self.rank_threshold,
             new_titles,
             mode=mode,
+            dedup_index=dedup_index,
+            parallel_workers=CONFIG["PARALLEL_WORKERS"],
+            snapshot_index=snapshot_index,
+            title_scores=title_scores,
+            min_score=CONFIG["MIN_SCORE"],
         )
 
         # HTML生成
@@ -4760,6 +6505,9 @@ class NewsAnalyzer:
             mode=mode,
             is_daily_summary=is_daily_summary,
             update_info=self.update_info if CONFIG["SHOW_VERSION_UPDATE"] else None,
+            title_scores=title_scores,
+            min_score=CONFIG["MIN_SCORE"],
+            dedup_index=dedup_index,
         )
 
         return stats, html_file
@@ -4792,6 +6540,9 @@ class NewsAnalyzer:
                 self.proxy_url,
                 mode=mode,
                 html_file_path=html_file_path,
+                title_scores=self._title_scores,
+                min_score=CONFIG["MIN_SCORE"],
+                dedup_index=self._dedup_index,
             )
             return True
         elif CONFIG["ENABLE_NOTIFICATION"] and not has_notification:
@@ -4827,9 +6578,15 @@ class NewsAnalyzer:
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words = (
-            analysis_data
-        )
+        (
+            all_results,
+            id_to_name,
+            title_info,
+            new_titles,
+            word_groups,
+            filter_words,
+            snapshot_index,
+        ) = analysis_data
 
         # 运行分析流水线
         stats, html_file = self._run_analysis_pipeline(
@@ -4841,6 +6598,7 @@ class NewsAnalyzer:
             filter_words,
             id_to_name,
             is_daily_summary=True,
+            snapshot_index=snapshot_index,
         )
 
         print(f"{summary_type}报告已生成: {html_file}")
@@ -4868,9 +6626,15 @@ class NewsAnalyzer:
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words = (
-            analysis_data
-        )
+        (
+            all_results,
+            id_to_name,
+            title_info,
+            new_titles,
+            word_groups,
+            filter_words,
+            snapshot_index,
+        ) = analysis_data
 
         # 运行分析流水线
         _, html_file = self._run_analysis_pipeline(
@@ -4882,6 +6646,7 @@ class NewsAnalyzer:
             filter_words,
             id_to_name,
             is_daily_summary=True,
+            snapshot_index=snapshot_index,
         )
 
         print(f"{summary_type}HTML已生成: {html_file}")
@@ -4955,6 +6720,7 @@ class NewsAnalyzer:
                     historical_new_titles,
                     _,
                     _,
+                    snapshot_index,
                 ) = analysis_data
 
                 print(
@@ -4970,6 +6736,7 @@ class NewsAnalyzer:
                     filter_words,
                     historical_id_to_name,
                     failed_ids=failed_ids,
+                    snapshot_index=snapshot_index,
                 )
 
                 combined_id_to_name = {**historical_id_to_name, **id_to_name}
@@ -5057,6 +6824,9 @@ class NewsAnalyzer:
 
             results, id_to_name, failed_ids = self._crawl_data()
 
+            if CONFIG["ENABLE_SCORING"]:
+                self._title_scores = self._score_today_titles(results)
+
             self._execute_mode_strategy(mode_strategy, results, id_to_name, failed_ids)
 
         except Exception as e:
@@ -5065,9 +6835,19 @@ class NewsAnalyzer:
 
 
 def main():
+    # 只补发发件箱中的积压批次，不执行抓取
+    if "--flush-outbox" in sys.argv[1:]:
+        proxy_url = None
+        if CONFIG["USE_PROXY"] and os.environ.get("GITHUB_ACTIONS") != "true":
+            proxy_url = CONFIG["DEFAULT_PROXY"]
+        flush_notification_outbox(proxy_url)
+        return
+
     try:
         analyzer = NewsAnalyzer()
         analyzer.run()
+        # 后台发送的邮件在退出前汇报结果
+        wait_for_email_deliveries()
     except FileNotFoundError as e:
         print(f"❌ 配置文件错误: {e}")
         print("\n请确保以下文件存在:")
@@ -11,7 +11,8 @@ from typing import Dict, List, Optional, Tuple
 
 from .cache_service import get_cache
 from .parser_service import ParserService
-from ..utils.errors import DataNotFoundError
+from ..utils.errors import DataNotFoundError, FileParseError
+from ..utils.weights import DEFAULT_WEIGHT_CONFIG, load_weight_config
 
 
 class DataService:
@@ -495,6 +496,34 @@ class DataService:
 
         return result
 
+    def get_weight_settings(self) -> Dict:
+        """
+        获取新闻权重排序参数（与 main.py 使用同一份 config.yaml 配置）
+
+        Returns:
+            {"rank_threshold": 高排名阈值, "weight_config": 权重配置}，
+            可直接作为关键字参数传给 sort_news_by_weight；
+            配置文件缺失或解析失败时使用默认值
+        """
+        cache_key = "config:weight_settings"
+        cached = self.cache.get(cache_key, ttl=3600)  # 1小时缓存
+        if cached:
+            return cached
+
+        try:
+            config_data = self.parser.parse_yaml_config()
+        except FileParseError:
+            return {"rank_threshold": 5, "weight_config": dict(DEFAULT_WEIGHT_CONFIG)}
+
+        result = {
+            "rank_threshold": config_data.get("report", {}).get("rank_threshold", 5),
+            "weight_config": load_weight_config(config_data)
+        }
+
+        self.cache.set(cache_key, result)
+
+        return result
+
     def get_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
         扫描 output 目录，返回实际可用的日期范围
@@ -0,0 +1,189 @@
+"""
+新闻权重计算
+
+main.py 生成报告时的排序与 MCP 工具的按权重排序共用这一套实现，
+权重系数取自 config.yaml 的 weight 配置节，两边的排序结果保持一致。
+
+本模块只依赖标准库（numpy 可选），main.py 单独运行时也可直接导入。
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖，缺失时使用纯 Python 实现
+    np = None
+
+
+# config.yaml 未配置 weight 节时的默认权重
+DEFAULT_WEIGHT_CONFIG = {
+    "RANK_WEIGHT": 0.6,
+    "FREQUENCY_WEIGHT": 0.3,
+    "HOTNESS_WEIGHT": 0.1,
+}
+
+
+def load_weight_config(config_data: Optional[Dict]) -> Dict:
+    """
+    从 config.yaml 的内容中读取权重配置
+
+    Args:
+        config_data: yaml 解析后的配置字典
+
+    Returns:
+        {"RANK_WEIGHT", "FREQUENCY_WEIGHT", "HOTNESS_WEIGHT"}，缺失项使用默认值
+    """
+    weight = (config_data or {}).get("weight") or {}
+    return {
+        "RANK_WEIGHT": weight.get("rank_weight", DEFAULT_WEIGHT_CONFIG["RANK_WEIGHT"]),
+        "FREQUENCY_WEIGHT": weight.get("frequency_weight", DEFAULT_WEIGHT_CONFIG["FREQUENCY_WEIGHT"]),
+        "HOTNESS_WEIGHT": weight.get("hotness_weight", DEFAULT_WEIGHT_CONFIG["HOTNESS_WEIGHT"]),
+    }
+
+
+def calculate_news_weight(
+    title_data: Dict, rank_threshold: int = 5, weight_config: Optional[Dict] = None
+) -> float:
+    """
+    计算单条新闻的权重（用于排序）
+
+    综合考虑：
+    - 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+    - 频次权重：min(出现次数, 10) × 10
+    - 热度权重：高排名次数 / 总出现次数 × 100
+
+    Args:
+        title_data: 新闻数据字典，包含 ranks 和 count 字段
+        rank_threshold: 高排名阈值
+        weight_config: 权重配置，None 时使用默认权重
+
+    Returns:
+        权重分数
+    """
+    ranks = title_data.get("ranks", [])
+    if not ranks:
+        return 0.0
+
+    count = title_data.get("count", len(ranks))
+    weight_config = weight_config or DEFAULT_WEIGHT_CONFIG
+
+    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+    rank_scores = []
+    for rank in ranks:
+        score = 11 - min(rank, 10)
+        rank_scores.append(score)
+
+    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+
+    # 频次权重：min(出现次数, 10) × 10
+    frequency_weight = min(count, 10) * 10
+
+    # 热度加成：高排名次数 / 总出现次数 × 100
+    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
+    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
+    hotness_weight = hotness_ratio * 100
+
+    total_weight = (
+        rank_weight * weight_config["RANK_WEIGHT"]
+        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
+        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+    )
+
+    return total_weight
+
+
+def pack_news_ranks(titles: List[Dict]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    将多条新闻的排名打包为扁平数组
+
+    Returns:
+        (flat_ranks, offsets, counts)，第 i 条新闻的排名为
+        flat_ranks[offsets[i]:offsets[i + 1]]
+    """
+    flat_ranks = []
+    offsets = [0]
+    counts = []
+    for title_data in titles:
+        ranks = title_data.get("ranks", [])
+        flat_ranks.extend(ranks)
+        offsets.append(len(flat_ranks))
+        counts.append(title_data.get("count", len(ranks)))
+    return flat_ranks, offsets, counts
+
+
+def calculate_packed_weights(
+    flat_ranks: List[int],
+    offsets: List[int],
+    counts: List[int],
+    rank_threshold: int,
+    weight_config: Dict,
+) -> List[float]:
+    """对打包后的排名数组批量计算权重，结果与 calculate_news_weight 逐条计算一致"""
+    rank_factor = weight_config["RANK_WEIGHT"]
+    frequency_factor = weight_config["FREQUENCY_WEIGHT"]
+    hotness_factor = weight_config["HOTNESS_WEIGHT"]
+
+    if np is not None and counts:
+        ranks = np.asarray(flat_ranks, dtype=np.int64)
+        bounds = np.asarray(offsets, dtype=np.int64)
+        lengths = np.diff(bounds)
+
+        # 用前缀和求每段之和（整数运算，结果精确）
+        rank_scores = np.concatenate(([0], np.cumsum(11 - np.minimum(ranks, 10))))
+        high_ranks = np.concatenate(([0], np.cumsum(ranks <= rank_threshold)))
+        rank_sums = rank_scores[bounds[1:]] - rank_scores[bounds[:-1]]
+        high_counts = high_ranks[bounds[1:]] - high_ranks[bounds[:-1]]
+
+        safe_lengths = np.maximum(lengths, 1)
+        rank_weight = rank_sums / safe_lengths
+        frequency_weight = np.minimum(np.asarray(counts, dtype=np.int64), 10) * 10
+        hotness_weight = high_counts / safe_lengths * 100
+
+        total_weight = (
+            rank_weight * rank_factor
+            + frequency_weight * frequency_factor
+            + hotness_weight * hotness_factor
+        )
+        return np.where(lengths > 0, total_weight, 0.0).tolist()
+
+    weights = []
+    for i, count in enumerate(counts):
+        start, end = offsets[i], offsets[i + 1]
+        length = end - start
+        if not length:
+            weights.append(0.0)
+            continue
+
+        rank_sum = 0
+        high_count = 0
+        for rank in flat_ranks[start:end]:
+            rank_sum += 11 - min(rank, 10)
+            if rank <= rank_threshold:
+                high_count += 1
+
+        weights.append(
+            rank_sum / length * rank_factor
+            + min(count, 10) * 10 * frequency_factor
+            + high_count / length * 100 * hotness_factor
+        )
+    return weights
+
+
+def calculate_news_weights(
+    titles: List[Dict], rank_threshold: int = 5, weight_config: Optional[Dict] = None
+) -> List[float]:
+    """
+    批量计算新闻权重（安装 numpy 时使用向量化计算）
+
+    Args:
+        titles: 新闻数据列表，每项包含 ranks 和 count 字段
+        rank_threshold: 高排名阈值
+        weight_config: 权重配置，None 时使用默认权重
+
+    Returns:
+        与 titles 一一对应的权重列表
+    """
+    flat_ranks, offsets, counts = pack_news_ranks(titles)
+    return calculate_packed_weights(
+        flat_ranks, offsets, counts, rank_threshold, weight_config or DEFAULT_WEIGHT_CONFIG
+    )
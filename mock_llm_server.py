@@ -0,0 +1,348 @@
+# coding=utf-8
+"""
+本地模拟 chat completions 服务 - 离线压测与基准测试用
+
+模拟 OpenRouter 的 /chat/completions 接口，无需真实 API Key：
+- 评分请求（单条 / 批量打包）返回符合评分标准的 JSON，分数由关键词
+  评分器按标题确定性地给出，同一标题每次结果相同
+- 情感分析请求（AnalyticsTools.analyze_sentiment 生成的提示词）返回
+  按提示词格式组织的分析报告
+- 可配置响应延迟、服务端错误率、JSON 格式错误率和每秒请求上限（超出返回 429）
+- 可按标题注入"硬故障"：这些标题在批量结果中缺失，单条请求始终返回 500，
+  重试也无法评分，用于核对失败的标题是否恰好是注入故障的标题
+- 响应包含 usage 字段（按字符数估算 tokens）
+
+用法：
+    python mock_llm_server.py --port 8765 --latency 0.3 --error-rate 0.05
+    然后把 config/ai_config.yaml 中的 base_url 改为 http://127.0.0.1:8765
+"""
+
+import hashlib
+import json
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from news_scorer import NewsScorer
+
+
+# 情感分析用的简单词表，命中正面词多于负面词判为正面，反之为负面
+POSITIVE_WORDS = ['涨', '增长', '新高', '突破', '利好', '补贴', '回暖', '成功', '获批', '夺冠', '提升', '优惠']
+NEGATIVE_WORDS = ['跌', '下降', '亏损', '裁员', '事故', '暴雷', '违规', '被查', '诈骗', '失业', '遗憾', '拖欠']
+
+
+class MockChatServer:
+    """
+    模拟 chat completions 服务
+    
+    错误注入是确定性的：是否出错由"请求内容 + 该内容第几次被请求"的
+    哈希决定，同一请求重试时会重新判定，相同的请求序列得到相同的结果。
+    硬故障只由标题决定，与请求次数无关。
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0,
+                 jitter: float = 0.0, error_rate: float = 0.0, malformed_rate: float = 0.0,
+                 max_rps: float = 0.0, hard_fault_rate: float = 0.0, seed: int = 0):
+        """
+        Args:
+            host: 监听地址
+            port: 监听端口，0 表示随机分配
+            latency: 每个请求的基础延迟（秒）
+            jitter: 延迟的随机浮动上限（秒），按请求内容确定
+            error_rate: 返回 500 错误的概率（0-1）
+            malformed_rate: 返回残缺 JSON 的概率（0-1）
+            max_rps: 每秒最多处理的请求数，超出返回 429，<= 0 表示不限
+            hard_fault_rate: 标题为硬故障的概率（0-1），这些标题始终无法评分
+            seed: 错误注入与延迟浮动的随机种子
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.max_rps = max_rps
+        self.hard_fault_rate = hard_fault_rate
+        self.seed = seed
+        self.stats = Counter()
+        self._attempts = Counter()
+        self._recent = deque()
+        self._lock = threading.Lock()
+        self._scorer = NewsScorer()
+        self._thread = None
+        
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+            
+            def do_POST(self):
+                try:
+                    length = int(self.headers.get('Content-Length', 0))
+                    body = json.loads(self.rfile.read(length))
+                    prompt = body['messages'][-1]['content']
+                except (ValueError, KeyError, IndexError, TypeError):
+                    self._reply(400, {'error': {'message': 'invalid request body'}})
+                    return
+                status, payload, headers = server.handle(prompt, body.get('model', ''))
+                self._reply(status, payload, headers)
+            
+            def _reply(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+        
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+    
+    @property
+    def base_url(self) -> str:
+        """可直接用作 AINewsScorer 的 base_url"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> 'MockChatServer':
+        """在后台线程启动服务"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """停止服务"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+    
+    def _roll(self, key: str, kind: str) -> float:
+        """确定性的 [0, 1) 随机数"""
+        digest = hashlib.sha1(f"{self.seed}:{kind}:{key}".encode('utf-8')).digest()
+        return int.from_bytes(digest[:8], 'big') / 2 ** 64
+    
+    def is_hard_fault(self, title: str) -> bool:
+        """标题是否被注入了硬故障（批量结果中缺失，单条请求始终返回 500）"""
+        return self._roll(title, 'hard_fault') < self.hard_fault_rate
+    
+    def _over_rate_limit(self) -> bool:
+        """最近 1 秒内已处理的请求数达到 max_rps 时限流"""
+        if self.max_rps <= 0:
+            return False
+        with self._lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= 1.0:
+                self._recent.popleft()
+            if len(self._recent) >= self.max_rps:
+                return True
+            self._recent.append(now)
+            return False
+    
+    def handle(self, prompt: str, model: str = '') -> Tuple[int, Dict, Dict]:
+        """
+        处理一次请求
+        
+        Returns:
+            (HTTP 状态码, 响应 JSON, 额外响应头)
+        """
+        digest = hashlib.sha1(prompt.encode('utf-8')).hexdigest()
+        with self._lock:
+            attempt = self._attempts[digest]
+            self._attempts[digest] += 1
+            self.stats['requests'] += 1
+        key = f"{digest}:{attempt}"
+        
+        if self._over_rate_limit():
+            with self._lock:
+                self.stats['429'] += 1
+            return 429, {'error': {'message': 'Rate limit exceeded', 'code': 429}}, {'Retry-After': '1'}
+        
+        delay = self.latency + self.jitter * self._roll(key, 'jitter')
+        if delay > 0:
+            time.sleep(delay)
+        
+        if self._roll(key, 'error') < self.error_rate:
+            with self._lock:
+                self.stats['500'] += 1
+            return 500, {'error': {'message': 'Internal server error', 'code': 500}}, {}
+        
+        if '【新闻标题列表】' in prompt:
+            kind = 'batch'
+            content = json.dumps(self._score_batch(prompt), ensure_ascii=False, indent=2)
+        elif '【新闻标题】' in prompt:
+            kind = 'single'
+            title = prompt.split('【新闻标题】', 1)[1].strip().split('\n')[0].strip()
+            if self.is_hard_fault(title):
+                with self._lock:
+                    self.stats['500'] += 1
+                    self.stats['hard_fault'] += 1
+                return 500, {'error': {'message': 'Internal server error', 'code': 500}}, {}
+            content = json.dumps(self._score_title(title), ensure_ascii=False, indent=2)
+        elif '情感倾向' in prompt:
+            kind = 'sentiment'
+            content = self._sentiment_report(prompt)
+        else:
+            kind = 'other'
+            content = '收到。'
+        
+        if kind in ('single', 'batch') and self._roll(key, 'malformed') < self.malformed_rate:
+            # 模拟输出被截断
+            content = content[:len(content) // 2]
+            kind = 'malformed'
+        
+        with self._lock:
+            self.stats[kind] += 1
+        
+        prompt_tokens = self.estimate_tokens(prompt)
+        completion_tokens = self.estimate_tokens(content)
+        return 200, {
+            'id': f"mock-{digest[:12]}-{attempt}",
+            'object': 'chat.completion',
+            'model': model,
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop'
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens
+            }
+        }, {}
+    
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        """粗略估算 tokens：中文约每字 1 个，其他字符约每 4 个 1 个"""
+        cjk = sum(1 for char in text if ord(char) > 0x2E80)
+        return cjk + (len(text) - cjk + 3) // 4
+    
+    def _score_title(self, title: str) -> Dict:
+        """按评分标准给出单条评分，分数取关键词评分器的结果"""
+        total, details = self._scorer.score_news(title)
+        audience = details['受众广度']
+        interest = details['切身利益']
+        simplicity = details['易理解度']
+        return {
+            'audience_score': audience,
+            'interest_score': interest,
+            'simplicity_score': simplicity,
+            'total_score': total,
+            'reason': details.get('拒绝原因') or f"受众{audience}分，利益{interest}分，理解{simplicity}分",
+            'ad_direction': f"从「{title[:12]}」切入",
+            'target_audience': '普通上班族',
+            'emotion': self._sentiment(title)
+        }
+    
+    def _score_batch(self, prompt: str) -> List[Dict]:
+        """按编号逐条评分"""
+        section = prompt.split('【新闻标题列表】', 1)[1].split('【输出格式】', 1)[0]
+        items = []
+        for index, title in re.findall(r'^(\d+)\. (.*)$', section, re.M):
+            if self.is_hard_fault(title.strip()):
+                continue
+            items.append(dict(index=int(index), **self._score_title(title.strip())))
+        return items
+    
+    @staticmethod
+    def _sentiment(title: str) -> str:
+        positive = sum(1 for word in POSITIVE_WORDS if word in title)
+        negative = sum(1 for word in NEGATIVE_WORDS if word in title)
+        if positive > negative:
+            return 'positive'
+        if negative > positive:
+            return 'negative'
+        return 'neutral'
+    
+    def _sentiment_report(self, prompt: str) -> str:
+        """按 analyze_sentiment 提示词要求的格式输出情感分析报告"""
+        platform_titles = {}
+        platform = None
+        for line in prompt.split('\n'):
+            header = re.match(r'^【(.+)】\(\d+ 条\)$', line)
+            if header:
+                platform = header.group(1)
+                platform_titles[platform] = []
+                continue
+            item = re.match(r'^\d+\. (.*?)(?: \[\d{4}-\d{2}-\d{2}\])?$', line)
+            if item and platform is not None:
+                platform_titles[platform].append(item.group(1))
+        
+        labels = {'positive': '正面', 'negative': '负面', 'neutral': '中性'}
+        samples = {sentiment: [] for sentiment in labels}
+        total = Counter()
+        lines = ['## 平台情感对比']
+        for platform, titles in platform_titles.items():
+            counts = Counter(self._sentiment(title) for title in titles)
+            total.update(counts)
+            for title in titles:
+                samples[self._sentiment(title)].append(title)
+            lines.append(f"- {platform}：" + '，'.join(
+                f"{labels[sentiment]}{counts[sentiment]}条" for sentiment in labels
+            ))
+        
+        count = sum(total.values()) or 1
+        report = ['## 情感分布统计']
+        for sentiment, label in labels.items():
+            report.append(f"- {label}：{total[sentiment]}条 ({total[sentiment] * 100 // count}%)")
+        report += [''] + lines + ['', '## 整体情感趋势']
+        dominant = max(labels, key=lambda sentiment: total[sentiment])
+        report.append(f"整体以{labels[dominant]}为主。")
+        report += ['', '## 典型样本', '正面新闻样本：']
+        report += [f"- {title}" for title in samples['positive'][:5]] or ['- 无']
+        report += ['', '负面新闻样本：']
+        report += [f"- {title}" for title in samples['negative'][:5]] or ['- 无']
+        return '\n'.join(report)
+
+
+def main():
+    """命令行启动：python mock_llm_server.py [--port 8765] [--latency 0.3] ..."""
+    options = {
+        '--host': ('host', str), '--port': ('port', int), '--latency': ('latency', float),
+        '--jitter': ('jitter', float), '--error-rate': ('error_rate', float),
+        '--malformed-rate': ('malformed_rate', float), '--max-rps': ('max_rps', float),
+        '--hard-fault-rate': ('hard_fault_rate', float), '--seed': ('seed', int),
+    }
+    kwargs = {'port': 8765}
+    args = sys.argv[1:]
+    i = 0
+    while i < len(args):
+        if args[i] in options and i + 1 < len(args):
+            name, convert = options[args[i]]
+            try:
+                kwargs[name] = convert(args[i + 1])
+            except ValueError:
+                print(f"⚠️  参数 {args[i]} 的值无效: {args[i + 1]}")
+                return
+            i += 2
+        else:
+            print(f"⚠️  未知参数: {args[i]}")
+            print(f"   可用参数: {', '.join(options)}")
+            return
+    
+    server = MockChatServer(**kwargs)
+    print(f"模拟 chat completions 服务已启动: {server.base_url}")
+    print(f"  延迟 {server.latency}s（浮动 {server.jitter}s），错误率 {server.error_rate}，"
+          f"JSON 格式错误率 {server.malformed_rate}，每秒上限 {server.max_rps or '不限'}")
+    print("  按 Ctrl+C 停止")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"\n请求统计: {dict(server.stats)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,10 +4,104 @@
 基于三大黄金法则：受众广度 + 切身利益 + 理解简单
 """
 
-from typing import Dict, List, Tuple
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
 import re
 
 
+class KeywordAutomaton:
+    """
+    多模式关键词匹配自动机（Aho-Corasick）
+    
+    把多组关键词编译成一个自动机，对标题扫描一遍即可得到每组中
+    出现过的关键词（与逐个做 `keyword in text` 子串判断结果相同，
+    重叠、互为子串的关键词都会被找到）。
+    """
+    
+    def __init__(self, keyword_groups: Dict[str, List[str]]):
+        """
+        Args:
+            keyword_groups: {分组名: 关键词列表}
+        """
+        self.groups = list(keyword_groups)
+        # 空关键词是任意文本的子串，始终命中
+        self._always = []
+        goto = [{}]
+        outputs = [[]]
+        
+        for group, keywords in keyword_groups.items():
+            for index, keyword in enumerate(keywords):
+                if not keyword:
+                    self._always.append((group, index))
+                    continue
+                state = 0
+                for ch in keyword:
+                    next_state = goto[state].get(ch)
+                    if next_state is None:
+                        next_state = len(goto)
+                        goto.append({})
+                        outputs.append([])
+                        goto[state][ch] = next_state
+                    state = next_state
+                outputs[state].append((group, index))
+        
+        # 按层次构建失败指针，并把失败链上的输出合并到当前状态
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                if state:
+                    fail[next_state] = goto[fallback].get(ch, 0)
+                outputs[next_state] += outputs[fail[next_state]]
+        
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+    
+    def search(self, text: str) -> Dict[str, set]:
+        """
+        扫描一遍文本
+        
+        Returns:
+            {分组名: 命中关键词在该组列表中的下标集合}，没有命中的分组不出现
+        """
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        root = goto[0]
+        hits = {}
+        
+        for group, index in self._always:
+            hits.setdefault(group, set()).add(index)
+        
+        state = 0
+        for ch in text:
+            if state == 0:
+                # 大多数字符不是任何关键词的开头，直接跳过
+                state = root.get(ch, 0)
+                if state == 0:
+                    continue
+            else:
+                transitions = goto[state]
+                while ch not in transitions:
+                    state = fail[state]
+                    if state == 0:
+                        break
+                    transitions = goto[state]
+                state = goto[state].get(ch, 0)
+            for group, index in outputs[state]:
+                hits.setdefault(group, set()).add(index)
+        
+        return hits
+
+
 class NewsScorer:
     """新闻适配度评分器"""
     
@@ -72,6 +166,26 @@ class NewsScorer:
             '股票', '基金', '炒股', '投资理财', '虚拟货币', '比特币',
             '彩票', '赌博', '传销', '诈骗', '洗钱', '高利贷',
         ]
+        
+        self.compile_keywords()
+    
+    def compile_keywords(self):
+        """
+        把全部关键词列表编译成一个匹配自动机
+        
+        构造时自动调用；运行中修改了关键词列表后需重新调用。
+        黑名单和专业术语按小写匹配，其余列表与标题的小写形式直接比较。
+        """
+        self._automaton = KeywordAutomaton({
+            'blacklist': [keyword.lower() for keyword in self.blacklist_keywords],
+            'high_audience': self.high_audience_keywords,
+            'medium_audience': self.medium_audience_keywords,
+            'low_audience': self.low_audience_keywords,
+            'direct_interest': self.direct_interest_keywords,
+            'indirect_interest': self.indirect_interest_keywords,
+            'policy_benefit': self.policy_benefit_keywords,
+            'professional': [term.lower() for term in self.professional_terms],
+        })
     
     def score_news(self, title: str) -> Tuple[int, Dict[str, int]]:
         """
@@ -83,26 +197,21 @@ class NewsScorer:
         Returns:
             (总分, 评分详情字典)
         """
-        title_lower = title.lower()
+        # 一次扫描得到各类关键词的命中情况
+        hits = self._automaton.search(title.lower())
         
         # 1. 黑名单检查（直接0分）
-        for keyword in self.blacklist_keywords:
-            if keyword.lower() in title_lower:
-                return 0, {
-                    '受众广度': 0,
-                    '切身利益': 0,
-                    '易理解度': 0,
-                    '拒绝原因': f'包含禁用词: {keyword}'
-                }
+        if 'blacklist' in hits:
+            keyword = self.blacklist_keywords[min(hits['blacklist'])]
+            return 0, {
+                '受众广度': 0,
+                '切身利益': 0,
+                '易理解度': 0,
+                '拒绝原因': f'包含禁用词: {keyword}'
+            }
         
-        # 2. 受众广度评分（0-10分）
-        audience_score = self._score_audience(title_lower)
-        
-        # 3. 切身利益评分（0-10分）
-        interest_score = self._score_interest(title_lower)
-        
-        # 4. 易理解度评分（0-10分）
-        understanding_score = self._score_understanding(title_lower)
+        # 2-4. 受众广度、切身利益、易理解度（各0-10分）
+        audience_score, interest_score, understanding_score = self._score_hits(hits)
         
         total_score = audience_score + interest_score + understanding_score
         
@@ -114,28 +223,63 @@ class NewsScorer:
         
         return total_score, details
     
-    def _score_audience(self, title_lower: str) -> int:
+    def score_titles(self, titles: Iterable[str]) -> Dict[str, array]:
+        """
+        批量评分：返回紧凑的分数数组，不为每条标题创建详情字典
+        
+        重复标题只计算一次。被黑名单拒绝的标题各项均为 0（其他标题总分
+        至少为 9），拒绝原因可对需要展示的标题再调用 score_news 获取。
+        
+        Args:
+            titles: 新闻标题的可迭代对象（可以是生成器）
+            
+        Returns:
+            {'total', 'audience', 'interest', 'understanding'}，
+            每项为与 titles 一一对应的 array('b')
+        """
+        total, audience, interest, understanding = (array('b') for _ in range(4))
+        memo = {}
+        for title in titles:
+            scores = memo.get(title)
+            if scores is None:
+                hits = self._automaton.search(title.lower())
+                scores = (0, 0, 0) if 'blacklist' in hits else self._score_hits(hits)
+                memo[title] = scores
+            audience.append(scores[0])
+            interest.append(scores[1])
+            understanding.append(scores[2])
+            total.append(scores[0] + scores[1] + scores[2])
+        
+        return {
+            'total': total,
+            'audience': audience,
+            'interest': interest,
+            'understanding': understanding,
+        }
+    
+    def _score_hits(self, hits: Dict[str, set]) -> Tuple[int, int, int]:
+        """由关键词命中情况计算 (受众广度, 切身利益, 易理解度)"""
+        return (
+            self._score_audience(hits),
+            self._score_interest(hits),
+            self._score_understanding(hits),
+        )
+    
+    def _score_audience(self, hits: Dict[str, set]) -> int:
         """评估受众广度（0-10分）"""
         # 高受众关键词：10分
-        for keyword in self.high_audience_keywords:
-            if keyword in title_lower:
-                return 10
+        if 'high_audience' in hits:
+            return 10
         
         # 中等受众关键词：7-8分
-        medium_matches = sum(
-            1 for keyword in self.medium_audience_keywords
-            if keyword in title_lower
-        )
+        medium_matches = len(hits.get('medium_audience', ()))
         if medium_matches >= 2:
             return 8
         elif medium_matches == 1:
             return 7
         
         # 低受众关键词：5-6分
-        low_matches = sum(
-            1 for keyword in self.low_audience_keywords
-            if keyword in title_lower
-        )
+        low_matches = len(hits.get('low_audience', ()))
         if low_matches >= 2:
             return 6
         elif low_matches == 1:
@@ -144,41 +288,30 @@ class NewsScorer:
         # 默认：4分（普通话题）
         return 4
     
-    def _score_interest(self, title_lower: str) -> int:
+    def _score_interest(self, hits: Dict[str, set]) -> int:
         """评估切身利益（0-10分）"""
         # 直接利益关键词：10分
-        for keyword in self.direct_interest_keywords:
-            if keyword in title_lower:
-                return 10
+        if 'direct_interest' in hits:
+            return 10
         
         # 间接利益关键词：6-7分
-        indirect_matches = sum(
-            1 for keyword in self.indirect_interest_keywords
-            if keyword in title_lower
-        )
+        indirect_matches = len(hits.get('indirect_interest', ()))
         if indirect_matches >= 2:
             return 7
         elif indirect_matches == 1:
             return 6
         
         # 政策福利关键词：5分
-        policy_matches = sum(
-            1 for keyword in self.policy_benefit_keywords
-            if keyword in title_lower
-        )
-        if policy_matches >= 1:
+        if 'policy_benefit' in hits:
             return 5
         
         # 默认：3分
         return 3
     
-    def _score_understanding(self, title_lower: str) -> int:
+    def _score_understanding(self, hits: Dict[str, set]) -> int:
         """评估易理解程度（0-10分）"""
         # 检查专业术语数量（越多分数越低）
-        professional_count = sum(
-            1 for term in self.professional_terms
-            if term.lower() in title_lower
-        )
+        professional_count = len(hits.get('professional', ()))
         
         if professional_count == 0:
             # 无专业术语：10分（易理解）
@@ -223,35 +356,52 @@ class NewsScorer:
         """判断是否应该保留该新闻"""
         return score >= self.min_score
     
-    def filter_news_list(self, news_list: List[Dict]) -> List[Dict]:
+    def filter_news_list(self, news_list: List[Dict], top_k: Optional[int] = None) -> List[Dict]:
         """
         批量过滤新闻列表
         
+        先用 score_titles 得到全部标题的分数数组，按分数筛选、排序后
+        只为保留下来的新闻复制字典并生成标签。
+        
         Args:
             news_list: 新闻列表，每个元素包含 'title' 字段
+            top_k: 最多返回的条数，None 表示返回全部达标新闻
             
         Returns:
-            过滤后的新闻列表（包含评分信息）
+            过滤后的新闻列表（包含评分信息，按评分降序，同分保持原顺序）
         """
-        filtered_list = []
+        scores = self.score_titles(news.get('title') or '' for news in news_list)
+        totals = scores['total']
         
-        for news in news_list:
-            title = news.get('title', '')
-            if not title:
-                continue
-            
-            score, details = self.score_news(title)
-            
-            if self.should_keep(score):
-                news_with_score = news.copy()
-                news_with_score['score'] = score
-                news_with_score['score_details'] = details
-                news_with_score['rating_label'] = self.get_rating_label(score)
-                news_with_score['usage_suggestion'] = self.get_usage_suggestion(score)
-                filtered_list.append(news_with_score)
-        
-        # 按评分降序排序
-        filtered_list.sort(key=lambda x: x['score'], reverse=True)
+        kept = [
+            i for i, score in enumerate(totals)
+            if self.should_keep(score) and news_list[i].get('title')
+        ]
+        
+        # 按评分降序排序（稳定排序，同分保持原顺序）
+        if top_k is not None and top_k < len(kept):
+            kept = heapq.nlargest(top_k, kept, key=totals.__getitem__)
+        else:
+            kept.sort(key=totals.__getitem__, reverse=True)
+        
+        filtered_list = []
+        for i in kept:
+            score = totals[i]
+            if score == 0:
+                # 黑名单拒绝的新闻（仅在 min_score <= 0 时保留），补上拒绝原因
+                details = self.score_news(news_list[i]['title'])[1]
+            else:
+                details = {
+                    '受众广度': scores['audience'][i],
+                    '切身利益': scores['interest'][i],
+                    '易理解度': scores['understanding'][i],
+                }
+            news_with_score = news_list[i].copy()
+            news_with_score['score'] = score
+            news_with_score['score_details'] = details
+            news_with_score['rating_label'] = self.get_rating_label(score)
+            news_with_score['usage_suggestion'] = self.get_usage_suggestion(score)
+            filtered_list.append(news_with_score)
         
         return filtered_list
 
@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# 测试直接导入仓库根目录下的模块（main.py 在导入时按相对路径读取 config/）
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+import ai_scorer  # noqa: E402
+from mock_chat import MockPost  # noqa: E402
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """ai_scorer 的请求直接交给模拟服务处理，不经网络"""
+    post = MockPost()
+    monkeypatch.setattr(ai_scorer.requests, "post", post)
+    yield post
+    post.close()
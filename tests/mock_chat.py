@@ -0,0 +1,34 @@
+"""不经网络的模拟 chat completions：把 requests.post 直接转给 MockChatServer.handle"""
+
+import json
+
+from mock_llm_server import MockChatServer
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload, headers=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = json.dumps(payload, ensure_ascii=False)
+
+    def json(self):
+        return self._payload
+
+
+class MockPost:
+    """可替换 ai_scorer.requests.post 的可调用对象，calls 为收到的请求数"""
+
+    def __init__(self, **options):
+        self.server = MockChatServer(**options)
+        self.calls = 0
+
+    def __call__(self, url, headers=None, json=None, timeout=None):
+        self.calls += 1
+        status, payload, extra_headers = self.server.handle(
+            json["messages"][-1]["content"], json.get("model", "")
+        )
+        return FakeResponse(status, payload, extra_headers)
+
+    def close(self):
+        self.server.httpd.server_close()
@@ -0,0 +1,157 @@
+"""推送分批测试使用的合成报告数据
+
+标题覆盖 Markdown/HTML 特殊字符、长标题、emoji 与多字节字符、
+有无链接、排名高亮与非高亮、多次出现等分支。
+"""
+
+from datetime import datetime
+
+import pytz
+
+
+FIXED_NOW = pytz.timezone("Asia/Shanghai").localize(datetime(2025, 12, 6, 9, 30, 0))
+
+FORMAT_TYPES = ["wework", "bark", "telegram", "ntfy", "feishu", "dingtalk", "slack"]
+MODES = ["daily", "current", "incremental"]
+# 不同的分批上限：默认（按渠道配置）、较小（每批少量新闻）、极小（单条新闻超出上限）
+MAX_BYTES = [None, 1500, 400]
+
+_TITLES = [
+    "房租又涨了，年轻人该怎么办？",
+    "央行宣布降准 0.5 个百分点 *利好* _消费贷_",
+    "<script>alert('x')</script> & 标题里的 HTML [方括号](链接)",
+    "🎉 双十一消费数据出炉：同比增长 12%",
+    "一条非常长的标题" + "，内容不断重复以超过单批上限" * 12,
+    "工资拖欠问题引关注 `代码` ~删除线~ > 引用",
+    "Breaking: markets rally as rates fall | 美股大涨",
+    "失业保险金标准上调",
+]
+
+
+def _title_data(index, title, is_new=False):
+    ranks = [1 + index % 7, 3 + index % 11] if index % 3 else [12 + index]
+    return {
+        "title": title,
+        "source_name": ["微博", "知乎", "今日头条", "百度热搜"][index % 4],
+        "time_display": "" if index % 2 else f"[08:0{index % 10} ~ 09:1{index % 10}]",
+        "count": 1 + index % 3,
+        "ranks": ranks,
+        "rank_threshold": 5,
+        "url": "" if index % 5 == 4 else f"https://example.com/news/{index}?a=1&b=2",
+        "mobile_url": "" if index % 4 else f"https://m.example.com/{index}",
+        "is_new": is_new,
+    }
+
+
+def make_report_data():
+    stats = []
+    position = 0
+    for group, word in enumerate(["房租 工资", "降准", "消费", "全部新闻"]):
+        titles = []
+        for _ in range(3 + group * 2):
+            title = _TITLES[position % len(_TITLES)]
+            titles.append(_title_data(position, f"{title} #{position}", is_new=position % 4 == 0))
+            position += 1
+        stats.append(
+            {"word": word, "count": len(titles), "percentage": 12.5 * (group + 1), "titles": titles}
+        )
+
+    new_titles = []
+    for source_index, (source_id, source_name) in enumerate(
+        [("weibo", "微博"), ("zhihu", "知乎")]
+    ):
+        titles = [
+            _title_data(100 + i, f"{_TITLES[(i + source_index) % len(_TITLES)]} 新{i}", True)
+            for i in range(4)
+        ]
+        new_titles.append(
+            {"source_id": source_id, "source_name": source_name, "titles": titles}
+        )
+
+    return {
+        "stats": stats,
+        "new_titles": new_titles,
+        "failed_ids": ["toutiao", "<bad&id>"],
+        "total_new_count": sum(len(source["titles"]) for source in new_titles),
+    }
+
+
+UPDATE_INFO = {"current_version": "3.4.1", "remote_version": "3.5.0"}
+
+
+def iter_cases():
+    """(用例名, 渠道, 模式, 分批上限, update_info)"""
+    for format_type in FORMAT_TYPES:
+        for mode in MODES:
+            for max_bytes in MAX_BYTES:
+                for with_update in (False, True):
+                    name = f"{format_type}:{mode}:{max_bytes}:{int(with_update)}"
+                    yield name, format_type, mode, max_bytes, UPDATE_INFO if with_update else None
+
+
+# 分批上限与分割线取固定值，基准输出不随 config.yaml 变化
+CONFIG_OVERRIDES = {
+    "MESSAGE_BATCH_SIZE": 4000,
+    "DINGTALK_BATCH_SIZE": 20000,
+    "FEISHU_BATCH_SIZE": 29000,
+    "FEISHU_MESSAGE_SEPARATOR": "━━━━━━━━━━━━━━━━━━━",
+}
+
+TITLE_PLATFORMS = ["feishu", "dingtalk", "wework", "bark", "telegram", "ntfy", "slack", "html"]
+
+
+def iter_title_data():
+    """报告数据中出现的全部标题条目"""
+    report_data = make_report_data()
+    for stat in report_data["stats"]:
+        yield from stat["titles"]
+    for source in report_data["new_titles"]:
+        yield from source["titles"]
+
+
+def collect_outputs(module):
+    """用给定版本的 main 模块生成全部用例的输出：用例名 -> 输出内容"""
+    outputs = {}
+    for name, format_type, mode, max_bytes, update_info in iter_cases():
+        outputs[f"split:{name}"] = module.split_content_into_batches(
+            make_report_data(), format_type, update_info, max_bytes=max_bytes, mode=mode
+        )
+    for mode in MODES:
+        for update_info in (None, UPDATE_INFO):
+            suffix = f"{mode}:{int(update_info is not None)}"
+            outputs[f"feishu:{suffix}"] = module.render_feishu_content(
+                make_report_data(), update_info, mode
+            )
+            outputs[f"dingtalk:{suffix}"] = module.render_dingtalk_content(
+                make_report_data(), update_info, mode
+            )
+    for platform in TITLE_PLATFORMS:
+        for show_source in (True, False):
+            outputs[f"title:{platform}:{int(show_source)}"] = [
+                module.format_title_for_platform(platform, title_data, show_source)
+                for title_data in iter_title_data()
+            ]
+    return outputs
+
+
+# 推送流程测试使用的单条词频统计（count_word_frequency 的输出格式）
+PUSH_STATS = [
+    {
+        "word": "房租",
+        "count": 1,
+        "position": 0,
+        "titles": [
+            {
+                "title": "房租又涨了",
+                "source_name": "微博",
+                "time_display": "",
+                "count": 1,
+                "ranks": [1],
+                "rank_threshold": 5,
+                "url": "",
+                "mobileUrl": "",
+                "is_new": False,
+            }
+        ],
+    }
+]
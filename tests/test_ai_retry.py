@@ -0,0 +1,76 @@
+"""AI 评分的 429 重试：限流反馈给发出该请求的那次批量评分的限速器"""
+
+import threading
+
+import pytest
+
+import ai_scorer
+from ai_scorer import AINewsScorer
+from mock_chat import FakeResponse
+
+
+class RecordingLimiter(ai_scorer.RateLimiter):
+    instances = []
+
+    def __init__(self, rate):
+        super().__init__(rate)
+        self.throttled = 0
+        RecordingLimiter.instances.append(self)
+
+    def throttle(self, delay):
+        self.throttled += 1
+        super().throttle(delay)
+
+
+@pytest.fixture
+def throttled_post(monkeypatch, mock_post):
+    """每个请求第一次返回 429（Retry-After: 0），重试时交给模拟服务"""
+    seen = set()
+    lock = threading.Lock()
+
+    def post(url, headers=None, json=None, timeout=None):
+        prompt = json["messages"][-1]["content"]
+        # 稍作停顿让两次运行的请求交错（不用 time.sleep，以免被测试替换）
+        threading.Event().wait(0.005)
+        with lock:
+            first = prompt not in seen
+            seen.add(prompt)
+        if first:
+            return FakeResponse(429, {"error": {"code": 429}}, {"Retry-After": "0"})
+        return mock_post(url, headers=headers, json=json, timeout=timeout)
+
+    RecordingLimiter.instances = []
+    monkeypatch.setattr(ai_scorer.requests, "post", post)
+    monkeypatch.setattr(ai_scorer, "RateLimiter", RecordingLimiter)
+    return post
+
+
+def test_concurrent_runs_on_one_scorer_keep_their_own_limiter(throttled_post):
+    scorer = AINewsScorer("key", base_url="http://mock")
+    runs = {
+        "a": [f"房租上涨第{i}条" for i in range(3)],
+        "b": [f"工资拖欠第{i}条" for i in range(6)],
+    }
+    results = {}
+
+    def run(name):
+        results[name] = scorer.batch_score_news(runs[name], concurrency=2, rate_limit=0)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in runs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [len(results[name]) for name in runs] == [3, 6]
+    # 每次运行一个限速器，各自收到自己请求的 429
+    assert sorted(limiter.throttled for limiter in RecordingLimiter.instances) == [3, 6]
+    assert not hasattr(scorer, "_limiter")
+
+
+def test_single_request_without_limiter_sleeps(throttled_post, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(ai_scorer.time, "sleep", sleeps.append)
+    scorer = AINewsScorer("key", base_url="http://mock")
+    assert scorer.score_news("房租又涨了") is not None
+    assert sleeps == [0.0]
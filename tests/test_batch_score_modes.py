@@ -0,0 +1,78 @@
+"""batch_score 的 ai / hybrid 模式：Token 预算用完时降级为关键词评分，结果按分数降序"""
+
+import json
+
+import pytest
+
+import batch_score
+
+
+AI_CONFIG = {"api_key": "key", "batch_delay": 0}
+DETAILS = {"受众广度": 9, "切身利益": 10, "易理解度": 9}
+
+
+def ai_item(title, score):
+    return {"title": title, "ai_score": score, "ai_details": DETAILS}
+
+
+class StubUsage:
+    def exhausted(self):
+        # 预算已用完：只有 skipped_titles 中的标题算作降级
+        return True
+
+
+class StubScorer:
+    """按 outcomes 产出评分结果，None 表示评分失败"""
+
+    def __init__(self, outcomes, skipped):
+        self.outcomes = outcomes
+        self.skipped_titles = skipped
+        self.usage = StubUsage()
+
+    def batch_score_news(self, titles, **kwargs):
+        return [item for item in self.outcomes.values() if item]
+
+    def iter_score_news(self, titles, **kwargs):
+        for title in titles:
+            yield title, self.outcomes[title]
+
+
+@pytest.fixture
+def score_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_score, "close_ai_scorer", lambda scorer: None)
+
+    def run(mode, titles, scorer):
+        monkeypatch.setattr(batch_score, "create_ai_scorer", lambda config: scorer)
+        txt_path = tmp_path / "report.txt"
+        lines = [f"{i}. [微博] {title} [{i}] - 09:00 (1次)" for i, title in enumerate(titles, 1)]
+        txt_path.write_text("\n".join(lines), encoding="utf-8")
+        batch_score.score_txt_file(
+            str(txt_path), min_score=18, output_json=True, mode=mode, ai_config=AI_CONFIG
+        )
+        scored = json.loads((tmp_path / "report_scored.json").read_text(encoding="utf-8"))
+        return [(item["title"], item["score"]) for item in scored]
+
+    return run
+
+
+def test_ai_mode_sorts_degraded_and_ai_results(score_file):
+    # 降级的标题关键词 23 分，AI 评分的标题 28 分
+    scorer = StubScorer({"工资拖欠问题引关注": ai_item("工资拖欠问题引关注", 28)}, ["多地房租又涨了"])
+    results = score_file("ai", ["多地房租又涨了", "工资拖欠问题引关注"], scorer)
+    assert results == [("工资拖欠问题引关注", 28), ("多地房租又涨了", 23)]
+
+
+def test_hybrid_mode_degrades_only_skipped_titles(score_file):
+    scorer = StubScorer(
+        {
+            "工资拖欠问题引关注": ai_item("工资拖欠问题引关注", 28),
+            # 评分失败但不在 skipped_titles 中：跳过而不是降级
+            "失业保险金标准上调": None,
+            "多地房租又涨了": None,
+        },
+        ["多地房租又涨了"],
+    )
+    results = score_file(
+        "hybrid", ["多地房租又涨了", "失业保险金标准上调", "工资拖欠问题引关注"], scorer
+    )
+    assert results == [("工资拖欠问题引关注", 28), ("多地房租又涨了", 23)]
@@ -0,0 +1,18 @@
+"""配置加载：YAML 中留空的配置节按默认值处理"""
+
+from pathlib import Path
+
+import main
+
+
+def test_empty_rate_limit_channels_use_defaults(tmp_path, monkeypatch):
+    config_text = Path("config/config.yaml").read_text(encoding="utf-8")
+    assert "    channels: {}" in config_text
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        config_text.replace("    channels: {}", "    channels:"), encoding="utf-8"
+    )
+    monkeypatch.setenv("CONFIG_PATH", str(config_file))
+
+    config = main.load_config()
+    assert config["RATE_LIMIT"]["CHANNELS"] == main.CHANNEL_RATE_LIMITS
@@ -0,0 +1,96 @@
+"""后台邮件发送：结果确定后才记录推送和推送摘要，超时的投递记为失败且不拖住退出"""
+
+import threading
+import time
+
+import pytest
+
+import main
+import notification_cases as cases
+
+
+@pytest.fixture
+def email_only(tmp_path, monkeypatch):
+    """只配置邮件渠道并开启后台发送、每天只推一次和跳过未变化推送"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "get_beijing_time", lambda: cases.FIXED_NOW)
+    monkeypatch.setitem(main.CONFIG, "SKIP_UNCHANGED_PUSH", True)
+    monkeypatch.setitem(
+        main.CONFIG,
+        "PUSH_WINDOW",
+        {
+            **main.CONFIG["PUSH_WINDOW"],
+            "ENABLED": True,
+            "ONCE_PER_DAY": True,
+            "TIME_RANGE": {"START": "00:00", "END": "23:59"},
+        },
+    )
+    monkeypatch.setitem(
+        main.CONFIG, "EMAIL_DELIVERY", {**main.CONFIG["EMAIL_DELIVERY"], "ASYNC": True}
+    )
+    for key in (
+        "FEISHU_WEBHOOK_URL",
+        "DINGTALK_WEBHOOK_URL",
+        "WEWORK_WEBHOOK_URL",
+        "TELEGRAM_BOT_TOKEN",
+        "NTFY_SERVER_URL",
+        "BARK_URL",
+        "SLACK_WEBHOOK_URL",
+    ):
+        monkeypatch.setitem(main.CONFIG, key, "")
+    monkeypatch.setitem(main.CONFIG, "EMAIL_FROM", "bot@example.com")
+    monkeypatch.setitem(main.CONFIG, "EMAIL_PASSWORD", "secret")
+    monkeypatch.setitem(main.CONFIG, "EMAIL_TO", "a@example.com")
+
+    html_file = tmp_path / "report.html"
+    html_file.write_text("<html></html>", encoding="utf-8")
+    yield str(html_file)
+    main._email_deliveries.clear()
+
+
+def push(html_file):
+    return main.send_to_notifications(
+        cases.PUSH_STATS, [], "当日汇总", html_file_path=html_file
+    )
+
+
+def pushed_today():
+    return main.PushRecordManager().has_pushed_today()
+
+
+def test_async_email_is_recorded_only_after_success(email_only, monkeypatch):
+    outcome = [False]
+    monkeypatch.setattr(main, "deliver_email", lambda *args: outcome[0])
+
+    results = push(email_only)
+    assert isinstance(results["email"], main.PendingEmail)
+    assert not pushed_today()
+
+    # SMTP 失败：不记录推送，下次运行仍会发送
+    assert main.wait_for_email_deliveries(timeout=5) == {"当日汇总": False}
+    assert not pushed_today()
+    assert not main.ReportDigestStore().records
+
+    outcome[0] = True
+    push(email_only)
+    assert main.wait_for_email_deliveries(timeout=5) == {"当日汇总": True}
+    assert pushed_today()
+    assert list(main.ReportDigestStore().records) == ["push:daily:当日汇总:email"]
+
+
+def test_timed_out_delivery_counts_as_failed(email_only, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(main, "deliver_email", lambda *args: release.wait(5))
+
+    push(email_only)
+    push(email_only)
+    start = time.monotonic()
+    assert main.wait_for_email_deliveries(timeout=0.2) == {"当日汇总": False}
+    assert time.monotonic() - start < 2
+    assert not pushed_today()
+
+    # 投递线程是守护线程，不会在退出时被等待
+    assert all(
+        thread.daemon for thread in threading.enumerate() if thread.name == "email"
+    )
+    release.set()
@@ -0,0 +1,82 @@
+"""推送内容的字节一致性
+
+tests/data/notification_outputs.json 记录的是分批拆分、渲染中间表示和
+新闻片段缓存改造之前（线性分批之前的 main.py）对同一份合成报告数据的输出摘要，
+改造后的实现必须逐字节一致。
+"""
+
+import hashlib
+import json
+import os
+from unittest import mock
+
+import pytest
+
+import main
+import notification_cases as cases
+
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), "data", "notification_outputs.json")
+
+with open(DATA_FILE, "r", encoding="utf-8") as f:
+    EXPECTED = json.load(f)
+
+
+def digest(output):
+    return hashlib.sha256(json.dumps(output, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+@pytest.fixture(scope="module")
+def outputs():
+    with mock.patch.object(main, "get_beijing_time", lambda: cases.FIXED_NOW), mock.patch.dict(
+        main.CONFIG, cases.CONFIG_OVERRIDES
+    ):
+        return cases.collect_outputs(main)
+
+
+def test_case_list_matches_reference(outputs):
+    assert sorted(outputs) == sorted(EXPECTED)
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_output_matches_reference(outputs, name):
+    assert digest(outputs[name]) == EXPECTED[name]
+
+
+def test_split_respects_byte_budget_for_news_items():
+    # 除单条新闻本身超出上限的情况外，每批不超过 max_bytes
+    with mock.patch.object(main, "get_beijing_time", lambda: cases.FIXED_NOW):
+        for format_type in cases.FORMAT_TYPES:
+            batches = main.split_content_into_batches(
+                cases.make_report_data(), format_type, max_bytes=1500
+            )
+            assert len(batches) > 1
+            assert all(len(batch.encode("utf-8")) <= 1500 for batch in batches)
+
+
+@pytest.mark.parametrize("format_type", cases.FORMAT_TYPES)
+def test_prebuilt_ir_gives_same_batches(format_type):
+    with mock.patch.object(main, "get_beijing_time", lambda: cases.FIXED_NOW):
+        plain = main.split_content_into_batches(cases.make_report_data(), format_type)
+        report_data = cases.make_report_data()
+        report_data["ir"] = main.build_report_ir(report_data)
+        first = main.split_content_into_batches(report_data, format_type)
+        # 同一份中间表示重复使用（片段已缓存）结果不变
+        second = main.split_content_into_batches(report_data, format_type)
+    assert first == plain
+    assert second == plain
+
+
+@pytest.mark.parametrize("platform", sorted(main.NEWS_ITEM_MARKUP))
+def test_format_cache_matches_uncached(platform):
+    format_cache = main.NewsFormatCache()
+    for title_data in cases.iter_title_data():
+        for show_source in (True, False):
+            expected = main.format_title_for_platform(platform, title_data, show_source)
+            for _ in range(2):
+                assert (
+                    main.format_title_for_platform(
+                        platform, title_data, show_source, format_cache=format_cache
+                    )
+                    == expected
+                )
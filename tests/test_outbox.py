@@ -0,0 +1,169 @@
+"""推送发件箱：与直接发送结果一致、失败重试、重试用尽后下次运行续发"""
+
+import os
+import time
+from unittest import mock
+
+import pytest
+
+import main
+import notification_cases as cases
+from mock_chat import FakeResponse
+
+
+@pytest.fixture(autouse=True)
+def isolated_outbox(tmp_path, monkeypatch):
+    """发件箱写到临时目录，不等待真实的批次间隔与退避时间"""
+    monkeypatch.chdir(tmp_path)
+    sleeps = []
+    monkeypatch.setattr(main.time, "sleep", sleeps.append)
+    monkeypatch.setitem(
+        main.CONFIG,
+        "OUTBOX",
+        {**main.CONFIG["OUTBOX"], "MAX_RETRIES": 3, "RETRY_BACKOFF": 2, "EXPIRE_HOURS": 24},
+    )
+    monkeypatch.setitem(
+        main.CONFIG, "RATE_LIMIT", {**main.CONFIG["RATE_LIMIT"], "ENABLED": False}
+    )
+    main._channel_pacers.clear()
+    return sleeps
+
+
+def make_entries(count):
+    return main.build_batch_entries([f"第{i}批内容" for i in range(1, count + 1)], "当日汇总")
+
+
+def send_to_wework(outbox_enabled):
+    """outbox 开关下各发送一次企业微信，返回 (是否成功, 依次发出的消息内容)"""
+    posted = []
+
+    def post(url, **kwargs):
+        posted.append(kwargs["json"]["markdown"]["content"])
+        return FakeResponse(200, {"errcode": 0})
+
+    outbox_config = {**main.CONFIG["OUTBOX"], "ENABLED": outbox_enabled}
+    with mock.patch.object(main.requests, "post", post), mock.patch.dict(
+        main.CONFIG, {"OUTBOX": outbox_config, "WEWORK_MSG_TYPE": "markdown"}
+    ), mock.patch.object(main, "get_beijing_time", lambda: cases.FIXED_NOW):
+        ok = main.send_to_wework("https://wework", cases.make_report_data(), "当日汇总")
+    return ok, posted
+
+
+def test_outbox_sends_same_batches_as_direct_delivery():
+    direct_ok, direct = send_to_wework(outbox_enabled=False)
+    outbox_ok, via_outbox = send_to_wework(outbox_enabled=True)
+    assert direct_ok and outbox_ok
+    assert len(direct) > 1
+    assert via_outbox == direct
+    assert main.NotificationOutbox("wework").pending == []
+
+
+def test_failed_batch_is_retried_with_backoff(isolated_outbox):
+    outbox = main.NotificationOutbox("wework")
+    outbox.enqueue(make_entries(2))
+    results = iter([False, False, True, True])
+    sent = []
+
+    def send_batch(entry):
+        ok = next(results)
+        if ok:
+            sent.append(entry["content"])
+        return ok
+
+    assert outbox.flush(send_batch, interval=1) == 2
+    assert sent == ["第1批内容", "第2批内容"]
+    # 两次退避（2、4 秒）后成功，之后按批次间隔发送下一批
+    assert isolated_outbox == [2, 4, 1]
+    assert outbox.pending == []
+
+
+def test_exhausted_retries_resume_from_first_unsent_batch():
+    outbox = main.NotificationOutbox("wework")
+    keys = outbox.enqueue(make_entries(3))
+    sent = []
+
+    def flaky(entry):
+        if entry["batch_num"] == 2:
+            return False
+        sent.append(entry["batch_num"])
+        return True
+
+    assert outbox.flush(flaky, interval=0) == 1
+    assert [entry["batch_num"] for entry in outbox.pending] == [2, 3]
+    assert outbox.pending[0]["attempts"] == 4
+
+    # 下次运行：从文件恢复，只续发未送达的批次，已送达的不重复发送
+    resumed = main.NotificationOutbox("wework")
+    assert resumed.enqueue(make_entries(3)) == keys
+    assert [entry["batch_num"] for entry in resumed.pending] == [2, 3]
+    assert resumed.flush(lambda entry: sent.append(entry["batch_num"]) or True, 0) == 2
+    assert sent == [1, 2, 3]
+    assert set(resumed.sent) == set(keys)
+
+
+def test_expired_batches_are_dropped():
+    outbox = main.NotificationOutbox("wework")
+    outbox.enqueue(make_entries(2))
+    outbox.pending[0]["created_at"] = time.time() - 25 * 3600
+    outbox.save()
+
+    reloaded = main.NotificationOutbox("wework")
+    assert [entry["batch_num"] for entry in reloaded.pending] == [2]
+
+
+def test_partial_channel_keeps_sending_after_dead_batch():
+    outbox = main.NotificationOutbox("ntfy")
+    outbox.enqueue(make_entries(3))
+    sent = []
+
+    def flaky(entry):
+        if entry["batch_num"] == 1:
+            return False
+        sent.append(entry["batch_num"])
+        return True
+
+    assert outbox.flush(flaky, interval=0, allow_partial=True) == 2
+    assert sent == [2, 3]
+    assert [entry["batch_num"] for entry in outbox.pending] == [1]
+
+
+def test_dead_backlog_does_not_block_new_report(isolated_outbox):
+    outbox = main.NotificationOutbox("wework")
+    outbox.enqueue(make_entries(2))
+    assert outbox.flush(lambda entry: False, interval=0) == 0
+    del isolated_outbox[:]
+
+    # 下次运行：积压批次只再尝试一次，失败后照常发送新报告
+    outbox = main.NotificationOutbox("wework")
+    new_keys = outbox.enqueue(
+        main.build_batch_entries(["新报告第1批", "新报告第2批"], "当日汇总")
+    )
+    attempts = []
+
+    def send_batch(entry):
+        attempts.append(entry["content"])
+        return entry["content"].startswith("新报告")
+
+    assert outbox.flush(send_batch, interval=0) == 2
+    assert attempts == ["第1批内容", "新报告第1批", "新报告第2批"]
+    assert isolated_outbox == [0, 0]
+    assert all(key in outbox.sent for key in new_keys)
+    assert [entry["content"] for entry in outbox.pending] == ["第1批内容", "第2批内容"]
+
+
+@pytest.mark.skipif(main.fcntl is None, reason="需要 fcntl 文件锁")
+def test_outbox_holds_channel_lock():
+    with main.NotificationOutbox("wework") as outbox:
+        outbox.enqueue(make_entries(1))
+        fd = os.open(outbox.lock_file, os.O_RDWR)
+        try:
+            with pytest.raises(BlockingIOError):
+                main.fcntl.flock(fd, main.fcntl.LOCK_EX | main.fcntl.LOCK_NB)
+        finally:
+            os.close(fd)
+
+    fd = os.open(outbox.lock_file, os.O_RDWR)
+    try:
+        main.fcntl.flock(fd, main.fcntl.LOCK_EX | main.fcntl.LOCK_NB)
+    finally:
+        os.close(fd)
@@ -0,0 +1,70 @@
+"""未变化推送跳过：按渠道记录摘要，上次失败的渠道下次仍会推送"""
+
+import pytest
+
+import main
+import notification_cases as cases
+
+
+@pytest.fixture
+def channels(tmp_path, monkeypatch):
+    """只配置飞书和企业微信，发送结果由 outcomes 控制"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, "get_beijing_time", lambda: cases.FIXED_NOW)
+    monkeypatch.setitem(main.CONFIG, "SKIP_UNCHANGED_PUSH", True)
+    monkeypatch.setitem(main.CONFIG, "PARALLEL_SEND", False)
+    monkeypatch.setitem(
+        main.CONFIG, "PUSH_WINDOW", {**main.CONFIG["PUSH_WINDOW"], "ENABLED": False}
+    )
+    for key in (
+        "DINGTALK_WEBHOOK_URL",
+        "TELEGRAM_BOT_TOKEN",
+        "EMAIL_FROM",
+        "NTFY_SERVER_URL",
+        "BARK_URL",
+        "SLACK_WEBHOOK_URL",
+    ):
+        monkeypatch.setitem(main.CONFIG, key, "")
+    monkeypatch.setitem(main.CONFIG, "FEISHU_WEBHOOK_URL", "https://feishu")
+    monkeypatch.setitem(main.CONFIG, "WEWORK_WEBHOOK_URL", "https://wework")
+
+    outcomes = {"feishu": True, "wework": True}
+    calls = []
+
+    def sender(channel):
+        def send(*args, **kwargs):
+            calls.append(channel)
+            return outcomes[channel]
+
+        return send
+
+    monkeypatch.setattr(main, "send_to_feishu", sender("feishu"))
+    monkeypatch.setattr(main, "send_to_wework", sender("wework"))
+    return outcomes, calls
+
+
+def push():
+    return main.send_to_notifications(cases.PUSH_STATS, [], "当日汇总")
+
+
+def test_failed_channel_is_retried_on_unchanged_report(channels):
+    outcomes, calls = channels
+    outcomes["wework"] = False
+    assert push() == {"feishu": True, "wework": False}
+
+    # 内容未变化：只有上次失败的企业微信再次推送
+    outcomes["wework"] = True
+    assert push() == {"wework": True}
+    assert calls == ["feishu", "wework", "wework"]
+
+    # 两个渠道都已送达，整次推送跳过
+    assert push() == {}
+    assert calls == ["feishu", "wework", "wework"]
+
+
+def test_changed_report_is_sent_to_every_channel(channels):
+    _, calls = channels
+    push()
+    changed_stats = [{**cases.PUSH_STATS[0], "word": "工资"}]
+    main.send_to_notifications(changed_stats, [], "当日汇总")
+    assert calls == ["feishu", "wework", "feishu", "wework"]
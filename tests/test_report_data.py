@@ -0,0 +1,45 @@
+from unittest import mock
+
+import main
+
+
+WORD_GROUPS = [{"required": [], "normal": ["房租"], "group_key": "房租"}]
+
+
+def make_new_titles():
+    return {
+        "weibo": {
+            "房租又涨了": {"ranks": [1], "url": "", "mobileUrl": ""},
+            "房租补贴发放": {"ranks": [3], "url": "", "mobileUrl": ""},
+            "明星官宣": {"ranks": [2], "url": "", "mobileUrl": ""},
+        }
+    }
+
+
+def prepare(**kwargs):
+    with mock.patch.object(main, "load_frequency_words", return_value=(WORD_GROUPS, [])):
+        return main.prepare_report_data(
+            [], [], make_new_titles(), {"weibo": "微博"}, "daily", **kwargs
+        )
+
+
+def new_title_list(report_data):
+    return [item["title"] for source in report_data["new_titles"] for item in source["titles"]]
+
+
+def test_new_titles_without_scores_only_match_word_groups():
+    report_data = prepare()
+    assert new_title_list(report_data) == ["房租又涨了", "房租补贴发放"]
+    assert report_data["total_new_count"] == 2
+
+
+def test_new_titles_apply_min_score_like_stats():
+    scores = {"房租又涨了": 25, "房租补贴发放": 10, "明星官宣": 30}
+    report_data = prepare(title_scores=scores, min_score=18)
+    assert new_title_list(report_data) == ["房租又涨了"]
+    assert report_data["total_new_count"] == 1
+
+
+def test_unscored_new_titles_are_kept():
+    report_data = prepare(title_scores={"房租补贴发放": 10}, min_score=18)
+    assert new_title_list(report_data) == ["房租又涨了"]
@@ -0,0 +1,111 @@
+"""AI 评分缓存：TTL 过期、LRU 淘汰、持久化恢复，以及启用缓存后评分结果不变"""
+
+import pytest
+
+import ai_scorer
+from ai_scorer import AINewsScorer, ScoreCache
+
+
+NAMESPACE = "ns"
+
+
+def score(total):
+    return {"total_score": total}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """可手动推进的 time.time"""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(ai_scorer.time, "time", lambda: now[0])
+    return now
+
+
+def test_ttl_expires_entries(tmp_path, clock):
+    cache = ScoreCache(str(tmp_path / "scores.jsonl"), ttl_days=1)
+    cache.put("房租上涨", NAMESPACE, score(20))
+
+    clock[0] += 86400 - 1
+    assert cache.get("房租上涨", NAMESPACE) == score(20)
+
+    clock[0] += 2
+    assert cache.get("房租上涨", NAMESPACE) is None
+    # 过期记录在重新载入时同样不生效
+    assert ScoreCache(str(tmp_path / "scores.jsonl"), ttl_days=1).get("房租上涨", NAMESPACE) is None
+
+
+def test_zero_ttl_never_expires(tmp_path, clock):
+    cache = ScoreCache(str(tmp_path / "scores.jsonl"), ttl_days=0)
+    cache.put("房租上涨", NAMESPACE, score(20))
+    clock[0] += 365 * 86400
+    assert cache.get("房租上涨", NAMESPACE) == score(20)
+
+
+def test_lru_evicts_least_recently_used(tmp_path, clock):
+    cache = ScoreCache(str(tmp_path / "scores.jsonl"), max_entries=2)
+    cache.put("a", NAMESPACE, score(1))
+    cache.put("b", NAMESPACE, score(2))
+    # 命中后 a 变为最近使用，插入 c 时淘汰 b
+    assert cache.get("a", NAMESPACE) == score(1)
+    cache.put("c", NAMESPACE, score(3))
+
+    assert cache.get("b", NAMESPACE) is None
+    assert cache.get("a", NAMESPACE) == score(1)
+    assert cache.get("c", NAMESPACE) == score(3)
+
+
+def test_reload_keeps_latest_value_and_capacity(tmp_path, clock):
+    path = str(tmp_path / "scores.jsonl")
+    cache = ScoreCache(path)
+    for i, title in enumerate(["a", "b", "c"]):
+        clock[0] += 1
+        cache.put(title, NAMESPACE, score(i))
+    cache.put("a", NAMESPACE, score(9))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"k": "ns:broken", "t": ')  # 写入中断留下的残缺行
+
+    reloaded = ScoreCache(path, max_entries=2)
+    # 文件按写入顺序恢复：a 最后写入，b 最早被淘汰
+    assert reloaded.get("b", NAMESPACE) is None
+    assert reloaded.get("a", NAMESPACE) == score(9)
+    assert reloaded.get("c", NAMESPACE) == score(2)
+
+
+def test_key_normalization_and_namespace(tmp_path):
+    cache = ScoreCache(str(tmp_path / "scores.jsonl"))
+    cache.put("ＡＩ 评分  测试", NAMESPACE, score(10))
+    assert cache.get("ai 评分 测试", NAMESPACE) == score(10)
+    assert cache.get("ai 评分 测试", "other") is None
+
+
+def test_close_compacts_stale_lines(tmp_path):
+    path = tmp_path / "scores.jsonl"
+    cache = ScoreCache(str(path), max_entries=10)
+    for i in range(200):
+        cache.put(f"t{i % 5}", NAMESPACE, score(i % 30))
+    cache.close()
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 5
+    reloaded = ScoreCache(str(path))
+    assert reloaded.get("t4", NAMESPACE) == score(199 % 30)
+
+
+TITLES = ["房租又涨了", "央行宣布降准", "明星官宣恋情", "房租又涨了", "失业保险金标准上调"]
+
+
+def test_cached_scoring_matches_uncached(tmp_path, mock_post, capsys):
+    uncached = AINewsScorer("key", base_url="http://mock").batch_score_news(TITLES, delay=0)
+    calls_without_cache = mock_post.calls
+
+    cache = ScoreCache(str(tmp_path / "scores.jsonl"))
+    first = AINewsScorer("key", base_url="http://mock", cache=cache).batch_score_news(TITLES, delay=0)
+    # 重复标题只请求一次
+    assert mock_post.calls - calls_without_cache == len(set(TITLES))
+
+    calls_before = mock_post.calls
+    reloaded = ScoreCache(str(tmp_path / "scores.jsonl"))
+    second = AINewsScorer("key", base_url="http://mock", cache=reloaded).batch_score_news(
+        TITLES, delay=0
+    )
+    assert mock_post.calls == calls_before
+    assert uncached == first == second
@@ -0,0 +1,88 @@
+"""关键词批量评分：score_titles / filter_news_list 与逐条 score_news 的结果一致"""
+
+import pytest
+
+from news_scorer import NewsScorer
+
+
+TITLES = [
+    "房租上涨，年轻人生活成本压力大",
+    "央行下调LPR，货币政策再度调整",
+    "明星直播带货翻车",
+    "春节年货涨价，人情礼金负担重",
+    "消费券开始发放，市民可在线申请领取",
+    "外卖骑手兼职跑腿收入如何",
+    "结婚彩礼与份子钱：红包开销不易",
+    "GDP与CPI数据公布，汇率小幅波动",
+    "某地天气晴朗",
+    "工资拖欠，打工人欠薪维权",
+    "股票基金投资理财需谨慎",
+    "房租上涨，年轻人生活成本压力大",
+    "车贷保养停车费，养车成本上涨",
+    "",
+    "某地天气晴朗",
+]
+
+
+def make_news_list():
+    news_list = [{"title": title, "source": f"s{i}"} for i, title in enumerate(TITLES)]
+    news_list.append({"title": None, "source": "none"})
+    news_list.append({"source": "missing"})
+    return news_list
+
+
+def legacy_filter_news_list(scorer, news_list):
+    """逐条评分并生成字典的原始过滤方式"""
+    filtered_list = []
+    for news in news_list:
+        title = news.get("title", "")
+        if not title:
+            continue
+        score, details = scorer.score_news(title)
+        if scorer.should_keep(score):
+            news_with_score = news.copy()
+            news_with_score["score"] = score
+            news_with_score["score_details"] = details
+            news_with_score["rating_label"] = scorer.get_rating_label(score)
+            news_with_score["usage_suggestion"] = scorer.get_usage_suggestion(score)
+            filtered_list.append(news_with_score)
+    filtered_list.sort(key=lambda x: x["score"], reverse=True)
+    return filtered_list
+
+
+def test_score_titles_matches_score_news():
+    scorer = NewsScorer()
+    # 生成器输入，含重复标题
+    scores = scorer.score_titles(title for title in TITLES)
+
+    for i, title in enumerate(TITLES):
+        total, details = scorer.score_news(title)
+        assert scores["total"][i] == total
+        assert scores["audience"][i] == details["受众广度"]
+        assert scores["interest"][i] == details["切身利益"]
+        assert scores["understanding"][i] == details["易理解度"]
+
+    assert {len(column) for column in scores.values()} == {len(TITLES)}
+    # 黑名单标题各项均为 0
+    assert scores["total"][TITLES.index("明星直播带货翻车")] == 0
+
+
+@pytest.mark.parametrize("min_score", [0, 18, 25])
+def test_filter_news_list_matches_legacy(min_score):
+    scorer = NewsScorer({"min_score": min_score})
+    news_list = make_news_list()
+
+    expected = legacy_filter_news_list(scorer, news_list)
+    assert scorer.filter_news_list(news_list) == expected
+    for top_k in (0, 1, 3, len(news_list)):
+        assert scorer.filter_news_list(news_list, top_k=top_k) == expected[:top_k]
+    # 输入列表不被修改
+    assert news_list == make_news_list()
+
+
+def test_rejected_titles_keep_reason_when_min_score_is_zero():
+    scorer = NewsScorer({"min_score": 0})
+    result = scorer.filter_news_list(make_news_list())
+    rejected = [news for news in result if news["score"] == 0]
+    assert [news["title"] for news in rejected] == ["明星直播带货翻车", "股票基金投资理财需谨慎"]
+    assert rejected[0]["score_details"]["拒绝原因"] == "包含禁用词: 明星"
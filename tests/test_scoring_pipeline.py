@@ -0,0 +1,51 @@
+"""新闻评分每次运行只计算一次，实时报告与汇总报告共用"""
+
+import main
+
+
+RESULTS = {"weibo": {"房租又涨了": {"ranks": [1], "url": "", "mobileUrl": ""}}}
+DAY_RESULTS = {
+    "weibo": {
+        "房租又涨了": {"ranks": [1], "url": "", "mobileUrl": ""},
+        "工资拖欠问题引关注": {"ranks": [2], "url": "", "mobileUrl": ""},
+    }
+}
+
+
+def test_scores_are_computed_once_per_run(monkeypatch):
+    monkeypatch.setitem(main.CONFIG, "ENABLE_SCORING", True)
+    monkeypatch.setitem(main.CONFIG, "DEDUP_TITLES", False)
+    monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+    analyzer = main.NewsAnalyzer()
+
+    scored = []
+    pipeline_scores = []
+
+    def score_news_titles(results):
+        scored.append(results)
+        return {"房租又涨了": 25, "工资拖欠问题引关注": 10}
+
+    def count_word_frequency(*args, title_scores=None, **kwargs):
+        pipeline_scores.append(title_scores)
+        return [], 0
+
+    def execute_mode_strategy(mode_strategy, results, id_to_name, failed_ids):
+        # 实时报告 + 汇总报告各走一次流水线
+        for data_source in (results, DAY_RESULTS):
+            analyzer._run_analysis_pipeline(data_source, "current", {}, {}, [], [], {})
+
+    analysis_data = (DAY_RESULTS, {}, {}, {}, [], [], main.SnapshotIndex())
+    monkeypatch.setattr(main, "score_news_titles", score_news_titles)
+    monkeypatch.setattr(main, "count_word_frequency", count_word_frequency)
+    monkeypatch.setattr(main, "generate_html_report", lambda *args, **kwargs: "report.html")
+    monkeypatch.setattr(analyzer, "_initialize_and_check_config", lambda: None)
+    monkeypatch.setattr(analyzer, "_crawl_data", lambda: (RESULTS, {}, []))
+    monkeypatch.setattr(analyzer, "_load_analysis_data", lambda: analysis_data)
+    monkeypatch.setattr(analyzer, "_execute_mode_strategy", execute_mode_strategy)
+    analyzer.run()
+
+    # 评分覆盖当天全部标题，两次流水线使用同一份结果
+    assert scored == [DAY_RESULTS]
+    assert len(pipeline_scores) == 2
+    assert pipeline_scores[0] is pipeline_scores[1]
+    assert pipeline_scores[0] == {"房租又涨了": 25, "工资拖欠问题引关注": 10}
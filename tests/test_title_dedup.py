@@ -0,0 +1,94 @@
+from unittest import mock
+
+import main
+
+
+WORD_GROUPS = [{"required": [], "normal": ["房租"], "group_key": "房租"}]
+ID_TO_NAME = {"weibo": "微博", "baidu": "百度"}
+
+
+def make_results():
+    return {
+        "weibo": {"房租又涨了！": {"ranks": [1], "url": "w", "mobileUrl": ""}},
+        "baidu": {"房租又涨了": {"ranks": [4], "url": "b", "mobileUrl": ""}},
+    }
+
+
+def make_title_info():
+    return {
+        "weibo": {
+            "房租又涨了！": {
+                "first_time": "09时00分",
+                "last_time": "10时00分",
+                "count": 2,
+                "ranks": [1, 2],
+                "url": "w",
+                "mobileUrl": "",
+            }
+        },
+        "baidu": {
+            "房租又涨了": {
+                "first_time": "08时30分",
+                "last_time": "11时00分",
+                "count": 3,
+                "ranks": [4, 5, 6],
+                "url": "b",
+                "mobileUrl": "",
+            }
+        },
+    }
+
+
+def count(results, title_info=None, **kwargs):
+    with mock.patch.object(main, "is_first_crawl_today", return_value=False):
+        stats, _ = main.count_word_frequency(
+            results,
+            WORD_GROUPS,
+            [],
+            ID_TO_NAME,
+            title_info or make_title_info(),
+            mode="daily",
+            **kwargs,
+        )
+    return stats[0]["titles"]
+
+
+def test_cluster_members_are_merged_into_one_entry():
+    results = make_results()
+    dedup_index = main.build_title_dedup_index(results)
+    assert len(dedup_index) == 1
+
+    title_info = make_title_info()
+    titles = count(
+        results,
+        title_info,
+        dedup_index=dedup_index,
+        new_titles={"baidu": {"房租又涨了": {}}},
+    )
+    assert len(titles) == 1
+    entry = titles[0]
+    assert entry["title"] == "房租又涨了！"
+    assert entry["source_name"] == "微博 / 百度"
+    assert entry["url"] == "w"
+    assert entry["ranks"] == [1, 2, 4, 5, 6]
+    assert entry["count"] == 5
+    assert entry["time_display"] == "[08时30分 ~ 11时00分]"
+    assert entry["is_new"] is True
+    # 合并不修改历史统计中的排名列表
+    assert title_info["weibo"]["房租又涨了！"]["ranks"] == [1, 2]
+
+
+def test_without_index_titles_stay_per_platform():
+    titles = count(make_results())
+    assert sorted(entry["source_name"] for entry in titles) == ["微博", "百度"]
+
+
+def test_new_title_section_shows_each_cluster_once():
+    results = make_results()
+    dedup_index = main.build_title_dedup_index(results)
+    with mock.patch.object(main, "load_frequency_words", return_value=(WORD_GROUPS, [])):
+        report_data = main.prepare_report_data(
+            [], [], results, ID_TO_NAME, "daily", dedup_index=dedup_index
+        )
+    assert [source["source_id"] for source in report_data["new_titles"]] == ["weibo"]
+    assert report_data["total_new_count"] == 1
@@ -0,0 +1,99 @@
+"""Token 用量统计与预算：单次运行 / 每日预算、跨运行累计、预算用完后的降级"""
+
+import json
+
+import pytest
+
+from ai_scorer import AINewsScorer, UsageTracker
+
+
+def usage(prompt, completion):
+    return {"prompt_tokens": prompt, "completion_tokens": completion}
+
+
+def test_run_budget(capsys):
+    tracker = UsageTracker(max_tokens_per_run=1000)
+    tracker.record(usage(600, 300), 0.1)
+    assert not tracker.exhausted()
+
+    tracker.record(usage(80, 20), 0.1)
+    assert tracker.exhausted()
+    assert tracker.exhausted()
+    # 用完提示只打印一次
+    assert capsys.readouterr().out.count("单次运行预算") == 1
+
+
+def test_unlimited_by_default():
+    tracker = UsageTracker()
+    tracker.record(usage(10 ** 9, 10 ** 9), 0.1)
+    assert not tracker.exhausted()
+
+
+def test_day_budget_includes_earlier_runs(tmp_path):
+    usage_file = tmp_path / "usage.json"
+
+    first = UsageTracker(max_tokens_per_day=1500, usage_file=str(usage_file))
+    first.record(usage(700, 300), 0.1)
+    first.save()
+    # 重复保存不会重复累计
+    first.save()
+    assert json.loads(usage_file.read_text(encoding="utf-8"))[first.today] == {
+        "prompt_tokens": 700, "completion_tokens": 300, "calls": 1
+    }
+
+    second = UsageTracker(max_tokens_per_day=1500, usage_file=str(usage_file))
+    assert not second.exhausted()
+    second.record(usage(400, 100), 0.1)
+    assert second.exhausted()
+    second.save()
+    assert json.loads(usage_file.read_text(encoding="utf-8"))[second.today] == {
+        "prompt_tokens": 1100, "completion_tokens": 400, "calls": 2
+    }
+
+
+def test_history_keeps_last_30_days(tmp_path):
+    usage_file = tmp_path / "usage.json"
+    history = {f"2000-01-{day:02d}": usage(1, 1) for day in range(1, 32)}
+    usage_file.write_text(json.dumps(history), encoding="utf-8")
+
+    tracker = UsageTracker(usage_file=str(usage_file))
+    tracker.record(usage(1, 1), 0.1)
+    tracker.save()
+
+    saved = json.loads(usage_file.read_text(encoding="utf-8"))
+    assert len(saved) == 30
+    assert tracker.today in saved
+    assert "2000-01-01" not in saved
+
+
+def test_percentile_and_cost():
+    tracker = UsageTracker(prompt_price=0.15, completion_price=0.60)
+    for latency in range(1, 101):
+        tracker.record(usage(1000, 1000), latency / 100)
+    assert tracker.percentile(50) == 0.5
+    assert tracker.percentile(90) == 0.9
+    assert tracker.percentile(100) == 1.0
+    assert tracker.cost(tracker.prompt_tokens, tracker.completion_tokens) == pytest.approx(0.075)
+
+
+TITLES = ["房租又涨了", "央行宣布降准", "明星官宣恋情", "工资拖欠问题引关注", "失业保险金标准上调"]
+
+
+@pytest.mark.parametrize("options", [{}, {"concurrency": 1, "batch_size": 2}])
+def test_scorer_stops_at_budget(mock_post, options):
+    unlimited = AINewsScorer("key", base_url="http://mock").batch_score_news(
+        TITLES, delay=0, **options
+    )
+    assert len(unlimited) == len(TITLES)
+
+    mock_post.calls = 0
+    tracker = UsageTracker(max_tokens_per_run=1)
+    scorer = AINewsScorer("key", base_url="http://mock", usage=tracker)
+    results = scorer.batch_score_news(TITLES, delay=0, **options)
+
+    # 第一次请求即用完预算，之后的标题不再调用 API
+    assert mock_post.calls == 1
+    assert results == unlimited[: len(results)]
+    assert scorer.skipped_titles == TITLES[len(results):]
+    assert scorer.failed_titles == scorer.skipped_titles
+    assert tracker.titles == len(results)